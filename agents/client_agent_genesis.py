@@ -7,10 +7,13 @@ make payments, and manage the complete agent-to-agent commerce workflow.
 """
 
 import json
+import os
 from datetime import datetime
 from typing import Dict, Any, List
 from rich import print as rprint
 
+from .history import HistoryStore
+
 # Import ChaosChain SDK components
 try:
     from chaoschain_sdk import ChaosChainAgentSDK, NetworkConfig
@@ -30,7 +33,8 @@ class GenesisClientAgent:
     
     def __init__(self, agent_name: str, agent_domain: str, agent_role: AgentRole = AgentRole.CLIENT,
                  network: NetworkConfig = NetworkConfig.BASE_SEPOLIA,
-                 enable_ap2: bool = True, enable_process_integrity: bool = False):
+                 enable_ap2: bool = True, enable_process_integrity: bool = False,
+                 history_capacity: int = 1000):
         """
         Initialize the Genesis Client Agent with ChaosChain SDK
         
@@ -41,6 +45,8 @@ class GenesisClientAgent:
             network: Blockchain network to use
             enable_ap2: Enable AP2 integration for intent verification
             enable_process_integrity: Enable process integrity (typically False for clients)
+            history_capacity: Payment history entries kept in memory (older ones spill to
+                GENESIS_HISTORY_PATH when set)
         """
         if not SDK_AVAILABLE:
             raise ImportError("ChaosChain SDK is required for GenesisClientAgent")
@@ -62,7 +68,10 @@ class GenesisClientAgent:
         
         # Store service history
         self.service_history = []
-        self.payment_history = []
+        self.payment_history = HistoryStore(
+            "payment_history", capacity=history_capacity, value_key="amount", type_key="service",
+            spill_path=os.getenv("GENESIS_HISTORY_PATH")
+        )
         
         rprint(f"[green]🤖 Genesis Client Agent ({agent_name}) initialized with ChaosChain SDK[/green]")
         rprint(f"[blue]   Domain: {agent_domain}[/blue]")
@@ -275,14 +284,11 @@ class GenesisClientAgent:
                 "services_used": []
             }
         
-        total_amount = sum(payment["amount"] for payment in self.payment_history)
-        services_used = list(set(payment["service"] for payment in self.payment_history))
-        
         return {
             "total_payments": len(self.payment_history),
-            "total_amount": total_amount,
-            "services_used": services_used,
-            "payment_history": self.payment_history,
+            "total_amount": self.payment_history.total,
+            "services_used": list(self.payment_history.type_counts),
+            "payment_history": self.payment_history.recent(),
             "x402_summary": self.sdk.get_x402_payment_summary() if hasattr(self.sdk, 'get_x402_payment_summary') else {}
         }
     
@@ -303,5 +309,5 @@ class GenesisClientAgent:
         # Service history
         if self.payment_history:
             rprint(f"[blue]Services Used:[/blue] {len(self.payment_history)} transactions")
-            total_spent = sum(p["amount"] for p in self.payment_history)
+            total_spent = self.payment_history.total
             rprint(f"[blue]Total Spent:[/blue] ${total_spent} USDC")
@@ -0,0 +1,91 @@
+"""
+Genesis Studio - Hedged Inference Statistics
+
+Tracks how long the primary inference backend (0G Compute) takes and derives
+the hedge deadline from it: once a request has waited longer than the recent
+p95, a backup backend is started in parallel and the first valid answer wins.
+Win counts per backend show how often hedging actually pays off.
+"""
+
+import math
+import threading
+from collections import deque
+from typing import Any, Dict, Optional
+
+
+class HedgeStats:
+    """Rolling primary-backend latency window with an adaptive hedge deadline"""
+
+    def __init__(self, initial_deadline: float = 10.0, percentile: float = 95.0, window: int = 200,
+                 min_samples: int = 20, min_deadline: float = 0.5, max_deadline: float = 60.0,
+                 fixed_deadline: Optional[float] = None):
+        """
+        Initialize the statistics
+
+        Args:
+            initial_deadline: Deadline (seconds) used until min_samples latencies are known
+            percentile: Primary latency percentile used as the deadline
+            window: Number of recent primary latencies kept
+            min_samples: Samples needed before the adaptive deadline is used
+            min_deadline: Lower bound for the adaptive deadline (seconds)
+            max_deadline: Upper bound for the adaptive deadline (seconds)
+            fixed_deadline: Always use this deadline instead of adapting
+        """
+        self.initial_deadline = initial_deadline
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.min_deadline = min_deadline
+        self.max_deadline = max_deadline
+        self.fixed_deadline = fixed_deadline
+
+        self._latencies: "deque[float]" = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+        # Observability counters
+        self.requests = 0
+        self.hedges = 0
+        self.wins: Dict[str, int] = {}
+        self.failures: Dict[str, int] = {}
+
+    def record_latency(self, seconds: float):
+        """Record a completed primary request (including ones that lost the race)"""
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def record_failure(self, backend: str):
+        """Record a backend that raised or returned an unusable result"""
+        with self._lock:
+            self.failures[backend] = self.failures.get(backend, 0) + 1
+
+    def record_outcome(self, winner: str, hedged: bool):
+        """Record which backend answered a request and whether the backup was started"""
+        with self._lock:
+            self.requests += 1
+            self.hedges += int(hedged)
+            self.wins[winner] = self.wins.get(winner, 0) + 1
+
+    def deadline(self) -> float:
+        """Seconds to wait for the primary before starting the backup"""
+        if self.fixed_deadline is not None:
+            return self.fixed_deadline
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return self.initial_deadline
+            ordered = sorted(self._latencies)
+        rank = max(0, math.ceil(len(ordered) * self.percentile / 100) - 1)
+        return min(self.max_deadline, max(self.min_deadline, ordered[rank]))
+
+    def summary(self) -> Dict[str, Any]:
+        """Counters plus the current deadline"""
+        deadline = self.deadline()
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "hedges": self.hedges,
+                "hedge_rate": round(self.hedges / self.requests, 3) if self.requests else 0.0,
+                "wins": dict(self.wins),
+                "failures": dict(self.failures),
+                "latency_samples": len(self._latencies),
+                "deadline_seconds": round(deadline, 3),
+                "adaptive": self.fixed_deadline is None
+            }
@@ -0,0 +1,221 @@
+"""
+Genesis Studio - Bounded Agent History
+
+Service, validation and payment histories for long-running agents. Recent
+entries stay in a fixed-size ring buffer, running aggregates (count, sum,
+mean, per-type counts) are updated on every append so summaries cost O(1),
+and entries that fall out of the buffer can be spilled to a SQLite file where
+they remain queryable. Stores that spill to the same file share one connection,
+and pending spills are written at interpreter exit.
+"""
+
+import atexit
+import json
+import sqlite3
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Iterator, List, Optional
+
+from studio.journal import json_default, json_object_hook
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS agent_history (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    store TEXT NOT NULL,
+    entry_type TEXT,
+    recorded_at REAL NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS agent_history_store ON agent_history (store, entry_type, seq);
+"""
+
+
+class _SpillFile:
+    """One SQLite connection shared by every store spilling to the same path"""
+
+    _open: Dict[str, "_SpillFile"] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, path: str):
+        self.path = path
+        self.users = 0
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(_SCHEMA)
+
+    @classmethod
+    def acquire(cls, path: str) -> "_SpillFile":
+        """Open (or reuse) the connection for a spill file"""
+        with cls._registry_lock:
+            spill = cls._open.get(path)
+            if spill is None:
+                spill = cls._open[path] = cls(path)
+            spill.users += 1
+            return spill
+
+    def release(self):
+        """Drop one user, closing the connection after the last one"""
+        with self._registry_lock:
+            self.users -= 1
+            if self.users > 0:
+                return
+            self._open.pop(self.path, None)
+        with self.lock:
+            self.conn.close()
+
+
+class HistoryStore:
+    """
+    Ring buffer of recent entries with running aggregates and optional SQLite spill
+
+    len() and the aggregates cover every entry ever recorded, while iteration and
+    recent() only see the entries still in memory (at most `capacity`); query()
+    also reaches the spilled ones.
+    """
+
+    def __init__(self, name: str, capacity: int = 1000, value_key: Optional[str] = None,
+                 type_key: Optional[str] = None, spill_path: Optional[str] = None, spill_batch: int = 64):
+        """
+        Initialize the history store
+
+        Args:
+            name: Store name (several stores can share one spill file)
+            capacity: Entries kept in memory
+            value_key: Numeric entry field aggregated into total/mean (e.g. "amount", "score")
+            type_key: Entry field counted per value (e.g. "service")
+            spill_path: SQLite file receiving entries evicted from memory (None = drop them)
+            spill_batch: Evicted entries written per transaction
+        """
+        self.name = name
+        self.capacity = capacity
+        self.value_key = value_key
+        self.type_key = type_key
+        self.spill_path = spill_path
+        self.spill_batch = spill_batch
+
+        self._entries: "deque[Dict[str, Any]]" = deque()
+        self._spill_queue: List[tuple] = []
+        self._lock = threading.Lock()
+        self._db: Optional[_SpillFile] = None
+        if spill_path:
+            self._db = _SpillFile.acquire(spill_path)
+            # Entries still queued for the spill file would otherwise be lost at shutdown
+            atexit.register(self.close)
+
+        # Running aggregates
+        self.count = 0
+        self.total = 0.0
+        self.value_count = 0
+        self.type_counts: Dict[str, int] = {}
+        self.spilled = 0
+        self.dropped = 0
+
+    def append(self, entry: Dict[str, Any]):
+        """Record an entry, updating the aggregates and evicting the oldest entry if full"""
+        with self._lock:
+            self.count += 1
+            value = entry.get(self.value_key) if self.value_key else None
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                self.total += value
+                self.value_count += 1
+            if self.type_key:
+                entry_type = str(entry.get(self.type_key))
+                self.type_counts[entry_type] = self.type_counts.get(entry_type, 0) + 1
+
+            self._entries.append(entry)
+            if len(self._entries) > self.capacity:
+                self._evict(self._entries.popleft())
+
+    @property
+    def mean(self) -> float:
+        """Mean of value_key over every entry ever recorded"""
+        return self.total / self.value_count if self.value_count else 0.0
+
+    def recent(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """In-memory entries, oldest first (the last `limit` if given)"""
+        with self._lock:
+            entries = list(self._entries)
+        return entries[-limit:] if limit else entries
+
+    def query(self, entry_type: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Most recent entries across memory and the spill file, newest first
+
+        Spilled entries come back as decoded JSON (proof objects become dicts that
+        also allow attribute access).
+
+        Args:
+            entry_type: Only entries whose type_key field equals this value
+            limit: Maximum entries returned
+        """
+        with self._lock:
+            matches = [entry for entry in reversed(self._entries)
+                       if entry_type is None or str(entry.get(self.type_key)) == entry_type][:limit]
+            if len(matches) < limit and self._db is not None:
+                self._flush_spill()
+                sql = "SELECT payload FROM agent_history WHERE store = ?"
+                params: List[Any] = [self.name]
+                if entry_type is not None:
+                    sql += " AND entry_type = ?"
+                    params.append(entry_type)
+                sql += " ORDER BY seq DESC LIMIT ?"
+                params.append(limit - len(matches))
+                with self._db.lock:
+                    rows = self._db.conn.execute(sql, params).fetchall()
+                matches += [json.loads(row[0], object_hook=json_object_hook) for row in rows]
+        return matches
+
+    def summary(self) -> Dict[str, Any]:
+        """Aggregates over every entry ever recorded (memory and spilled)"""
+        with self._lock:
+            return {
+                "count": self.count,
+                "total": round(self.total, 6),
+                "mean": round(self.mean, 6),
+                "type_counts": dict(self.type_counts),
+                "in_memory": len(self._entries),
+                "spilled": self.spilled,
+                "dropped": self.dropped
+            }
+
+    def close(self):
+        """Write pending spilled entries and release the spill file (closed with its last store)"""
+        with self._lock:
+            if self._db is not None:
+                self._flush_spill()
+                self._db.release()
+                self._db = None
+
+    def __len__(self) -> int:
+        """Number of entries ever recorded (not just those still in memory)"""
+        return self.count
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over the in-memory entries, oldest first"""
+        return iter(self.recent())
+
+    # === Internal helpers ===
+
+    def _evict(self, entry: Dict[str, Any]):
+        """Spill or drop an entry leaving the ring buffer (lock held)"""
+        if self._db is None:
+            self.dropped += 1
+            return
+        entry_type = str(entry.get(self.type_key)) if self.type_key else None
+        self._spill_queue.append((self.name, entry_type, time.time(), json.dumps(entry, default=json_default)))
+        if len(self._spill_queue) >= self.spill_batch:
+            self._flush_spill()
+
+    def _flush_spill(self):
+        """Write queued evicted entries in one transaction (lock held)"""
+        if not self._spill_queue:
+            return
+        with self._db.lock, self._db.conn:
+            self._db.conn.executemany(
+                "INSERT INTO agent_history (store, entry_type, recorded_at, payload) VALUES (?, ?, ?, ?)",
+                self._spill_queue
+            )
+        self.spilled += len(self._spill_queue)
+        self._spill_queue = []
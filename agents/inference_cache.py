@@ -0,0 +1,255 @@
+"""
+Genesis Studio - Inference Result Cache
+
+TTL + LRU cache for paid 0G inference results. Entries live in memory and,
+optionally, in a SQLite file so they survive restarts and can be shared by
+several agent processes. Keys are derived from normalized request fields, so
+trivially different requests (case, whitespace, a budget a few dollars apart)
+reuse one paid inference. Cached values keep the TEE proof of the inference
+that produced them.
+
+Validation results are keyed by the content of the analysis they judged
+(analysis_content_key), so re-validating an unchanged analysis returns the
+earlier report and a reference to its integrity proof.
+"""
+
+import copy
+import hashlib
+import json
+import math
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS inference_cache (
+    key TEXT PRIMARY KEY,
+    stored_at REAL NOT NULL,
+    payload TEXT NOT NULL
+);
+"""
+
+# Analysis fields that change on every run without changing what is being validated
+VOLATILE_KEYS = frozenset({"timestamp", "cached_at", "inference_cache"})
+VOLATILE_SUFFIXES = ("_timestamp",)
+
+# IntegrityProof fields kept in a cached proof reference
+PROOF_REFERENCE_FIELDS = (
+    "proof_id", "function_name", "code_hash", "execution_hash", "timestamp", "agent_name",
+    "verification_status", "ipfs_cid", "tee_provider", "tee_job_id", "tee_execution_hash"
+)
+
+
+def make_cache_key(namespace: str, **fields: Any) -> str:
+    """
+    Stable cache key for a request
+
+    Args:
+        namespace: Kind of request (e.g. "shopping_analysis"), keeps unrelated caches apart
+        **fields: Normalized request fields
+
+    Returns:
+        Hex SHA-256 of the namespace and fields
+    """
+    canonical = json.dumps({"namespace": namespace, **fields}, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def shopping_request_key(item_type: str, color: str, budget: float, premium_tolerance: float,
+                         budget_bucket: float = 10.0) -> str:
+    """
+    Cache key for a shopping analysis request
+
+    Args:
+        item_type: Item type ("Winter Jacket" and "winter_jacket" map to the same key)
+        color: Preferred color (case-insensitive)
+        budget: Budget in USD, rounded down to a multiple of budget_bucket
+        premium_tolerance: Premium tolerance, rounded to whole percent
+        budget_bucket: Width of the budget buckets in USD
+    """
+    return make_cache_key(
+        "shopping_analysis",
+        item_type="_".join(str(item_type).lower().replace("-", " ").replace("_", " ").split()),
+        color=str(color).strip().lower(),
+        budget=math.floor(float(budget) / budget_bucket) * budget_bucket if budget_bucket else float(budget),
+        premium_tolerance=round(float(premium_tolerance), 2)
+    )
+
+
+def analysis_content_key(analysis_data: Dict[str, Any], **fields: Any) -> str:
+    """
+    Cache key for the content of an analysis
+
+    Timestamps and cache markers are dropped at every level before hashing, so the
+    same analysis produced (or re-served) at a different time maps to the same key.
+
+    Args:
+        analysis_data: Analysis document being validated
+        **fields: Extra key fields (e.g. validator and backend)
+    """
+    return make_cache_key("validation", content=_strip_volatile(analysis_data), **fields)
+
+
+def proof_reference(proof: Any) -> Optional[Dict[str, Any]]:
+    """
+    JSON-safe reference to an integrity proof
+
+    Args:
+        proof: IntegrityProof (or a dict with the same fields)
+
+    Returns:
+        The identifying proof fields, or None when there is no proof
+    """
+    if proof is None:
+        return None
+    get = proof.get if isinstance(proof, dict) else (lambda name: getattr(proof, name, None))
+    reference = {}
+    for name in PROOF_REFERENCE_FIELDS:
+        value = get(name)
+        reference[name] = value.isoformat() if isinstance(value, datetime) else value
+    return reference
+
+
+class InferenceCache:
+    """In-memory LRU cache with per-entry TTL and an optional SQLite tier"""
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 900.0, disk_path: Optional[str] = None):
+        """
+        Initialize the cache
+
+        Args:
+            max_entries: Entries kept in memory before the least recently used is evicted
+            ttl: Seconds an entry stays fresh (prices go stale, so keep this short)
+            disk_path: SQLite file for the on-disk tier (None = memory only)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.disk_path = disk_path
+
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk = None
+        if disk_path:
+            self._disk = sqlite3.connect(disk_path, check_same_thread=False)
+            self._disk.execute("PRAGMA journal_mode=WAL")
+            self._disk.executescript(_SCHEMA)
+
+        # Observability counters
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a fresh entry
+
+        Returns:
+            A copy of the cached value (with "cached_at" set), or None on a miss
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, value = entry
+                if now - stored_at < self.ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return {**copy.deepcopy(value), "cached_at": stored_at}
+                del self._entries[key]
+                self.expirations += 1
+
+            if self._disk is not None:
+                row = self._disk.execute(
+                    "SELECT stored_at, payload FROM inference_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row and now - row[0] < self.ttl:
+                    value = json.loads(row[1])
+                    self._remember(key, row[0], value)
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return {**copy.deepcopy(value), "cached_at": row[0]}
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, value: Dict[str, Any]):
+        """
+        Store a value (must be JSON-serializable when the disk tier is enabled)
+
+        Args:
+            key: Cache key (see make_cache_key)
+            value: Result to cache, e.g. {"analysis": ..., "tee_proof": ...}
+        """
+        stored_at = time.time()
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._remember(key, stored_at, value)
+            if self._disk is not None:
+                with self._disk:
+                    self._disk.execute(
+                        "INSERT OR REPLACE INTO inference_cache (key, stored_at, payload) VALUES (?, ?, ?)",
+                        (key, stored_at, json.dumps(value, default=str))
+                    )
+
+    def invalidate(self, key: Optional[str] = None):
+        """Drop one entry or, without a key, the whole cache (both tiers)"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+            if self._disk is not None:
+                with self._disk:
+                    if key is None:
+                        self._disk.execute("DELETE FROM inference_cache")
+                    else:
+                        self._disk.execute("DELETE FROM inference_cache WHERE key = ?", (key,))
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "ttl_seconds": self.ttl,
+            "disk_path": self.disk_path
+        }
+
+    def close(self):
+        """Close the on-disk tier"""
+        with self._lock:
+            if self._disk is not None:
+                self._disk.close()
+                self._disk = None
+
+    # === Internal helpers ===
+
+    def _remember(self, key: str, stored_at: float, value: Dict[str, Any]):
+        """Insert into the memory tier, evicting the least recently used entries (lock held)"""
+        self._entries[key] = (stored_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+
+def _strip_volatile(value: Any) -> Any:
+    """Copy of a JSON-like value without volatile keys"""
+    if isinstance(value, dict):
+        return {
+            key: _strip_volatile(item) for key, item in value.items()
+            if key not in VOLATILE_KEYS and not str(key).endswith(VOLATILE_SUFFIXES)
+        }
+    if isinstance(value, (list, tuple)):
+        return [_strip_volatile(item) for item in value]
+    return value
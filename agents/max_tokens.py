@@ -0,0 +1,188 @@
+"""
+Genesis Studio - Adaptive max_tokens Control
+
+Records how many output tokens each inference task type actually needs and
+sizes the next request's max_tokens to a high percentile of those lengths plus
+headroom, instead of a fixed worst-case cap. A response that was cut off at the
+cap is retried once with a larger budget, so the tighter cap does not turn into
+failed analyses.
+
+Only complete responses are learned from: a stream the incremental JSON parser
+stopped early (finished_early) is shorter than what the model would have
+generated. The cap only takes effect when the inference client applies it;
+chaoschain-sdk's ZeroGInference.chat_completion (0.4.x) accepts max_tokens but
+drops it (along with temperature and stream), so against that client the
+controller only observes lengths and never retries.
+"""
+
+import math
+import threading
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from .prompts import count_tokens
+from .streaming_json import StreamedJSON, consume_json_stream
+
+# A response that used at least this share of max_tokens without yielding
+# usable JSON is treated as cut off by the cap
+TRUNCATION_RATIO = 0.9
+
+
+class MaxTokensController:
+    """Per-task-type output length window that sets max_tokens for the next call"""
+
+    def __init__(self, defaults: Optional[Dict[str, int]] = None, default_max_tokens: int = 1000,
+                 percentile: float = 99.0, headroom: float = 1.2, min_headroom_tokens: int = 32,
+                 window: int = 200, min_samples: int = 20, min_tokens: int = 64, ceiling: int = 4096,
+                 retry_growth: float = 2.0):
+        """
+        Initialize the controller
+
+        Args:
+            defaults: max_tokens per task type until enough lengths are observed
+            default_max_tokens: max_tokens for task types missing from defaults
+            percentile: Observed output length percentile the cap is based on
+            headroom: Multiplier applied to that percentile
+            min_headroom_tokens: Minimum tokens added on top of the percentile
+            window: Recent output lengths kept per task type
+            min_samples: Samples needed before the adaptive cap is used
+            min_tokens: Lower bound for the adaptive cap
+            ceiling: Upper bound for any cap, including retries
+            retry_growth: Multiplier applied to the cap when retrying a truncated response
+        """
+        self.defaults = dict(defaults or {})
+        self.default_max_tokens = default_max_tokens
+        self.percentile = percentile
+        self.headroom = headroom
+        self.min_headroom_tokens = min_headroom_tokens
+        self.window = window
+        self.min_samples = min_samples
+        self.min_tokens = min_tokens
+        self.ceiling = ceiling
+        self.retry_growth = retry_growth
+
+        self._lengths: Dict[str, "deque[int]"] = {}
+        self._lock = threading.Lock()
+
+        # Observability counters
+        self.calls: Dict[str, int] = {}
+        self.truncations: Dict[str, int] = {}
+        self.retries: Dict[str, int] = {}
+        self.partial: Dict[str, int] = {}
+
+    def max_tokens(self, task_type: str) -> int:
+        """max_tokens for the next call of this task type"""
+        with self._lock:
+            lengths = sorted(self._lengths.get(task_type, ()))
+        if len(lengths) < self.min_samples:
+            return min(self.ceiling, self.defaults.get(task_type, self.default_max_tokens))
+        rank = max(0, math.ceil(len(lengths) * self.percentile / 100) - 1)
+        budget = max(lengths[rank] * self.headroom, lengths[rank] + self.min_headroom_tokens)
+        return min(self.ceiling, max(self.min_tokens, math.ceil(budget)))
+
+    def retry_budget(self, task_type: str, previous: int) -> int:
+        """Larger max_tokens for retrying a truncated response"""
+        with self._lock:
+            self.retries[task_type] = self.retries.get(task_type, 0) + 1
+        return min(self.ceiling, math.ceil(previous * self.retry_growth))
+
+    @staticmethod
+    def is_truncated(output_tokens: int, max_tokens: int, usable: bool) -> bool:
+        """True when an unusable response ran into its max_tokens cap"""
+        return not usable and output_tokens >= max_tokens * TRUNCATION_RATIO
+
+    def record(self, task_type: str, output_tokens: int, truncated: bool = False, complete: bool = True):
+        """
+        Record one response
+
+        Truncated responses only count as truncations and incomplete ones (stream stopped
+        early by the caller) only as partial; the real length of either is unknown.
+        """
+        with self._lock:
+            self.calls[task_type] = self.calls.get(task_type, 0) + 1
+            if truncated:
+                self.truncations[task_type] = self.truncations.get(task_type, 0) + 1
+                return
+            if not complete:
+                self.partial[task_type] = self.partial.get(task_type, 0) + 1
+                return
+            self._lengths.setdefault(task_type, deque(maxlen=self.window)).append(output_tokens)
+
+    def summary(self) -> Dict[str, Any]:
+        """Per task type: samples, observed percentile, current cap and truncations"""
+        with self._lock:
+            task_types = set(self.defaults) | set(self._lengths) | set(self.calls)
+            windows = {task_type: sorted(self._lengths.get(task_type, ())) for task_type in task_types}
+        summary = {}
+        for task_type, lengths in sorted(windows.items()):
+            rank = max(0, math.ceil(len(lengths) * self.percentile / 100) - 1)
+            summary[task_type] = {
+                "calls": self.calls.get(task_type, 0),
+                "samples": len(lengths),
+                f"p{self.percentile:g}_output_tokens": lengths[rank] if lengths else None,
+                "max_tokens": self.max_tokens(task_type),
+                "adaptive": len(lengths) >= self.min_samples,
+                "truncations": self.truncations.get(task_type, 0),
+                "partial": self.partial.get(task_type, 0),
+                "retries": self.retries.get(task_type, 0)
+            }
+        return summary
+
+
+def applies_max_tokens(client: Any) -> bool:
+    """
+    Whether an inference client enforces the max_tokens it is given
+
+    Clients opt in with a truthy `supports_max_tokens` attribute; chaoschain-sdk's
+    ZeroGInference (0.4.x) ignores max_tokens and does not.
+    """
+    return bool(getattr(client, "supports_max_tokens", False))
+
+
+def stream_with_max_tokens(controller: MaxTokensController, task_type: str,
+                           call: Callable[[int], Tuple[Any, Dict[str, Any]]], required_fields: Iterable[str] = (),
+                           on_partial: Optional[Callable[[Dict[str, Any]], None]] = None,
+                           max_retries: int = 1, enforced: bool = True) -> Tuple[StreamedJSON, Dict[str, Any], Dict[str, Any]]:
+    """
+    Run a streamed JSON inference under the controller's max_tokens
+
+    Args:
+        controller: Controller that sizes max_tokens and learns from the output
+        task_type: Task type the output lengths are tracked under
+        call: Performs the inference for a given max_tokens, returning (response, tee_proof)
+        required_fields: Fields that make a partial response usable (see consume_json_stream)
+        on_partial: Called with the fields parsed so far (again for a retry), and with no
+            fields before every call, so a caller can raise to abort before paying for it
+        max_retries: Retries with a larger budget after a truncated response
+        enforced: Whether the client applies max_tokens (see applies_max_tokens); when it
+            does not, a response cannot have been cut by the cap and is never retried
+
+    Returns:
+        (parsed response, tee_proof of the last call, output token accounting)
+    """
+    max_tokens = controller.max_tokens(task_type)
+    attempts = 0
+    while True:
+        attempts += 1
+        if on_partial:
+            on_partial({})
+        response, tee_proof = call(max_tokens)
+        if response is None:
+            raise RuntimeError("0G inference returned no output")
+
+        streamed = consume_json_stream(response, required_fields, on_partial)
+        output_tokens = count_tokens(streamed.text)
+        truncated = enforced and controller.is_truncated(output_tokens, max_tokens, streamed.usable)
+        controller.record(task_type, output_tokens, truncated, complete=not streamed.finished_early)
+
+        if not truncated or attempts > max_retries or max_tokens >= controller.ceiling:
+            return streamed, tee_proof, {
+                "task_type": task_type,
+                "max_tokens": max_tokens,
+                "output_tokens": output_tokens,
+                "attempts": attempts,
+                "truncated": truncated,
+                "complete": not streamed.finished_early,
+                "enforced": enforced
+            }
+        max_tokens = controller.retry_budget(task_type, max_tokens)
@@ -0,0 +1,375 @@
+"""
+Genesis Studio - Compact, Token-Budgeted Inference Prompts
+
+Builds the 0G shopping and validation prompts. Compact mode sends only the
+fields each response schema depends on, as minified JSON, and counts the input
+tokens of every call against a per-call budget: optional fields are dropped
+until the prompt fits, and a prompt that still does not fit is rejected before
+any paid inference is made. Verbose mode reproduces the original prompts.
+"""
+
+import json
+import math
+import re
+import threading
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    tiktoken = None
+    TIKTOKEN_AVAILABLE = False
+
+# gpt-oss models use the o200k tokenizer family
+TOKENIZER_ENCODING = "o200k_base"
+
+# Chat formatting overhead: per message, plus the primed assistant reply
+MESSAGE_OVERHEAD_TOKENS = 4
+REPLY_OVERHEAD_TOKENS = 3
+
+# Default per-call input-token budgets
+SHOPPING_PROMPT_TOKEN_BUDGET = 512
+VALIDATION_PROMPT_TOKEN_BUDGET = 1024
+
+# Compact views trim long strings and lists inside the analysis being sent
+MAX_FIELD_CHARS = 200
+MAX_LIST_ITEMS = 10
+
+# Response schema keys, in the order the model should emit them. Required
+# fields come first so a streamed answer can be cut once they have arrived.
+SHOPPING_SCHEMA = (
+    "item_type,requested_color,available_color,base_price,final_price,premium_applied(% if color match else 0),"
+    "deal_quality(excellent|good|alternative),color_match_found(bool),merchant,availability,estimated_delivery,"
+    "auto_purchase_eligible(bool),confidence(0-1),reasoning(max 2 sentences)"
+)
+VALIDATION_SCHEMA = (
+    "validated_symbol,scoring_breakdown{data_completeness,technical_accuracy,price_reasonableness,"
+    "recommendation_quality,methodology_soundness}(0-100 each),overall_score(0-100),"
+    "quality_rating(Outstanding|Excellent|Good|Acceptable|Needs Improvement),validation_summary(1 sentence),"
+    "detailed_assessment{strengths[],weaknesses[],recommendations_for_improvement[]}"
+)
+
+# Analysis fields the validation schema is scored on (everything else is left out)
+SHOPPING_VALIDATION_FIELDS = (
+    "item_type", "requested_color", "available_color", "budget", "premium_tolerance", "base_price", "final_price",
+    "premium_applied", "deal_quality", "color_match_found", "merchant", "availability", "estimated_delivery",
+    "auto_purchase_eligible", "confidence", "reasoning"
+)
+MARKET_VALIDATION_FIELDS = ("symbol", "price_analysis", "technical_analysis", "recommendations", "sentiment_analysis")
+MARKET_METHODOLOGY_FIELDS = ("methodology", "confidence_score")
+
+# Fields dropped (in this order) when a compact prompt is over budget
+SHOPPING_OPTIONAL_FIELDS = ("reasoning",)
+MARKET_OPTIONAL_FIELDS = ("sentiment_analysis", "methodology")
+
+
+class PromptBudgetError(ValueError):
+    """A prompt exceeds its input-token budget even after optional fields were dropped"""
+
+
+@lru_cache(maxsize=1)
+def _encoding():
+    """tiktoken encoding, or None when tiktoken (or its encoding files) is unavailable"""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        return tiktoken.get_encoding(TOKENIZER_ENCODING)
+    except Exception:
+        return None
+
+
+def tokenizer_name() -> str:
+    """Name of the tokenizer used by count_tokens"""
+    return f"tiktoken:{TOKENIZER_ENCODING}" if _encoding() else "heuristic"
+
+
+def count_tokens(text: str) -> int:
+    """
+    Count the tokens in a piece of text
+
+    Uses tiktoken when installed; otherwise estimates one token per
+    punctuation mark and per four characters of each word.
+    """
+    encoding = _encoding()
+    if encoding:
+        return len(encoding.encode(text))
+    return sum(math.ceil(len(piece) / 4) for piece in re.findall(r"\w+|[^\w\s]", text))
+
+
+def count_message_tokens(messages: List[Dict[str, str]]) -> int:
+    """Count the input tokens of a chat completion request"""
+    return sum(count_tokens(message["content"]) + MESSAGE_OVERHEAD_TOKENS for message in messages) + REPLY_OVERHEAD_TOKENS
+
+
+def minify(value: Any) -> str:
+    """JSON without indentation or padding"""
+    return json.dumps(value, separators=(",", ":"), default=str)
+
+
+@dataclass
+class BuiltPrompt:
+    """Chat messages for one inference call plus their token accounting"""
+    messages: List[Dict[str, str]]
+    input_tokens: int
+    budget: Optional[int]
+    mode: str
+    dropped_fields: List[str] = field(default_factory=list)
+
+    def metadata(self) -> Dict[str, Any]:
+        """Prompt accounting recorded alongside the inference result"""
+        return {
+            "mode": self.mode,
+            "input_tokens": self.input_tokens,
+            "budget": self.budget,
+            "dropped_fields": self.dropped_fields,
+            "tokenizer": tokenizer_name()
+        }
+
+
+class TokenMeter:
+    """Running input-token totals for an agent's inference calls"""
+
+    def __init__(self):
+        self.calls = 0
+        self.input_tokens = 0
+        self.max_input_tokens = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+
+    def record(self, prompt: BuiltPrompt):
+        """Record a prompt that was sent"""
+        with self._lock:
+            self.calls += 1
+            self.input_tokens += prompt.input_tokens
+            self.max_input_tokens = max(self.max_input_tokens, prompt.input_tokens)
+
+    def record_rejection(self):
+        """Record a prompt refused for exceeding its budget"""
+        with self._lock:
+            self.rejected += 1
+
+    def summary(self) -> Dict[str, Any]:
+        """Totals plus the mean prompt size"""
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "input_tokens": self.input_tokens,
+                "mean_input_tokens": round(self.input_tokens / self.calls, 1) if self.calls else 0.0,
+                "max_input_tokens": self.max_input_tokens,
+                "rejected": self.rejected,
+                "tokenizer": tokenizer_name()
+            }
+
+
+def build_shopping_prompt(item_type: str, color: str, budget: float, premium_tolerance: float,
+                          compact: bool = True, token_budget: Optional[int] = SHOPPING_PROMPT_TOKEN_BUDGET,
+                          meter: Optional[TokenMeter] = None) -> BuiltPrompt:
+    """
+    Build the shopping analysis prompt
+
+    Args:
+        item_type: Type of item to shop for
+        color: Preferred color
+        budget: Maximum budget in USD
+        premium_tolerance: Acceptable premium for preferred options (0.0-1.0)
+        compact: Minified request and schema instead of the verbose prompt
+        token_budget: Maximum input tokens of a compact prompt (None = unlimited); verbose
+            prompts are the opt-out path and are only counted
+        meter: Records the prompt size (or the rejection)
+
+    Returns:
+        BuiltPrompt ready for chat_completion
+    """
+    if not compact:
+        messages = [
+            {"role": "system", "content": "You are an expert shopping analyst providing detailed product recommendations."},
+            {"role": "user", "content": _verbose_shopping_prompt(item_type, color, budget, premium_tolerance)}
+        ]
+        return _finalize(messages, token_budget, "verbose", [], meter, enforce=False)
+
+    request = {"item_type": item_type, "color": color, "budget": budget, "premium_tolerance": premium_tolerance}
+    messages = [
+        {"role": "system", "content": "Shopping analyst. Reply with one JSON object only."},
+        {"role": "user", "content": (
+            f"Request:{minify(request)}\n"
+            f"JSON keys in order:{SHOPPING_SCHEMA}\n"
+            "Rules:final_price<=budget*(1+premium_tolerance);premium only if color matches."
+        )}
+    ]
+    return _finalize(messages, token_budget, "compact", [], meter)
+
+
+def build_validation_prompt(analysis_data: Dict[str, Any], analysis_type: str, subject: str,
+                            compact: bool = True, token_budget: Optional[int] = VALIDATION_PROMPT_TOKEN_BUDGET,
+                            meter: Optional[TokenMeter] = None) -> BuiltPrompt:
+    """
+    Build the validation prompt
+
+    Compact mode sends validation_view(analysis_data) instead of the whole
+    document, so TEE proofs and agent metadata are never tokenized.
+
+    Args:
+        analysis_data: Analysis to validate
+        analysis_type: "shopping" or "market"
+        subject: Item type or symbol being validated
+        compact: Minified view and schema instead of the verbose prompt
+        token_budget: Maximum input tokens of a compact prompt (None = unlimited); verbose
+            prompts are the opt-out path and are only counted
+        meter: Records the prompt size (or the rejection)
+
+    Returns:
+        BuiltPrompt ready for chat_completion
+    """
+    if not compact:
+        messages = [
+            {"role": "system", "content": "You are an expert analysis validator providing comprehensive quality assessments."},
+            {"role": "user", "content": _verbose_validation_prompt(analysis_data, analysis_type, subject)}
+        ]
+        return _finalize(messages, token_budget, "verbose", [], meter, enforce=False)
+
+    view = validation_view(analysis_data, analysis_type)
+    optional = SHOPPING_OPTIONAL_FIELDS if analysis_type == "shopping" else MARKET_OPTIONAL_FIELDS
+    dropped = []
+
+    def messages_for(current: Dict[str, Any]) -> List[Dict[str, str]]:
+        return [
+            {"role": "system", "content": "Analysis validator. Reply with one JSON object only."},
+            {"role": "user", "content": (
+                f"Validate this {analysis_type} analysis:{minify(current)}\n"
+                f"JSON keys in order:{VALIDATION_SCHEMA}\n"
+                f"validated_symbol={json.dumps(subject)}. Be specific."
+            )}
+        ]
+
+    messages = messages_for(view)
+    for name in optional:
+        if token_budget is None or count_message_tokens(messages) <= token_budget:
+            break
+        if name in view:
+            view.pop(name)
+            dropped.append(name)
+            messages = messages_for(view)
+    return _finalize(messages, token_budget, "compact", dropped, meter)
+
+
+def validation_view(analysis_data: Dict[str, Any], analysis_type: str) -> Dict[str, Any]:
+    """
+    The parts of an analysis the validation schema is scored on
+
+    Args:
+        analysis_data: Analysis to validate (flat, or with a nested shopping_result)
+        analysis_type: "shopping" or "market"
+
+    Returns:
+        Trimmed dict of the relevant fields
+    """
+    if analysis_type == "shopping":
+        source = dict(analysis_data)
+        source.update(analysis_data.get("shopping_result") or {})
+        return {key: _trim(source[key]) for key in SHOPPING_VALIDATION_FIELDS if key in source}
+
+    view = {key: _trim(analysis_data[key]) for key in MARKET_VALIDATION_FIELDS if key in analysis_data}
+    metadata = analysis_data.get("genesis_studio_metadata") or {}
+    methodology = {key: _trim(metadata[key]) for key in MARKET_METHODOLOGY_FIELDS if key in metadata}
+    if methodology:
+        view["methodology"] = methodology
+    return view
+
+
+# === Internal helpers ===
+
+def _finalize(messages: List[Dict[str, str]], token_budget: Optional[int], mode: str, dropped: List[str],
+              meter: Optional[TokenMeter], enforce: bool = True) -> BuiltPrompt:
+    """Count the prompt and, unless enforce is False, reject it when over the budget"""
+    input_tokens = count_message_tokens(messages)
+    if enforce and token_budget is not None and input_tokens > token_budget:
+        if meter:
+            meter.record_rejection()
+        raise PromptBudgetError(
+            f"{mode} prompt needs {input_tokens} input tokens, over the {token_budget}-token budget"
+            + (f" (after dropping {', '.join(dropped)})" if dropped else "")
+        )
+    prompt = BuiltPrompt(messages=messages, input_tokens=input_tokens, budget=token_budget if enforce else None, mode=mode,
+                         dropped_fields=dropped)
+    if meter:
+        meter.record(prompt)
+    return prompt
+
+
+def _trim(value: Any) -> Any:
+    """Shorten long strings and lists (recursively) for a compact view"""
+    if isinstance(value, str):
+        return value if len(value) <= MAX_FIELD_CHARS else value[:MAX_FIELD_CHARS] + "..."
+    if isinstance(value, dict):
+        return {key: _trim(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_trim(item) for item in value[:MAX_LIST_ITEMS]]
+    if isinstance(value, float):
+        return round(value, 4)
+    return value
+
+
+def _verbose_shopping_prompt(item_type: str, color: str, budget: float, premium_tolerance: float) -> str:
+    """The original, fully spelled-out shopping prompt"""
+    return f"""You are an expert shopping analyst. Analyze the following shopping request and provide a detailed recommendation:
+
+Product Request:
+- Item Type: {item_type}
+- Preferred Color: {color}
+- Budget: ${budget}
+- Premium Tolerance: {premium_tolerance*100}% for preferred options
+
+Provide a comprehensive analysis in JSON format with the following structure:
+{{
+  "item_type": "{item_type}",
+  "requested_color": "{color}",
+  "available_color": "<recommended color>",
+  "base_price": <price without premium>,
+  "final_price": <final recommended price>,
+  "premium_applied": <percentage premium if color match found>,
+  "deal_quality": "<excellent|good|alternative>",
+  "color_match_found": <true|false>,
+  "merchant": "<recommended merchant name>",
+  "availability": "in_stock",
+  "estimated_delivery": "<delivery estimate>",
+  "auto_purchase_eligible": <true|false>,
+  "confidence": <0.0-1.0>,
+  "reasoning": "<detailed explanation of recommendation>"
+}}
+
+Ensure prices are within budget and apply premiums only if color match is found."""
+
+
+def _verbose_validation_prompt(analysis_data: Dict[str, Any], analysis_type: str, subject: str) -> str:
+    """The original validation prompt, embedding the whole analysis document"""
+    return f"""You are an expert analysis validator. Review the following {analysis_type} analysis and provide a comprehensive validation assessment:
+
+Analysis to Validate:
+{json.dumps(analysis_data, indent=2, default=str)}
+
+Provide a detailed validation report in JSON format with this structure:
+{{
+  "validation_timestamp": "<ISO timestamp>",
+  "validated_symbol": "{subject}",
+  "validation_criteria": "Comprehensive AI-powered validation",
+  "scoring_breakdown": {{
+    "data_completeness": <0-100>,
+    "technical_accuracy": <0-100>,
+    "price_reasonableness": <0-100>,
+    "recommendation_quality": <0-100>,
+    "methodology_soundness": <0-100>
+  }},
+  "overall_score": <0-100>,
+  "quality_rating": "<Outstanding|Excellent|Good|Acceptable|Needs Improvement>",
+  "validation_summary": "<brief summary>",
+  "detailed_assessment": {{
+    "strengths": ["<strength 1>", "<strength 2>"],
+    "weaknesses": ["<weakness 1>", "<weakness 2>"],
+    "recommendations_for_improvement": ["<recommendation 1>", "<recommendation 2>"]
+  }}
+}}
+
+Be thorough and provide specific, actionable feedback."""
@@ -0,0 +1,238 @@
+"""
+Genesis Studio - Vectorized Shopping Simulator
+
+NumPy Monte Carlo engine behind GenesisShoppingAnalysisTool. One call simulates
+price discovery, color matching, premium application and auto-purchase
+eligibility for thousands of requests at once, with a seeded generator for
+reproducible load tests and what-if analysis. Results stay columnar (one array
+per field); the per-item analysis dict is only built when asked for.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, TypedDict, Union
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Market model shared with GenesisShoppingAnalysisTool.analyze
+COLOR_MATCH_PROBABILITY = 0.8  # CrewAI has better success rate
+MIN_PREMIUM = 0.05
+FALLBACK_COLORS = ["black", "navy", "gray", "brown"]
+MERCHANTS = [
+    "Premium Outdoor Gear Co.", "Elite Sports Equipment", "Professional Outfitters",
+    "Quality Gear Direct", "Adventure Equipment Pro"
+]
+DELIVERY_OPTIONS = ["1-2 business days", "2-3 business days", "3-5 business days"]
+
+ArrayLike = Union[float, str, Sequence, "np.ndarray"]
+
+
+class ShoppingAnalysis(TypedDict, total=False):
+    """Shopping analysis returned in-process by GenesisShoppingAnalysisTool.analyze (a plain dict at runtime)"""
+    item_type: str
+    requested_color: str
+    available_color: str
+    base_price: float
+    final_price: float
+    premium_applied: float
+    deal_quality: str
+    color_match_found: bool
+    merchant: str
+    availability: str
+    estimated_delivery: str
+    auto_purchase_eligible: bool
+    search_timestamp: str
+    shopping_agent: str
+    crewai_analysis: Dict[str, str]
+    crewai_metadata: Dict[str, Any]
+    confidence: float
+
+
+def deal_quality_for(final_price: float, budget: float, color_match_found: bool) -> str:
+    """Deal quality label: excellent or good for a color match (by price against budget), else alternative"""
+    if color_match_found:
+        return "excellent" if final_price < budget * 0.9 else "good"
+    return "alternative"
+
+
+def analysis_record(item_type: str, color: str, budget: float, premium_tolerance: float, base_price: float,
+                    final_price: float, color_match_found: bool, available_color: str, merchant: str,
+                    estimated_delivery: str, confidence: float, products_scanned: int, merchants_scanned: int,
+                    alternatives_found: int) -> ShoppingAnalysis:
+    """Build the shopping analysis dict returned by GenesisShoppingAnalysisTool.analyze"""
+    deal_quality = deal_quality_for(final_price, budget, color_match_found)
+
+    return {
+        "item_type": item_type,
+        "requested_color": color,
+        "available_color": available_color,
+        "base_price": round(base_price, 2),
+        "final_price": round(final_price, 2),
+        "premium_applied": round((final_price - base_price) / base_price * 100, 1) if color_match_found else 0,
+        "deal_quality": deal_quality,
+        "color_match_found": color_match_found,
+        "merchant": merchant,
+        "availability": "in_stock",
+        "estimated_delivery": estimated_delivery,
+        "auto_purchase_eligible": final_price <= (budget * (1 + premium_tolerance)),
+        "search_timestamp": datetime.now().isoformat(),
+        "shopping_agent": "Alice (CrewAI Smart Shopping)",
+        "crewai_analysis": {
+            "market_scan_results": f"Analyzed {products_scanned} products across {merchants_scanned} merchants",
+            "price_comparison": f"Found {alternatives_found} alternatives within budget",
+            "quality_assessment": "Premium quality verified through merchant reputation analysis",
+            "availability_check": "Real-time inventory confirmed",
+            "delivery_optimization": "Fastest available shipping option selected"
+        },
+        "crewai_metadata": {
+            "analysis_depth": "comprehensive",
+            "data_sources": ["merchant_apis", "price_comparison", "inventory_systems", "review_analysis"],
+            "confidence_factors": {
+                "price_accuracy": 0.95,
+                "availability_confidence": 0.92,
+                "quality_assessment": 0.88,
+                "delivery_estimate": 0.90
+            }
+        },
+        "confidence": confidence  # Higher confidence with CrewAI
+    }
+
+
+@dataclass
+class ShoppingSimulation:
+    """Columnar simulation results: one array per field, one row per request"""
+    item_type: "np.ndarray"
+    color: "np.ndarray"
+    budget: "np.ndarray"
+    premium_tolerance: "np.ndarray"
+    base_price: "np.ndarray"
+    final_price: "np.ndarray"
+    color_match_found: "np.ndarray"
+    available_color: "np.ndarray"
+    merchant: "np.ndarray"
+    estimated_delivery: "np.ndarray"
+    auto_purchase_eligible: "np.ndarray"
+    confidence: "np.ndarray"
+    products_scanned: "np.ndarray"
+    merchants_scanned: "np.ndarray"
+    alternatives_found: "np.ndarray"
+
+    def __len__(self) -> int:
+        return len(self.final_price)
+
+    @property
+    def premium_applied(self) -> "np.ndarray":
+        """Applied premium in percent (0 where no color match)"""
+        premium = np.round((self.final_price - self.base_price) / self.base_price * 100, 1)
+        return np.where(self.color_match_found, premium, 0.0)
+
+    @property
+    def deal_quality(self) -> "np.ndarray":
+        """"excellent" / "good" for color matches, "alternative" otherwise"""
+        matched = np.where(self.final_price < self.budget * 0.9, "excellent", "good")
+        return np.where(self.color_match_found, matched, "alternative")
+
+    def to_dict(self, index: int) -> ShoppingAnalysis:
+        """Materialize one row in the GenesisShoppingAnalysisTool analysis schema"""
+        return analysis_record(
+            item_type=str(self.item_type[index]),
+            color=str(self.color[index]),
+            budget=float(self.budget[index]),
+            premium_tolerance=float(self.premium_tolerance[index]),
+            base_price=float(self.base_price[index]),
+            final_price=float(self.final_price[index]),
+            color_match_found=bool(self.color_match_found[index]),
+            available_color=str(self.available_color[index]),
+            merchant=str(self.merchant[index]),
+            estimated_delivery=str(self.estimated_delivery[index]),
+            confidence=float(self.confidence[index]),
+            products_scanned=int(self.products_scanned[index]),
+            merchants_scanned=int(self.merchants_scanned[index]),
+            alternatives_found=int(self.alternatives_found[index])
+        )
+
+    def iter_dicts(self) -> Iterator[ShoppingAnalysis]:
+        """Materialize rows lazily, one analysis dict at a time"""
+        for index in range(len(self)):
+            yield self.to_dict(index)
+
+    def summary(self) -> Dict[str, Any]:
+        """Aggregate statistics over all simulated requests"""
+        return {
+            "requests": len(self),
+            "color_match_rate": round(float(self.color_match_found.mean()), 4),
+            "auto_purchase_rate": round(float(self.auto_purchase_eligible.mean()), 4),
+            "mean_final_price": round(float(self.final_price.mean()), 2),
+            "p50_final_price": round(float(np.percentile(self.final_price, 50)), 2),
+            "p95_final_price": round(float(np.percentile(self.final_price, 95)), 2),
+            "mean_budget_utilization": round(float((self.final_price / self.budget).mean()), 4),
+            "mean_confidence": round(float(self.confidence.mean()), 4)
+        }
+
+
+def simulate_shopping(item_type: ArrayLike, color: ArrayLike, budget: ArrayLike, premium_tolerance: ArrayLike = 0.20,
+                      n: Optional[int] = None, seed: Optional[int] = None,
+                      rng: Optional["np.random.Generator"] = None) -> ShoppingSimulation:
+    """
+    Simulate many shopping analyses in one vectorized call
+
+    Inputs may be scalars (shared by every row) or length-n sequences, so one
+    call can cover a single scenario many times or a whole workload of requests.
+
+    Args:
+        item_type: Item type(s)
+        color: Preferred color(s)
+        budget: Budget(s) in USD
+        premium_tolerance: Acceptable premium(s) for a color match (0.0-1.0)
+        n: Number of rows (defaults to the length of the array inputs, or 1)
+        seed: Seed for a fresh generator (ignored when rng is given)
+        rng: Generator to draw from (lets callers continue one random stream)
+
+    Returns:
+        Columnar ShoppingSimulation
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("NumPy is required for the vectorized shopping simulator: pip install numpy")
+
+    if n is None:
+        lengths = {len(value) for value in (item_type, color, budget, premium_tolerance)
+                   if not isinstance(value, str) and np.ndim(value) == 1}
+        if len(lengths) > 1:
+            raise ValueError(f"Array inputs have different lengths: {sorted(lengths)}")
+        n = lengths.pop() if lengths else 1
+
+    rng = rng if rng is not None else np.random.default_rng(seed)
+    item_type = np.broadcast_to(np.asarray(item_type, dtype=object), n)
+    color = np.broadcast_to(np.asarray(color, dtype=object), n)
+    budget = np.broadcast_to(np.asarray(budget, dtype=float), n)
+    premium_tolerance = np.broadcast_to(np.asarray(premium_tolerance, dtype=float), n)
+
+    # Price discovery, color matching and premium application
+    base_price = rng.uniform(budget * 0.6, budget * 0.85)
+    color_match_found = rng.random(n) < COLOR_MATCH_PROBABILITY
+    premium_factor = rng.uniform(MIN_PREMIUM, premium_tolerance)
+    final_price = np.where(color_match_found, base_price * (1 + premium_factor), base_price)
+    fallback_color = np.asarray(FALLBACK_COLORS, dtype=object)[rng.integers(len(FALLBACK_COLORS), size=n)]
+
+    return ShoppingSimulation(
+        item_type=item_type,
+        color=color,
+        budget=budget,
+        premium_tolerance=premium_tolerance,
+        base_price=base_price,
+        final_price=final_price,
+        color_match_found=color_match_found,
+        available_color=np.where(color_match_found, color, fallback_color),
+        merchant=np.asarray(MERCHANTS, dtype=object)[rng.integers(len(MERCHANTS), size=n)],
+        estimated_delivery=np.asarray(DELIVERY_OPTIONS, dtype=object)[rng.integers(len(DELIVERY_OPTIONS), size=n)],
+        auto_purchase_eligible=final_price <= budget * (1 + premium_tolerance),
+        confidence=rng.uniform(0.88, 0.96, size=n),
+        products_scanned=rng.integers(15, 36, size=n),
+        merchants_scanned=rng.integers(5, 13, size=n),
+        alternatives_found=rng.integers(3, 9, size=n)
+    )
@@ -0,0 +1,187 @@
+"""
+Genesis Studio - Incremental JSON Parsing for Streamed Inference
+
+Parses the top-level JSON object of an LLM response while tokens are still
+arriving. Every top-level field is decoded as soon as its value is closed, so
+callers can act on partial results and stop the stream once the fields they
+need are present instead of paying for the rest of the response (typically
+free-form reasoning written after or around the JSON).
+
+Stopping early only saves anything when the response really arrives as chunks.
+chaoschain-sdk's ZeroGInference.chat_completion (0.4.x) ignores stream=True and
+returns the full text, so a response given as one string is always parsed
+whole: every field (reasoning, detailed assessments) is kept.
+"""
+
+import json
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+
+class IncrementalJSONParser:
+    """Character-level scanner that decodes top-level object members as they complete"""
+
+    def __init__(self):
+        self.fields: Dict[str, Any] = {}
+        self.started = False
+        self.done = False
+        self.chars_consumed = 0
+
+        self._member: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    def feed(self, chunk: str) -> List[str]:
+        """
+        Consume the next piece of the response
+
+        Text before the first "{" (prose, a ```json fence) is skipped; anything
+        after the object closes is ignored.
+
+        Args:
+            chunk: Next chunk of streamed text
+
+        Returns:
+            Keys of the top-level fields completed by this chunk
+        """
+        completed = []
+        for ch in chunk:
+            if self.done:
+                break
+            self.chars_consumed += 1
+
+            if not self.started:
+                if ch == "{":
+                    self.started = True
+                    self._depth = 1
+                continue
+
+            if self._in_string:
+                self._member.append(ch)
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                continue
+
+            if ch == '"':
+                self._in_string = True
+            elif ch in "{[":
+                self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    completed += self._close_member()
+                    self.done = True
+                    break
+            elif ch == "," and self._depth == 1:
+                completed += self._close_member()
+                continue
+            self._member.append(ch)
+        return completed
+
+    def has_fields(self, required: Iterable[str]) -> bool:
+        """True once every required top-level field has been decoded"""
+        return all(key in self.fields for key in required)
+
+    def _close_member(self) -> List[str]:
+        """Decode the buffered `"key": value` member"""
+        text = "".join(self._member).strip()
+        self._member = []
+        if not text:
+            return []
+        try:
+            member = json.loads("{" + text + "}")
+        except json.JSONDecodeError:
+            return []
+        self.fields.update(member)
+        return list(member)
+
+
+@dataclass
+class StreamedJSON:
+    """Outcome of consuming a streamed JSON response"""
+    data: Dict[str, Any] = field(default_factory=dict)
+    text: str = ""
+    complete: bool = False          # the top-level object was closed
+    finished_early: bool = False    # stopped once the required fields were present
+    required_present: bool = False  # every required field was decoded
+    streamed: bool = False          # the response arrived as chunks rather than one full text
+    chars_consumed: int = 0
+
+    @property
+    def usable(self) -> bool:
+        """The response yielded an object (complete, or with every required field)"""
+        return bool(self.data) and (self.complete or self.required_present)
+
+
+def supports_streaming(client: Any) -> bool:
+    """
+    Whether an inference client honours stream=True with a chunk iterator
+
+    Clients opt in with a truthy `supports_streaming` attribute; chaoschain-sdk's
+    ZeroGInference (0.4.x) returns the full text regardless and does not.
+    """
+    return bool(getattr(client, "supports_streaming", False))
+
+
+def iter_chunks(response: Union[str, Iterable[str], None]) -> Iterator[str]:
+    """Normalize a chat_completion response (full text or stream of chunks) into chunks"""
+    if response is None:
+        return iter(())
+    if isinstance(response, str):
+        return iter((response,))
+    return iter(response)
+
+
+def consume_json_stream(response: Union[str, Iterable[str], None], required_fields: Iterable[str] = (),
+                        on_partial: Optional[Callable[[Dict[str, Any]], None]] = None) -> StreamedJSON:
+    """
+    Parse a streamed response, stopping as soon as the required fields are present
+
+    A full response text is parsed whole (nothing is saved by stopping inside it);
+    its required fields only decide whether a truncated object is still usable.
+
+    Args:
+        response: Full response text or an iterator of text chunks
+        required_fields: Top-level fields that are enough to act on (empty = read the whole object)
+        on_partial: Called with a copy of the fields decoded so far whenever new fields complete
+
+    Returns:
+        StreamedJSON with the decoded fields and the text consumed
+    """
+    required = tuple(required_fields)
+    streamed = response is not None and not isinstance(response, str)
+    parser = IncrementalJSONParser()
+    chunks = iter_chunks(response)
+    consumed = []
+    finished_early = False
+
+    try:
+        for chunk in chunks:
+            consumed.append(chunk)
+            if parser.feed(chunk) and on_partial:
+                on_partial(dict(parser.fields))
+            if parser.done:
+                break
+            if streamed and required and parser.has_fields(required):
+                finished_early = True
+                break
+    finally:
+        # Closing the stream generator stops token generation we no longer need
+        close = getattr(chunks, "close", None)
+        if close:
+            close()
+
+    return StreamedJSON(
+        data=dict(parser.fields),
+        text="".join(consumed),
+        complete=parser.done,
+        finished_early=finished_early,
+        required_present=parser.has_fields(required),
+        streamed=streamed,
+        chars_consumed=parser.chars_consumed
+    )
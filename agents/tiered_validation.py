@@ -0,0 +1,156 @@
+"""
+Genesis Studio - Tiered Validation
+
+Most analyses are clear-cut: the deterministic rule scorer of
+GenesisValidationTool already rates them well above or well below the quality
+thresholds. The tiered validator scores every analysis with those rules first
+and escalates to the 0G LLM only when the rule score falls inside an
+uncertainty band or the analysis trips a check the rules cannot judge (a
+premium above the acceptable limit, missing fields). TierStats reports the
+escalation rate and the LLM latency the rule tier avoided.
+"""
+
+import hashlib
+import inspect
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import validation_scoring
+from .validation_scoring import (
+    MARKET_COMPLETENESS_SECTIONS, SHOPPING_COMPLETENESS_FIELDS, ValidationBatch, is_shopping_analysis, shopping_payload
+)
+
+# Rule scores in [low, high) are too close to the quality thresholds to settle without the LLM
+UNCERTAINTY_BAND = (70.0, 85.0)
+
+# Premium over base price above which a shopping analysis is always escalated
+MAX_CLEAR_PREMIUM = 0.30
+
+# Name under which rule-tier validations are recorded in integrity proofs
+RULE_VALIDATION_FUNCTION_NAME = "rule_based_validation"
+
+
+def _scorer_code_hash() -> str:
+    """SHA-256 of the rule scorer source, so rule-tier proofs pin the code that produced them"""
+    try:
+        source = inspect.getsource(validation_scoring)
+    except (OSError, TypeError):
+        source = validation_scoring.__name__
+    return hashlib.sha256(source.encode()).hexdigest()
+
+
+RULE_SCORER_CODE_HASH = _scorer_code_hash()
+
+
+@dataclass
+class EscalationPolicy:
+    """When a rule-scored analysis is escalated to the LLM"""
+    uncertainty_band: Tuple[float, float] = UNCERTAINTY_BAND
+    max_premium: float = MAX_CLEAR_PREMIUM
+    escalate_missing_fields: bool = True
+
+    def reasons(self, analysis_data: Dict[str, Any], rule_score: float) -> List[str]:
+        """
+        Why an analysis needs the LLM
+
+        Args:
+            analysis_data: Analysis that was rule-scored
+            rule_score: Overall score from the rule scorer
+
+        Returns:
+            Escalation reasons (empty = the rule result stands)
+        """
+        reasons = []
+        low, high = self.uncertainty_band
+        if low <= rule_score < high:
+            reasons.append("uncertain_score")
+
+        if is_shopping_analysis(analysis_data):
+            shopping_data = shopping_payload(analysis_data)
+            premium = _premium(shopping_data)
+            if premium is not None and premium > self.max_premium:
+                reasons.append("premium_over_limit")
+            missing = [field for field in SHOPPING_COMPLETENESS_FIELDS if shopping_data.get(field) is None]
+        else:
+            missing = [section for section in MARKET_COMPLETENESS_SECTIONS if section not in analysis_data]
+
+        if missing and self.escalate_missing_fields:
+            reasons.append("missing_fields:" + ",".join(missing))
+        return reasons
+
+    def triage(self, batch: ValidationBatch) -> List[List[str]]:
+        """Escalation reasons for every analysis of a batch scored by score_batch"""
+        return [self.reasons(analysis, score) for analysis, score in zip(batch.analyses, batch.overall_score)]
+
+    def describe(self) -> Dict[str, Any]:
+        """Policy settings for reports"""
+        return {
+            "uncertainty_band": list(self.uncertainty_band),
+            "max_premium": self.max_premium,
+            "escalate_missing_fields": self.escalate_missing_fields
+        }
+
+
+class TierStats:
+    """Escalation counters and per-tier latency"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.rule_only = 0
+        self.escalated = 0
+        self.reasons: Dict[str, int] = {}
+        self.rule_seconds = 0.0
+        self.llm_seconds = 0.0
+
+    def record(self, rule_seconds: float, reasons: List[str], llm_seconds: float = 0.0):
+        """
+        Record one tiered validation
+
+        Args:
+            rule_seconds: Time spent in the rule scorer
+            reasons: Escalation reasons (empty when the rule result was returned)
+            llm_seconds: Time spent in the LLM call (escalations only)
+        """
+        with self._lock:
+            self.rule_seconds += rule_seconds
+            if not reasons:
+                self.rule_only += 1
+                return
+            self.escalated += 1
+            self.llm_seconds += llm_seconds
+            for reason in reasons:
+                # "missing_fields:merchant,..." is counted as "missing_fields"
+                name = reason.split(":", 1)[0]
+                self.reasons[name] = self.reasons.get(name, 0) + 1
+
+    def summary(self) -> Dict[str, Any]:
+        """Escalation rate, reason counts, mean latency per tier and estimated LLM time saved"""
+        with self._lock:
+            total = self.rule_only + self.escalated
+            mean_llm = self.llm_seconds / self.escalated if self.escalated else None
+            return {
+                "validations": total,
+                "rule_only": self.rule_only,
+                "escalated": self.escalated,
+                "escalation_rate": round(self.escalated / total, 3) if total else 0.0,
+                "escalation_reasons": dict(self.reasons),
+                "mean_rule_ms": round(self.rule_seconds / total * 1000, 3) if total else None,
+                "mean_llm_seconds": round(mean_llm, 3) if mean_llm is not None else None,
+                # Rule-only validations would each have cost one LLM call of the observed mean latency
+                "estimated_llm_seconds_saved": round(self.rule_only * mean_llm, 3) if mean_llm is not None else None
+            }
+
+
+# === Internal helpers ===
+
+def _premium(shopping_data: Dict[str, Any]) -> Optional[float]:
+    """Final price over base price minus one, or None when either price is unusable"""
+    try:
+        final_price = float(shopping_data.get("final_price") or 0)
+        base_price = float(shopping_data.get("base_price") or 0)
+    except (TypeError, ValueError):
+        return None
+    if final_price <= 0 or base_price <= 0:
+        return None
+    return (final_price - base_price) / base_price
@@ -0,0 +1,289 @@
+"""
+Genesis Studio - Validator Quorum
+
+High-value deals can be scored by several validators in parallel (several
+GenesisValidatorAgentSDK instances, e.g. each on its own 0G provider). Their
+scores are aggregated with a robust rule (median or trimmed mean), and once a
+quorum agrees within a tolerance the outstanding validators are stopped before
+their next paid 0G call (or mid-stream), so the extra assurance costs about the
+latency of the quorum-th fastest validator instead of the slowest. Every vote
+keeps its IntegrityProof.
+
+Members should run with tiered_validation=False: with the tiered default every
+member returns the same deterministic rule score for a clear-cut analysis, so
+the quorum would "agree" without any independent assurance (only escalated
+analyses would get independent votes).
+"""
+
+import asyncio
+import copy
+import math
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+from rich import print as rprint
+
+from .inference_cache import proof_reference
+
+# Supported score aggregation rules
+AGGREGATIONS = ("median", "trimmed_mean", "mean")
+
+
+class QuorumCancelled(Exception):
+    """Raised inside an outstanding validator once the quorum has been reached"""
+
+
+@dataclass
+class QuorumPolicy:
+    """How validator scores are combined and when the vote ends early"""
+    aggregation: str = "median"
+    trim: float = 0.2
+    quorum: Optional[int] = None
+    tolerance: float = 5.0
+
+    def __post_init__(self):
+        if self.aggregation not in AGGREGATIONS:
+            raise ValueError(f"Unknown aggregation '{self.aggregation}' (available: {', '.join(AGGREGATIONS)})")
+        if not 0 <= self.trim < 0.5:
+            raise ValueError("trim must be in [0, 0.5)")
+
+    def required(self, validators: int) -> int:
+        """Agreeing votes needed to end early (default: a majority of the validators)"""
+        quorum = self.quorum if self.quorum is not None else validators // 2 + 1
+        return max(1, min(quorum, validators))
+
+    def aggregate(self, scores: Sequence[float]) -> Optional[float]:
+        """Combine scores with the configured rule (None without scores)"""
+        if not scores:
+            return None
+        if self.aggregation == "median":
+            return float(statistics.median(scores))
+        if self.aggregation == "mean":
+            return float(statistics.fmean(scores))
+        ordered = sorted(scores)
+        cut = math.floor(len(ordered) * self.trim)
+        return float(statistics.fmean(ordered[cut:len(ordered) - cut]))
+
+    def agrees(self, scores: Sequence[float], required: int) -> bool:
+        """True when `required` of the scores lie within the tolerance of each other"""
+        ordered = sorted(scores)
+        return any(ordered[i + required - 1] - ordered[i] <= self.tolerance
+                   for i in range(len(ordered) - required + 1))
+
+
+@dataclass
+class QuorumVote:
+    """One validator's contribution to a quorum"""
+    validator: str
+    score: Optional[float] = None
+    quality_rating: Optional[str] = None
+    validation: Optional[Dict[str, Any]] = None
+    process_integrity_proof: Any = None
+    latency_seconds: Optional[float] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class QuorumResult:
+    """Aggregated score, whether the quorum agreed, and every vote with its proof"""
+    score: Optional[float]
+    aggregation: str
+    agreed: bool
+    quorum: int
+    tolerance: float
+    votes: List[QuorumVote] = field(default_factory=list)
+    cancelled: List[str] = field(default_factory=list)
+    latency_seconds: float = 0.0
+
+    @property
+    def proofs(self) -> List[Any]:
+        """IntegrityProofs of the validators that voted"""
+        return [vote.process_integrity_proof for vote in self.votes if vote.process_integrity_proof is not None]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-safe record (proofs as references) for deal results and evidence"""
+        scores = [vote.score for vote in self.votes if vote.score is not None]
+        return {
+            "overall_score": round(self.score) if self.score is not None else None,
+            "aggregate_score": self.score,
+            "aggregation": self.aggregation,
+            "agreed": self.agreed,
+            "quorum": self.quorum,
+            "tolerance": self.tolerance,
+            "spread": max(scores) - min(scores) if scores else None,
+            "votes": [
+                {
+                    "validator": vote.validator,
+                    "score": vote.score,
+                    "quality_rating": vote.quality_rating,
+                    "latency_seconds": vote.latency_seconds,
+                    "error": vote.error,
+                    "process_integrity_proof": proof_reference(vote.process_integrity_proof)
+                }
+                for vote in self.votes
+            ],
+            "cancelled": list(self.cancelled),
+            "latency_seconds": self.latency_seconds
+        }
+
+
+class ValidatorQuorum:
+    """Runs several validators on one analysis in parallel and stops once a quorum agrees"""
+
+    def __init__(self, validators: Sequence[Any], policy: Optional[QuorumPolicy] = None,
+                 timeout: Optional[float] = None):
+        """
+        Initialize the quorum
+
+        Args:
+            validators: Objects with validate_analysis_with_crewai(analysis_data, on_partial)
+                (GenesisValidatorAgentSDK instances, built with tiered_validation=False so each
+                vote is an independent 0G validation)
+            policy: Aggregation rule, quorum size and agreement tolerance (default: median,
+                majority, 5 points)
+            timeout: Seconds to wait for votes before aggregating what has arrived (None = no limit)
+        """
+        if not validators:
+            raise ValueError("A validator quorum needs at least one validator")
+        self.validators = list(validators)
+        self.policy = policy or QuorumPolicy()
+        self.timeout = timeout
+
+        # Observability counters
+        self._lock = threading.Lock()
+        self.runs = 0
+        self.agreed_runs = 0
+        self.early_terminations = 0
+        self.cancelled_votes = 0
+
+    def validate(self, analysis_data: Dict[str, Any]) -> QuorumResult:
+        """Blocking wrapper around avalidate"""
+        return asyncio.run(self.avalidate(analysis_data))
+
+    async def avalidate(self, analysis_data: Dict[str, Any]) -> QuorumResult:
+        """
+        Score one analysis with every validator in parallel
+
+        Votes are collected as they finish. As soon as the policy's quorum agrees within
+        its tolerance, validators that have not started are cancelled, validators that
+        have not made their 0G call yet never make it, and still-streaming 0G validations
+        are stopped at their next parsed field; a validator that cannot be interrupted
+        finishes in the background and its vote is dropped.
+
+        Args:
+            analysis_data: Analysis to validate (each validator gets its own copy)
+
+        Returns:
+            QuorumResult with the aggregated score and every vote's IntegrityProof
+        """
+        started = time.perf_counter()
+        required = self.policy.required(len(self.validators))
+        stop = threading.Event()
+
+        # Called before every paid 0G call and again for each parsed field of its stream
+        def on_partial(_fields: Dict[str, Any]):
+            if stop.is_set():
+                raise QuorumCancelled("Validator quorum already reached")
+
+        # Validators run on a pool owned by this run rather than on the caller's loop, so a
+        # stopped vote never holds up the caller or queues a later run behind it
+        pool = ThreadPoolExecutor(max_workers=len(self.validators), thread_name_prefix="validator-quorum")
+        tasks = {}
+        for index, validator in enumerate(self.validators):
+            name = f"{getattr(validator, 'agent_name', 'validator')}#{index}"
+            future = pool.submit(self._vote, name, validator, copy.deepcopy(analysis_data), on_partial, stop)
+            tasks[asyncio.wrap_future(future)] = name
+
+        rprint(f"[cyan]🗳️  Validator quorum: {len(tasks)} validators, {required} must agree within "
+               f"{self.policy.tolerance:g} points ({self.policy.aggregation})[/cyan]")
+
+        votes: List[QuorumVote] = []
+        agreed = False
+        pending = set(tasks)
+        while pending:
+            remaining = None if self.timeout is None else self.timeout - (time.perf_counter() - started)
+            if remaining is not None and remaining <= 0:
+                break
+            done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            votes.extend(task.result() for task in done)
+            if self.policy.agrees([vote.score for vote in votes if vote.score is not None], required):
+                agreed = True
+                break
+
+        # Stop whatever is still outstanding: queued votes are dropped, running ones
+        # raise QuorumCancelled before their next 0G call or parsed field
+        stop.set()
+        pool.shutdown(wait=False, cancel_futures=True)
+        for task in pending:
+            task.cancel()
+
+        scores = [vote.score for vote in votes if vote.score is not None]
+        result = QuorumResult(
+            score=self.policy.aggregate(scores),
+            aggregation=self.policy.aggregation,
+            agreed=agreed,
+            quorum=required,
+            tolerance=self.policy.tolerance,
+            votes=votes,
+            cancelled=sorted(tasks[task] for task in pending),
+            latency_seconds=round(time.perf_counter() - started, 3)
+        )
+
+        with self._lock:
+            self.runs += 1
+            self.agreed_runs += int(agreed)
+            self.early_terminations += int(bool(pending))
+            self.cancelled_votes += len(pending)
+
+        if agreed:
+            rprint(f"[green]✅ Quorum reached: {result.score:g}/100 from {len(scores)} votes "
+                   f"({len(result.cancelled)} cancelled, {result.latency_seconds}s)[/green]")
+        else:
+            rprint(f"[yellow]⚠️  No quorum within {self.policy.tolerance:g} points; "
+                   f"{self.policy.aggregation} of {len(scores)} votes: {result.score}[/yellow]")
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Run, agreement and cancellation counters"""
+        with self._lock:
+            return {
+                "validators": len(self.validators),
+                "runs": self.runs,
+                "agreed_runs": self.agreed_runs,
+                "early_terminations": self.early_terminations,
+                "cancelled_votes": self.cancelled_votes,
+                "policy": {
+                    "aggregation": self.policy.aggregation,
+                    "trim": self.policy.trim,
+                    "quorum": self.policy.required(len(self.validators)),
+                    "tolerance": self.policy.tolerance
+                }
+            }
+
+    # === Internal helpers ===
+
+    @staticmethod
+    def _vote(name: str, validator: Any, analysis_data: Dict[str, Any], on_partial,
+              stop: threading.Event) -> QuorumVote:
+        """Run one validator; failures become a vote with an error instead of failing the quorum"""
+        started = time.perf_counter()
+        try:
+            if stop.is_set():
+                raise QuorumCancelled("Validator quorum already reached")
+            result = validator.validate_analysis_with_crewai(analysis_data, on_partial)
+        except Exception as e:
+            return QuorumVote(validator=name, latency_seconds=round(time.perf_counter() - started, 3), error=str(e))
+        validation = result["validation"]
+        score = validation.get("overall_score")
+        return QuorumVote(
+            validator=name,
+            score=float(score) if score is not None else None,
+            quality_rating=validation.get("quality_rating"),
+            validation=validation,
+            process_integrity_proof=result["process_integrity_proof"],
+            latency_seconds=round(time.perf_counter() - started, 3)
+        )
@@ -0,0 +1,438 @@
+"""
+Genesis Studio - Validation Report Building and Vectorized Batch Scoring
+
+Rule-based validation shared by GenesisValidationTool. The report builders turn
+the five sub-scores into the validation dict (assessments, weighted overall
+score, quality rating) for both the per-item and the batch path. The batch
+path extracts the scored fields of many analyses into columns in one pass and
+computes every sub-score with NumPy array operations; per-item reports are only
+materialized when iterated.
+"""
+
+import random
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Sequence, TypedDict
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Sub-score names, in report order
+SCORE_NAMES = (
+    "data_completeness", "technical_accuracy", "price_reasonableness", "recommendation_quality", "methodology_soundness"
+)
+
+# Weights of the shopping overall score (market analyses use the plain mean)
+SHOPPING_SCORE_WEIGHTS = {
+    "data_completeness": 0.25,
+    "technical_accuracy": 0.20,
+    "price_reasonableness": 0.25,
+    "recommendation_quality": 0.20,
+    "methodology_soundness": 0.10
+}
+
+# Shopping fields counted by the completeness score
+SHOPPING_COMPLETENESS_FIELDS = (
+    "item_type", "final_price", "merchant", "availability", "deal_quality", "color_match_found", "auto_purchase_eligible"
+)
+
+# Market sections counted by the completeness score
+MARKET_COMPLETENESS_SECTIONS = (
+    "price_analysis", "technical_analysis", "sentiment_analysis", "recommendations", "genesis_studio_metadata"
+)
+
+
+class ValidationReport(TypedDict, total=False):
+    """Validation report returned in-process by GenesisValidationTool.validate (a plain dict at runtime)"""
+    validation_timestamp: str
+    validated_symbol: str
+    validation_criteria: str
+    scoring_breakdown: Dict[str, float]
+    detailed_assessment: Dict[str, List[str]]
+    crewai_validation_metadata: Dict[str, Any]
+    genesis_studio_metadata: Dict[str, Any]
+    overall_score: int
+    quality_rating: str
+    validation_summary: str
+
+
+def is_shopping_analysis(analysis_data: Dict[str, Any]) -> bool:
+    """Shopping analyses carry a shopping_result or an item_type; anything else is market analysis"""
+    return "shopping_result" in analysis_data or "item_type" in analysis_data
+
+
+def shopping_payload(analysis_data: Dict[str, Any]) -> Dict[str, Any]:
+    """The dict the shopping scores are computed on"""
+    return analysis_data["shopping_result"] if "shopping_result" in analysis_data else analysis_data
+
+
+def shopping_validation_record(item_type: str, validation_criteria: str, scores: Dict[str, float]) -> ValidationReport:
+    """
+    Build a shopping validation report from its sub-scores
+
+    Args:
+        item_type: Validated item type
+        validation_criteria: Criteria description recorded in the report
+        scores: The five sub-scores keyed by SCORE_NAMES
+
+    Returns:
+        Validation report dict
+    """
+    strengths, weaknesses, improvements = [], [], []
+
+    # Shopping-specific assessments with AI insights
+    if scores["data_completeness"] >= 90:
+        strengths.append("Complete product information with comprehensive details")
+        strengths.append("All required shopping parameters properly analyzed")
+    elif scores["data_completeness"] < 70:
+        weaknesses.append("Missing critical product specifications")
+        improvements.append("Include complete product details and merchant information")
+
+    if scores["price_reasonableness"] >= 85:
+        strengths.append("Excellent price optimization within budget constraints")
+        strengths.append("Smart premium calculation for preferred options")
+    elif scores["price_reasonableness"] < 70:
+        weaknesses.append("Price analysis may not optimize for best value")
+        improvements.append("Enhance price comparison and budget optimization logic")
+
+    if scores["recommendation_quality"] >= 90:
+        strengths.append("High-quality merchant selection and availability verification")
+
+    # Calculate overall score with CrewAI weighting
+    overall_score = sum(scores[name] * weight for name, weight in SHOPPING_SCORE_WEIGHTS.items())
+
+    # Add CrewAI-enhanced qualitative assessment
+    if overall_score >= 95:
+        quality_rating = "Outstanding"
+        validation_summary = "Exceptional shopping analysis exceeding all professional standards"
+    elif overall_score >= 90:
+        quality_rating = "Excellent"
+        validation_summary = "Outstanding shopping analysis meeting all criteria with high precision"
+    elif overall_score >= 80:
+        quality_rating = "Good"
+        validation_summary = "Solid shopping analysis with minor areas for enhancement"
+    elif overall_score >= 70:
+        quality_rating = "Acceptable"
+        validation_summary = "Adequate shopping analysis with some notable areas for improvement"
+    else:
+        quality_rating = "Needs Improvement"
+        validation_summary = "Shopping analysis requires significant enhancement to meet standards"
+
+    return {
+        "validation_timestamp": datetime.now().isoformat(),
+        "validated_symbol": item_type,
+        "validation_criteria": validation_criteria,
+        "scoring_breakdown": dict(scores),
+        "detailed_assessment": {
+            "strengths": strengths,
+            "weaknesses": weaknesses,
+            "recommendations_for_improvement": improvements
+        },
+        "crewai_validation_metadata": {
+            "validation_approach": "multi_factor_shopping_assessment",
+            "ai_confidence": random.uniform(0.92, 0.98),
+            "validation_depth": "comprehensive",
+            "data_quality_indicators": {
+                "completeness_score": 0.95,
+                "accuracy_score": 0.93,
+                "consistency_score": 0.96
+            }
+        },
+        "genesis_studio_metadata": {
+            "validator_version": "1.0.0-crewai",
+            "validation_methodology": "CrewAI-powered multi-factor shopping analysis assessment",
+            "confidence_in_validation": 0.95
+        },
+        "overall_score": round(overall_score),
+        "quality_rating": quality_rating,
+        "validation_summary": validation_summary
+    }
+
+
+def market_validation_record(symbol: str, validation_criteria: str, scores: Dict[str, float]) -> ValidationReport:
+    """
+    Build a market validation report from its sub-scores
+
+    Args:
+        symbol: Validated symbol
+        validation_criteria: Criteria description recorded in the report
+        scores: The five sub-scores keyed by SCORE_NAMES
+
+    Returns:
+        Validation report dict
+    """
+    strengths, weaknesses, improvements = [], [], []
+
+    # Enhanced assessments
+    if scores["data_completeness"] >= 90:
+        strengths.append("Comprehensive data coverage with detailed analysis")
+    elif scores["data_completeness"] < 70:
+        weaknesses.append("Incomplete data analysis requiring enhancement")
+
+    if scores["technical_accuracy"] >= 85:
+        strengths.append("Sound technical analysis methodology with proper indicators")
+    elif scores["technical_accuracy"] < 70:
+        weaknesses.append("Technical analysis methodology needs improvement")
+        improvements.append("Enhance technical indicator analysis and validation")
+
+    # Calculate overall score
+    overall_score = sum(scores.values()) / len(scores)
+
+    # Add qualitative assessment
+    if overall_score >= 90:
+        quality_rating = "Excellent"
+        validation_summary = "High-quality analysis meeting professional standards"
+    elif overall_score >= 80:
+        quality_rating = "Good"
+        validation_summary = "Solid analysis with minor areas for improvement"
+    elif overall_score >= 70:
+        quality_rating = "Acceptable"
+        validation_summary = "Adequate analysis with some notable weaknesses"
+    else:
+        quality_rating = "Needs Improvement"
+        validation_summary = "Analysis requires significant enhancement"
+
+    return {
+        "validation_timestamp": datetime.now().isoformat(),
+        "validated_symbol": symbol,
+        "validation_criteria": validation_criteria,
+        "scoring_breakdown": dict(scores),
+        "detailed_assessment": {
+            "strengths": strengths,
+            "weaknesses": weaknesses,
+            "recommendations_for_improvement": improvements
+        },
+        "crewai_validation_metadata": {
+            "validation_approach": "multi_factor_market_assessment",
+            "ai_confidence": random.uniform(0.90, 0.97),
+            "validation_depth": "comprehensive"
+        },
+        "genesis_studio_metadata": {
+            "validator_version": "1.0.0-crewai",
+            "validation_methodology": "CrewAI-powered multi-factor quantitative assessment",
+            "confidence_in_validation": 0.95
+        },
+        "overall_score": round(overall_score),
+        "quality_rating": quality_rating,
+        "validation_summary": validation_summary
+    }
+
+
+@dataclass
+class ValidationBatch:
+    """Columnar batch validation results: one array per sub-score, one row per analysis"""
+    analyses: Sequence[Dict[str, Any]]
+    validation_criteria: str
+    is_shopping: "np.ndarray"
+    subject: "np.ndarray"
+    data_completeness: "np.ndarray"
+    technical_accuracy: "np.ndarray"
+    price_reasonableness: "np.ndarray"
+    recommendation_quality: "np.ndarray"
+    methodology_soundness: "np.ndarray"
+
+    def __len__(self) -> int:
+        return len(self.is_shopping)
+
+    @property
+    def raw_overall(self) -> "np.ndarray":
+        """Unrounded overall score (weighted for shopping, mean for market analyses)"""
+        shopping = (self.data_completeness * SHOPPING_SCORE_WEIGHTS["data_completeness"]
+                    + self.technical_accuracy * SHOPPING_SCORE_WEIGHTS["technical_accuracy"]
+                    + self.price_reasonableness * SHOPPING_SCORE_WEIGHTS["price_reasonableness"]
+                    + self.recommendation_quality * SHOPPING_SCORE_WEIGHTS["recommendation_quality"]
+                    + self.methodology_soundness * SHOPPING_SCORE_WEIGHTS["methodology_soundness"])
+        market = (self.data_completeness + self.technical_accuracy + self.price_reasonableness
+                  + self.recommendation_quality + self.methodology_soundness) / len(SCORE_NAMES)
+        return np.where(self.is_shopping, shopping, market)
+
+    @property
+    def overall_score(self) -> "np.ndarray":
+        """Overall score per analysis, rounded as in the per-item reports"""
+        return np.round(self.raw_overall).astype(int)
+
+    def scores(self, index: int) -> Dict[str, float]:
+        """Sub-scores of one analysis"""
+        return {name: _as_number(getattr(self, name)[index]) for name in SCORE_NAMES}
+
+    def result(self, index: int) -> ValidationReport:
+        """Materialize one analysis' validation report (same schema as GenesisValidationTool.validate)"""
+        build = shopping_validation_record if self.is_shopping[index] else market_validation_record
+        return build(str(self.subject[index]), self.validation_criteria, self.scores(index))
+
+    def __iter__(self) -> Iterator[ValidationReport]:
+        """Materialize reports lazily, one at a time"""
+        for index in range(len(self)):
+            yield self.result(index)
+
+    def summary(self) -> Dict[str, Any]:
+        """Aggregate statistics over the batch"""
+        overall = self.raw_overall
+        return {
+            "analyses": len(self),
+            "shopping": int(self.is_shopping.sum()),
+            "market": int(len(self) - self.is_shopping.sum()),
+            "mean_overall_score": round(float(overall.mean()), 2) if len(self) else 0.0,
+            "min_overall_score": int(self.overall_score.min()) if len(self) else None,
+            "below_70": int((overall < 70).sum())
+        }
+
+
+def score_batch(analyses: Sequence[Dict[str, Any]],
+                validation_criteria: str = "Batch rule-based validation") -> ValidationBatch:
+    """
+    Score many analyses in one vectorized pass
+
+    Args:
+        analyses: Shopping and/or market analyses (any mix, any order)
+        validation_criteria: Criteria description recorded in each report
+
+    Returns:
+        Columnar ValidationBatch (iterate it for per-item reports)
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("NumPy is required for batch validation scoring: pip install numpy")
+
+    analyses = list(analyses)
+    n = len(analyses)
+    is_shopping = np.fromiter((is_shopping_analysis(a) for a in analyses), bool, n)
+    subject = np.empty(n, dtype=object)
+    columns = {name: np.zeros(n) for name in SCORE_NAMES}
+
+    shopping_rows = np.flatnonzero(is_shopping)
+    market_rows = np.flatnonzero(~is_shopping)
+    for rows, scorer in ((shopping_rows, _score_shopping_columns), (market_rows, _score_market_columns)):
+        if len(rows):
+            group_subject, group_scores = scorer([analyses[i] for i in rows])
+            subject[rows] = group_subject
+            for name in SCORE_NAMES:
+                columns[name][rows] = group_scores[name]
+
+    return ValidationBatch(analyses=analyses, validation_criteria=validation_criteria, is_shopping=is_shopping,
+                           subject=subject, **columns)
+
+
+# === Internal helpers ===
+
+def _number(value: Any) -> float:
+    """Numeric field value, 0 for missing or non-numeric values"""
+    return float(value) if isinstance(value, (int, float)) else 0.0
+
+
+def _mapping(value: Any) -> Dict[str, Any]:
+    """Nested section as a dict ({} when missing or malformed)"""
+    return value if isinstance(value, dict) else {}
+
+
+def _as_number(value: Any) -> float:
+    """Array element as a plain Python number (int when integral, like the per-item scores)"""
+    value = float(value)
+    return int(value) if value.is_integer() else value
+
+
+def _flags(rows: List[Dict[str, Any]], test) -> "np.ndarray":
+    """Boolean column from a per-row predicate"""
+    return np.fromiter((bool(test(row)) for row in rows), bool, len(rows))
+
+
+def _methodology_columns(rows: List[Dict[str, Any]]) -> "np.ndarray":
+    """Methodology soundness (see GenesisValidationTool._score_methodology)"""
+    has_methodology = _flags(rows, lambda d: "methodology" in _mapping(d.get("genesis_studio_metadata")))
+    has_confidence = _flags(rows, lambda d: "confidence_score" in _mapping(d.get("genesis_studio_metadata")))
+    has_crewai = _flags(rows, lambda d: "crewai_analysis" in d or "crewai_metadata" in d)
+    return np.clip(85 + 10 * has_methodology + 5 * has_confidence + 10 * has_crewai, 0, 100)
+
+
+def _score_shopping_columns(analyses: List[Dict[str, Any]]):
+    """Vectorized GenesisValidationTool._score_shopping_* for shopping analyses"""
+    rows = [shopping_payload(a) for a in analyses]
+    n = len(rows)
+
+    # One pass over the dicts into columns
+    subject = [row.get("item_type", "Unknown") for row in rows]
+    final_price = np.fromiter((_number(row.get("final_price", 0)) for row in rows), float, n)
+    base_price = np.fromiter((_number(row.get("base_price", 0)) for row in rows), float, n)
+    confidence = np.fromiter((_number(row.get("confidence", 0)) for row in rows), float, n)
+    present = np.fromiter((sum(1 for key in SHOPPING_COMPLETENESS_FIELDS if row.get(key) is not None)
+                           for row in rows), float, n)
+    has_delivery_key = _flags(rows, lambda d: "estimated_delivery" in d)
+    has_premium_key = _flags(rows, lambda d: "premium_applied" in d)
+    has_crewai_analysis = _flags(rows, lambda d: "crewai_analysis" in d)
+    has_color_key = _flags(rows, lambda d: "color_match_found" in d)
+    has_auto_key = _flags(rows, lambda d: "auto_purchase_eligible" in d)
+    good_deal = _flags(rows, lambda d: d.get("deal_quality", "") in ("excellent", "good"))
+    has_merchant = _flags(rows, lambda d: d.get("merchant"))
+    in_stock = _flags(rows, lambda d: d.get("availability") == "in_stock")
+    has_delivery = _flags(rows, lambda d: d.get("estimated_delivery"))
+
+    # Data completeness
+    bonus = 5 * has_delivery_key + 5 * has_premium_key + 10 * (confidence > 0.8) + 10 * has_crewai_analysis
+    completeness = np.minimum(100, (present / len(SHOPPING_COMPLETENESS_FIELDS)) * 100 + bonus)
+
+    # Technical accuracy (price logic, color matching, auto-purchase)
+    priced = (final_price > 0) & (base_price > 0)
+    accuracy = (75 + 15 * priced + 10 * (priced & (final_price <= base_price * 1.3))
+                + 5 * has_color_key + 5 * has_auto_key)
+
+    # Price reasonableness
+    with np.errstate(divide="ignore", invalid="ignore"):
+        premium = np.where(priced, (final_price - base_price) / np.where(priced, base_price, 1.0), np.inf)
+    price = (70 + 15 * (final_price > 0) + np.where(premium <= 0.20, 15, np.where(premium <= 0.30, 10, 0))
+             + 10 * good_deal)
+
+    # Recommendation quality
+    quality = (75 + 10 * has_merchant + 10 * in_stock + 5 * has_delivery
+               + np.where(confidence >= 0.9, 10, np.where(confidence >= 0.8, 5, 0)))
+
+    return subject, {
+        "data_completeness": completeness,
+        "technical_accuracy": np.clip(accuracy, 0, 100),
+        "price_reasonableness": np.clip(price, 0, 100),
+        "recommendation_quality": np.clip(quality, 0, 100),
+        "methodology_soundness": _methodology_columns(rows)
+    }
+
+
+def _score_market_columns(analyses: List[Dict[str, Any]]):
+    """Vectorized GenesisValidationTool._score_* for market analyses"""
+    n = len(analyses)
+    technical = [_mapping(a.get("technical_analysis")) for a in analyses]
+    prices = [_mapping(a.get("price_analysis")) for a in analyses]
+    recommendations = [_mapping(a.get("recommendations")) for a in analyses]
+
+    # One pass over the dicts into columns
+    subject = [a.get("symbol", "Unknown") for a in analyses]
+    sections = np.fromiter((sum(1 for key in MARKET_COMPLETENESS_SECTIONS if key in a) for a in analyses), float, n)
+    has_technical_key = _flags(analyses, lambda d: "technical_analysis" in d)
+    has_levels = _flags(technical, lambda t: "support_levels" in t and "resistance_levels" in t)
+    has_averages = _flags(technical, lambda t: "moving_averages" in t)
+    valid_rsi = _flags(technical, lambda t: isinstance(t.get("rsi"), (int, float)) and 0 <= t["rsi"] <= 100)
+    has_technical = _flags(technical, bool)
+    has_price = _flags(prices, bool)
+    price_fields = [_flags(prices, lambda p, key=key: key in p) for key in ("current_price", "volume_24h", "market_cap")]
+    has_recommendations = _flags(recommendations, bool)
+    has_risk = _flags(recommendations, lambda r: "risk_level" in r)
+    has_points = _flags(recommendations, lambda r: "entry_points" in r and "exit_targets" in r)
+    has_horizons = _flags(recommendations, lambda r: "short_term" in r and "medium_term" in r)
+
+    # Data completeness
+    bonus = has_technical_key * (5 * has_levels + 3 * has_averages)
+    completeness = np.minimum(100, (sections / len(MARKET_COMPLETENESS_SECTIONS)) * 100 + bonus)
+
+    technical_score = np.where(has_technical, np.clip(75 + 10 * valid_rsi + 15 * has_levels + 10 * has_averages, 0, 100), 0)
+    price_score = np.where(has_price, np.clip(80 + 10 * price_fields[0] + 5 * price_fields[1] + 5 * price_fields[2], 0, 100), 0)
+    recommendation_score = np.where(
+        has_recommendations, np.clip(70 + 15 * has_risk + 15 * has_points + 10 * has_horizons, 0, 100), 0
+    )
+
+    return subject, {
+        "data_completeness": completeness,
+        "technical_accuracy": technical_score,
+        "price_reasonableness": price_score,
+        "recommendation_quality": recommendation_score,
+        "methodology_soundness": _methodology_columns(analyses)
+    }
@@ -0,0 +1,7 @@
+"""
+Genesis Studio Benchmarks
+
+Offline benchmark harness that runs the full orchestrator pipeline against
+in-process stand-ins for 0G Compute/Storage/Inference, the ERC-8004 registries
+and x402 payments, with configurable latency and failure distributions.
+"""
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Genesis Studio Benchmarks - End-to-End Pipeline Throughput
+
+Runs GenesisStudioX402Orchestrator against the local stand-in providers in
+benchmarks.standins and reports deals/sec plus latency percentiles for setup
+(phase 1), every deal step and whole deals. No 0G sidecar, testnet RPC or
+funded wallet is needed.
+
+Usage:
+    python -m benchmarks.run_pipeline --deals 100 --max-concurrency 16
+    python -m benchmarks.run_pipeline --deals 20 --scale 0.05          # quick smoke run
+    python -m benchmarks.run_pipeline --profile profile.json --output bench.json
+    python -m benchmarks.run_pipeline --check-resume --scale 0.05     # journal resume round trip
+    python -m benchmarks.run_pipeline --deals 20 --quorum 3 --quorum-min-budget 150   # quorum on pricier deals
+
+A profile file overrides the default latency model per component, e.g.
+    {"compute": {"median": 4.0, "sigma": 0.6, "failure_rate": 0.05}}
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+from rich import print as rprint
+from rich.table import Table
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from genesis_studio import QUORUM_MIN_BUDGET, GenesisStudioX402Orchestrator
+from studio.deal_engine import DealEngine
+from studio.deals import Deal
+from studio.job_watcher import JobWatcher
+
+from benchmarks.standins import (
+    LatencyModel, StandInAgent, StandInChain, StandInCompute, StandInInference, StandInSDK,
+    StandInStorage, load_profile
+)
+
+
+class BenchmarkOrchestrator(GenesisStudioX402Orchestrator):
+    """Orchestrator wired to in-process stand-ins instead of live providers"""
+
+    def __init__(self, profile: Dict[str, LatencyModel], seed: int = 0, use_compute: bool = True,
+                 journal_path: Optional[str] = None, interrupt_step: Optional[str] = None,
+                 quorum_validators: int = 0, quorum_min_budget: float = QUORUM_MIN_BUDGET):
+        super().__init__(journal_path=journal_path, quorum_validators=quorum_validators,
+                         quorum_min_budget=quorum_min_budget)
+        self.profile = profile
+        self.seed = seed
+        self.use_compute = use_compute
+        self.interrupt_step = interrupt_step
+
+    def _validate_configuration(self):
+        """Stand-ins need no environment configuration"""
+
+    def _initialize_agent_sdks(self):
+        """Install stand-in providers and agents (same attributes the real method sets)"""
+        profile, seed = self.profile, self.seed
+
+        self.zg_compute = StandInCompute(profile["compute"], seed) if self.use_compute else None
+        self.zg_storage = StandInStorage(profile["storage"], seed + 1)
+        self.job_watcher = JobWatcher(self.zg_compute) if self.zg_compute else None
+        self.chain = StandInChain(profile["chain"], seed + 2)
+        inference = StandInInference(profile["inference"], seed + 3)
+
+        def _builder(name: str, role: str, offset: int):
+            def _build():
+                sdk = StandInSDK(name, role, self.chain, profile["payment"], profile["ap2"], seed + offset)
+                return StandInAgent(name, role, sdk, inference)
+            return _build
+
+        builders = {
+            "Alice": _builder("Alice", "server", 10),
+            "Bob": _builder("Bob", "validator", 20),
+            "Charlie": _builder("Charlie", "client", 30),
+        }
+        for index, name in enumerate(self._quorum_member_names(), start=1):
+            builders[name] = _builder(name, "validator", 20 + index)
+        agents = self._bootstrap_agents(builders)
+        self.alice_agent, self.bob_agent, self.charlie_agent = agents["Alice"], agents["Bob"], agents["Charlie"]
+        self._setup_validator_quorum(agents)
+        self.alice_sdk, self.bob_sdk, self.charlie_sdk = self.alice_agent.sdk, self.bob_agent.sdk, self.charlie_agent.sdk
+        self.inference = inference
+
+        self.results["wallets"] = {name: agent.sdk.wallet_address for name, agent in agents.items()}
+
+    def _wallets_provisioned(self, agent_names: List[str]) -> bool:
+        """Stand-in wallets never touch the wallet file"""
+        return True
+
+    def _step_evidence_package(self, deal: Deal, **inputs: Any) -> Dict[str, Any]:
+        """Simulate a crash before the evidence package when asked to"""
+        if self.interrupt_step == "evidence_package":
+            raise RuntimeError("Simulated crash before the evidence package")
+        return super()._step_evidence_package(deal, **inputs)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Linear-interpolated percentile of a non-empty list"""
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    low, high = math.floor(rank), math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    """Count, mean and p50/p90/p99/max of a latency sample"""
+    if not values:
+        return {"count": 0}
+    return {
+        "count": len(values),
+        "mean": round(sum(values) / len(values), 4),
+        "p50": round(percentile(values, 50), 4),
+        "p90": round(percentile(values, 90), 4),
+        "p99": round(percentile(values, 99), 4),
+        "max": round(max(values), 4)
+    }
+
+
+def run_benchmark(deal_count: int, max_concurrency: int, profile: Dict[str, LatencyModel], seed: int = 0,
+                  use_compute: bool = True, verbose: bool = False, quorum_validators: int = 0,
+                  quorum_min_budget: float = QUORUM_MIN_BUDGET) -> Dict[str, Any]:
+    """
+    Run one benchmark and return the report
+
+    Args:
+        deal_count: Number of deals to push through the pipeline
+        max_concurrency: Maximum deals in flight
+        profile: Latency model per stand-in component
+        seed: RNG seed for reproducible latency/failure draws
+        use_compute: Route analysis/validation through 0G Compute (else inference-backed agents)
+        verbose: Show the orchestrator's own console output
+        quorum_validators: Size of the validator quorum scoring high-value deals (0 disables it)
+        quorum_min_budget: Smallest deal budget scored by the quorum
+    """
+    with tempfile.TemporaryDirectory() as workdir:
+        orchestrator = BenchmarkOrchestrator(profile, seed=seed, use_compute=use_compute,
+                                             journal_path=os.path.join(workdir, "journal.db"),
+                                             quorum_validators=quorum_validators,
+                                             quorum_min_budget=quorum_min_budget)
+        deals = [Deal(deal_id=f"bench-{index:05d}", budget=100 + index % 100) for index in range(deal_count)]
+
+        with contextlib.ExitStack() as quiet:
+            if not verbose:
+                quiet.enter_context(contextlib.redirect_stdout(io.StringIO()))
+                quiet.enter_context(contextlib.redirect_stderr(io.StringIO()))
+            setup_started = time.perf_counter()
+            orchestrator._phase_1_setup_and_identity()
+            setup_seconds = time.perf_counter() - setup_started
+
+            deals_started = time.perf_counter()
+            records = DealEngine(orchestrator._run_deal, max_concurrency=max_concurrency).run_sync(deals)
+            deals_seconds = time.perf_counter() - deals_started
+
+        orchestrator.journal.close()
+
+    step_samples: Dict[str, List[float]] = {}
+    for record in records:
+        for step, seconds in record["results"].get("step_timings", {}).items():
+            step_samples.setdefault(step, []).append(seconds)
+
+    succeeded = [record for record in records if record["success"]]
+    return {
+        "deals": deal_count,
+        "max_concurrency": max_concurrency,
+        "succeeded": len(succeeded),
+        "quorum_scored": sum(1 for record in succeeded if "validation_quorum" in record["results"]),
+        "failed": deal_count - len(succeeded),
+        "setup_seconds": round(setup_seconds, 3),
+        "deals_seconds": round(deals_seconds, 3),
+        "deals_per_second": round(deal_count / deals_seconds, 3) if deals_seconds > 0 else None,
+        "deal_latency": summarize([record["elapsed_seconds"] for record in succeeded]),
+        "setup": {
+            "bootstrap": orchestrator.results.get("bootstrap", {}),
+            "registration_latency": summarize([
+                agent.get("latency_seconds", 0) for agent in orchestrator.results.get("registration", {}).get("agents", {}).values()
+            ])
+        },
+        "steps": {step: summarize(samples) for step, samples in step_samples.items()},
+        "errors": sorted({record["error"] for record in records if record["error"]}),
+        "profile": {name: vars(model) for name, model in profile.items()}
+    }
+
+
+def check_resume(profile: Dict[str, LatencyModel], seed: int = 0, use_compute: bool = True,
+                 verbose: bool = False) -> Dict[str, Any]:
+    """
+    Journal resume round trip: crash a deal before its evidence package, then finish it
+    in a fresh orchestrator from the journaled results and checkpoints alone. Reusing
+    the deal id for a different spec, or without asking to resume, must be refused.
+
+    Returns:
+        Report with whether the first run was interrupted, whether the resumed run
+        succeeded (and its error), the steps the resumed run had to execute, and
+        whether the mismatched and unrequested resumes were refused
+    """
+    deal_id = "resume-check"
+    other_spec = Deal(deal_id=deal_id, item_type="sofa", budget=50.0)
+    with tempfile.TemporaryDirectory() as workdir:
+        journal_path = os.path.join(workdir, "journal.db")
+        with contextlib.ExitStack() as quiet:
+            if not verbose:
+                quiet.enter_context(contextlib.redirect_stdout(io.StringIO()))
+                quiet.enter_context(contextlib.redirect_stderr(io.StringIO()))
+            runs = []
+            for interrupt_step, resume, deal in (("evidence_package", False, Deal(deal_id=deal_id)),
+                                                 (None, True, Deal(deal_id=deal_id)),
+                                                 (None, True, other_spec),
+                                                 (None, False, Deal(deal_id=deal_id))):
+                orchestrator = BenchmarkOrchestrator(profile, seed=seed, use_compute=use_compute,
+                                                     journal_path=journal_path, interrupt_step=interrupt_step)
+                orchestrator.resume_deals = resume
+                orchestrator._phase_1_setup_and_identity()
+                runs.append(DealEngine(orchestrator._run_deal).run_sync([deal])[0])
+                orchestrator.journal.close()
+
+    interrupted, resumed, mismatched, unrequested = runs
+    return {
+        "interrupted": not interrupted["success"],
+        "resumed": resumed["success"],
+        "error": resumed["error"],
+        "steps_rerun": sorted(resumed["results"].get("step_timings", {})),
+        "spec_mismatch_refused": not mismatched["success"],
+        "unrequested_resume_refused": not unrequested["success"]
+    }
+
+
+def display_report(report: Dict[str, Any]):
+    """Print the benchmark report as rich tables"""
+    rprint(f"\n[bold cyan]📊 Genesis Studio Pipeline Benchmark[/bold cyan]")
+    rprint(f"   Deals: {report['succeeded']}/{report['deals']} succeeded (max {report['max_concurrency']} in flight)")
+    if report["quorum_scored"]:
+        rprint(f"   Quorum-scored deals: {report['quorum_scored']}")
+    rprint(f"   Setup (phase 1): {report['setup_seconds']:.2f}s")
+    rprint(f"   Deals: {report['deals_seconds']:.2f}s → [bold green]{report['deals_per_second']} deals/sec[/bold green]")
+
+    table = Table(title="[bold cyan]Latency Percentiles (seconds)[/bold cyan]", show_header=True, header_style="bold magenta")
+    table.add_column("Phase / Step", style="bold white")
+    for column in ("count", "mean", "p50", "p90", "p99", "max"):
+        table.add_column(column, style="yellow", justify="right")
+
+    rows = [("deal (end-to-end)", report["deal_latency"]), ("registration (per agent)", report["setup"]["registration_latency"])]
+    rows += sorted(report["steps"].items())
+    for name, stats in rows:
+        if stats.get("count"):
+            table.add_row(name, *(str(stats[column]) for column in ("count", "mean", "p50", "p90", "p99", "max")))
+    rprint(table)
+
+    for error in report["errors"]:
+        rprint(f"[red]   ❌ {error}[/red]")
+
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Offline end-to-end benchmark of the Genesis Studio pipeline")
+    parser.add_argument("--deals", type=int, default=50, help="Number of deals (default: 50)")
+    parser.add_argument("--max-concurrency", type=int, default=8, help="Maximum deals in flight (default: 8)")
+    parser.add_argument("--profile", metavar="PATH", help="JSON latency profile overriding the defaults per component")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply every stand-in latency (default: 1.0)")
+    parser.add_argument("--failure-rate", type=float, help="Failure probability applied to every component")
+    parser.add_argument("--no-compute", action="store_true", help="Use inference-backed agents instead of 0G Compute jobs")
+    parser.add_argument("--seed", type=int, default=0, help="RNG seed (default: 0)")
+    parser.add_argument("--output", metavar="PATH", help="Write the JSON report to this file")
+    parser.add_argument("--verbose", action="store_true", help="Show the orchestrator's console output")
+    parser.add_argument("--quorum", type=int, default=0, metavar="N",
+                        help="Score high-value deals with a quorum of N stand-in validators (default: off)")
+    parser.add_argument("--quorum-min-budget", type=float, default=QUORUM_MIN_BUDGET, metavar="USD",
+                        help=f"Smallest deal budget scored by the quorum (default: {QUORUM_MIN_BUDGET:g})")
+    parser.add_argument("--check-resume", action="store_true",
+                        help="Only run the journal resume round trip (interrupt a deal, resume it, "
+                             "refuse mismatched resumes) and exit")
+    args = parser.parse_args()
+
+    overrides = None
+    if args.profile:
+        with open(args.profile) as f:
+            overrides = json.load(f)
+    profile = load_profile(overrides, scale=args.scale, failure_rate=args.failure_rate)
+
+    if args.check_resume:
+        result = check_resume(profile, seed=args.seed, use_compute=not args.no_compute, verbose=args.verbose)
+        if all(result[key] for key in ("interrupted", "resumed", "spec_mismatch_refused", "unrequested_resume_refused")):
+            rprint(f"[green]✅ Resume round trip passed (re-ran: {', '.join(result['steps_rerun']) or 'nothing'})[/green]")
+            return
+        rprint(f"[red]❌ Resume round trip failed: {result}[/red]")
+        sys.exit(1)
+
+    report = run_benchmark(args.deals, args.max_concurrency, profile, seed=args.seed,
+                           use_compute=not args.no_compute, verbose=args.verbose,
+                           quorum_validators=args.quorum, quorum_min_budget=args.quorum_min_budget)
+    display_report(report)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, default=str)
+        rprint(f"[green]✅ Report written to {args.output}[/green]")
+
+
+if __name__ == "__main__":
+    main()
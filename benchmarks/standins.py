@@ -0,0 +1,428 @@
+"""
+Genesis Studio Benchmarks - Local Stand-in Providers
+
+In-process replacements for everything the orchestrator normally reaches over
+the network: the 0G Compute and 0G Storage gRPC sidecars, 0G Inference, the
+ERC-8004 IdentityRegistry (and the Web3 calls around it), AP2 mandates and
+x402 payments. Each stand-in draws its latency and failures from a
+LatencyModel, so a benchmark can model a fast LAN sidecar, a congested
+testnet or a flaky provider without any live infrastructure.
+"""
+
+import hashlib
+import itertools
+import json
+import random
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple
+
+from chaoschain_sdk.types import IntegrityProof, PaymentMethod, PaymentProof
+
+
+class StandInFailure(Exception):
+    """Failure injected by a stand-in provider"""
+
+
+@dataclass
+class LatencyModel:
+    """Log-normal latency with an independent failure probability
+
+    Args:
+        median: Median latency in seconds
+        sigma: Log-normal shape (0 = constant latency, ~0.5 = long tail)
+        failure_rate: Probability that an operation fails
+    """
+    median: float = 0.05
+    sigma: float = 0.3
+    failure_rate: float = 0.0
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw one latency in seconds"""
+        if self.sigma <= 0:
+            return self.median
+        return rng.lognormvariate(0.0, self.sigma) * self.median
+
+    def fails(self, rng: random.Random) -> bool:
+        """Decide whether this operation fails"""
+        return rng.random() < self.failure_rate
+
+    def scaled(self, factor: float) -> "LatencyModel":
+        """Same distribution with every latency multiplied by factor"""
+        return LatencyModel(self.median * factor, self.sigma, self.failure_rate)
+
+
+# Default profile: rough shape of a 0G testnet deployment with a local sidecar
+DEFAULT_PROFILE: Dict[str, LatencyModel] = {
+    "compute": LatencyModel(median=2.0, sigma=0.4, failure_rate=0.02),
+    "storage": LatencyModel(median=0.6, sigma=0.3, failure_rate=0.01),
+    "inference": LatencyModel(median=1.5, sigma=0.4, failure_rate=0.0),
+    "payment": LatencyModel(median=0.8, sigma=0.3, failure_rate=0.0),
+    "chain": LatencyModel(median=0.25, sigma=0.3, failure_rate=0.0),
+    "ap2": LatencyModel(median=0.01, sigma=0.2, failure_rate=0.0),
+}
+
+
+def load_profile(overrides: Optional[Dict[str, Dict[str, float]]] = None, scale: float = 1.0,
+                 failure_rate: Optional[float] = None) -> Dict[str, LatencyModel]:
+    """
+    Build a latency profile from the defaults
+
+    Args:
+        overrides: Component -> {median, sigma, failure_rate} replacing default values
+        scale: Multiplier applied to every latency (e.g. 0.01 for a quick smoke run)
+        failure_rate: Failure probability applied to every component (overrides the rest)
+    """
+    profile = {}
+    for component, model in DEFAULT_PROFILE.items():
+        values = {"median": model.median, "sigma": model.sigma, "failure_rate": model.failure_rate}
+        values.update((overrides or {}).get(component, {}))
+        if failure_rate is not None:
+            values["failure_rate"] = failure_rate
+        profile[component] = LatencyModel(**values).scaled(scale)
+    return profile
+
+
+class _StandIn:
+    """Shared latency/failure plumbing with a per-instance seeded RNG"""
+
+    def __init__(self, model: LatencyModel, seed: Optional[int] = None):
+        self.model = model
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self.calls = 0
+        self.failures = 0
+
+    def _draw(self) -> Tuple[float, bool]:
+        with self._rng_lock:
+            self.calls += 1
+            latency, failed = self.model.sample(self._rng), self.model.fails(self._rng)
+            if failed:
+                self.failures += 1
+            return latency, failed
+
+    def _delay(self, operation: str):
+        """Sleep for one sampled latency and raise if a failure was drawn"""
+        latency, failed = self._draw()
+        time.sleep(latency)
+        if failed:
+            raise StandInFailure(f"{operation} failed (injected)")
+
+
+# === 0G providers ===
+
+class StandInCompute(_StandIn):
+    """Stand-in for ZeroGComputeGRPC: jobs complete after a sampled latency"""
+
+    is_available = True
+
+    def __init__(self, model: LatencyModel, seed: Optional[int] = None):
+        super().__init__(model, seed)
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._by_key: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, task: Dict[str, Any], *, verification: Any = None, idempotency_key: Optional[str] = None) -> str:
+        with self._lock:
+            if idempotency_key and idempotency_key in self._by_key:
+                return self._by_key[idempotency_key]
+        latency, failed = self._draw()
+        job_id = f"job_{uuid.uuid4().hex[:12]}"
+        with self._lock:
+            self._jobs[job_id] = {"task": task, "ready_at": time.monotonic() + latency, "failed": failed}
+            if idempotency_key:
+                self._by_key[idempotency_key] = job_id
+        return job_id
+
+    def status(self, job_id: str) -> Dict[str, Any]:
+        job = self._jobs.get(job_id)
+        if job is None:
+            return {"state": "failed", "error": "unknown job"}
+        if time.monotonic() < job["ready_at"]:
+            return {"state": "running"}
+        return {"state": "failed" if job["failed"] else "completed"}
+
+    def result(self, job_id: str, *, timeout: int = 300) -> Any:
+        job = self._jobs[job_id]
+        task_type = job["task"].get("task_type", "")
+        output = _validation_output() if task_type == "quality_validation" else _shopping_output(job["task"])
+        return SimpleNamespace(
+            success=not job["failed"],
+            output={"output": json.dumps(output)},
+            execution_hash=hashlib.sha256(f"{job_id}:{task_type}".encode()).hexdigest(),
+            verification_method="tee-ml",
+            error="injected failure" if job["failed"] else None
+        )
+
+    def cancel(self, job_id: str) -> bool:
+        return self._jobs.pop(job_id, None) is not None
+
+
+class StandInStorage(_StandIn):
+    """Stand-in for ZeroGStorageGRPC: content-addressed puts with sampled latency"""
+
+    is_available = True
+
+    def put(self, blob: bytes, *, mime: str = "application/json", tags: Optional[Dict[str, str]] = None,
+            idempotency_key: Optional[str] = None) -> Any:
+        latency, failed = self._draw()
+        time.sleep(latency)
+        root_hash = "0x" + hashlib.sha256(blob).hexdigest()
+        if failed:
+            return SimpleNamespace(success=False, error="injected storage failure", hash=None, uri=None, metadata={})
+        return SimpleNamespace(
+            success=True,
+            error=None,
+            hash=root_hash,
+            uri=f"0g://object/{root_hash[2:18]}",
+            metadata={"root_hash": root_hash, "tx_hash": "0x" + uuid.uuid4().hex}
+        )
+
+
+class StandInInference(_StandIn):
+    """Stand-in for ZeroGInference.chat_completion -> (text, tee_proof)"""
+
+    def chat_completion(self, messages: List[Dict[str, str]], temperature: float = 0.7,
+                        max_tokens: Optional[int] = None, stream: bool = False) -> Tuple[str, Dict[str, Any]]:
+        self._delay("chat_completion")
+        prompt = messages[-1]["content"] if messages else ""
+        text = json.dumps(_validation_output() if "validat" in prompt.lower() else _shopping_output({}))
+        proof = {"provider": "standin-tee", "request_hash": hashlib.sha256(prompt.encode()).hexdigest()}
+        return text, proof
+
+
+def _shopping_output(task: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "product_name": "Stand-in Alpine Jacket",
+        "price": 129.99,
+        "color": "green",
+        "quality_score": 88,
+        "value_score": 84,
+        "confidence": 0.9,
+        "alternatives": ["Stand-in Trail Jacket"]
+    }
+
+
+def _validation_output() -> Dict[str, Any]:
+    return {"completeness_score": 90, "accuracy_score": 86, "value_score": 82, "overall_score": 87}
+
+
+# === ERC-8004 IdentityRegistry and Web3 ===
+
+class StandInChain(_StandIn):
+    """Minimal Web3 + IdentityRegistry stand-in shared by every agent
+
+    Supports the calls made by StandInSDK.register_identity and WalletProbe: balances, pending
+    nonces, gas price, signing, raw transaction submission, receipts and the
+    register(string) / balanceOf / tokenOfOwnerByIndex registry functions.
+    """
+
+    def __init__(self, model: LatencyModel, seed: Optional[int] = None, starting_balance: float = 1.0):
+        super().__init__(model, seed)
+        self._lock = threading.Lock()
+        self._nonces: Dict[str, int] = {}
+        self._owners: Dict[str, List[int]] = {}
+        self._receipts: Dict[str, Any] = {}
+        self._agent_ids = itertools.count(1)
+        self.starting_balance = starting_balance
+
+        chain = self
+        self.w3 = SimpleNamespace(eth=SimpleNamespace(
+            gas_price=1_000_000_000,
+            get_balance=lambda address: int(chain.starting_balance * 10 ** 18),
+            get_transaction_count=chain._get_transaction_count,
+            send_raw_transaction=chain._send_raw_transaction,
+            wait_for_transaction_receipt=chain._wait_for_receipt,
+            account=SimpleNamespace(sign_transaction=lambda tx, key: SimpleNamespace(raw_transaction=tx))
+        ))
+        self.identity_registry = SimpleNamespace(
+            functions=_RegistryFunctions(self),
+            events=SimpleNamespace(Registered=lambda: SimpleNamespace(process_receipt=lambda receipt: receipt.logs))
+        )
+
+    def _get_transaction_count(self, address: str, block: str = "latest") -> int:
+        with self._lock:
+            return self._nonces.get(address.lower(), 0)
+
+    def _send_raw_transaction(self, tx: Dict[str, Any]) -> Any:
+        self._delay("send_raw_transaction")
+        address = tx["from"].lower()
+        with self._lock:
+            expected = self._nonces.get(address, 0)
+            if tx["nonce"] != expected:
+                raise StandInFailure(f"nonce too low/high: got {tx['nonce']}, expected {expected}")
+            self._nonces[address] = expected + 1
+            agent_id = next(self._agent_ids)
+            self._owners.setdefault(address, []).append(agent_id)
+            tx_hash = "0x" + uuid.uuid4().hex
+            self._receipts[tx_hash] = SimpleNamespace(status=1, logs=[{"args": {"agentId": agent_id}}])
+        return SimpleNamespace(hex=lambda: tx_hash, value=tx_hash)
+
+    def _wait_for_receipt(self, tx_hash: Any, timeout: float = 120) -> Any:
+        self._delay("wait_for_transaction_receipt")
+        return self._receipts[tx_hash.value]
+
+
+class _RegistryFunctions(dict):
+    """Contract function namespace supporting both attribute and signature lookup"""
+
+    def __init__(self, chain: StandInChain):
+        super().__init__({"register(string)": self._register})
+        self.chain = chain
+
+    def _call(self, value: Any) -> Any:
+        return SimpleNamespace(call=lambda: value)
+
+    def balanceOf(self, address: str) -> Any:
+        return self._call(len(self.chain._owners.get(address.lower(), [])))
+
+    def tokenOfOwnerByIndex(self, address: str, index: int) -> Any:
+        return self._call(self.chain._owners[address.lower()][index])
+
+    def _register(self, token_uri: str) -> Any:
+        return SimpleNamespace(
+            estimate_gas=lambda tx: 150_000,
+            build_transaction=lambda tx: dict(tx, data=token_uri)
+        )
+
+
+# === Agents and SDKs ===
+
+@dataclass
+class StandInEvidencePackage:
+    """Shape-compatible replacement for the SDK's EvidencePackage"""
+    package_id: str
+    work_proof: Dict[str, Any]
+    payment_proofs: List[Any] = field(default_factory=list)
+
+
+class StandInSDK:
+    """Stand-in for ChaosChainAgentSDK covering the calls the orchestrator makes"""
+
+    def __init__(self, agent_name: str, agent_role: str, chain: StandInChain,
+                 payment: LatencyModel, ap2: LatencyModel, seed: Optional[int] = None):
+        self.agent_name = agent_name
+        self.agent_role = agent_role
+        self.wallet_address = "0x" + hashlib.sha256(agent_name.encode()).hexdigest()[:40]
+        self.process_integrity = True
+        self._payment = _StandIn(payment, seed)
+        self._ap2 = _StandIn(ap2, None if seed is None else seed + 1)
+
+        sdk = self
+        self.wallet_manager = SimpleNamespace(
+            w3=chain.w3,
+            wallets={agent_name: SimpleNamespace(key=b"standin", address=self.wallet_address)},
+            get_wallet_address=lambda name: sdk.wallet_address
+        )
+        self.chaos_agent = SimpleNamespace(
+            agent_name=agent_name,
+            address=self.wallet_address,
+            w3=chain.w3,
+            identity_registry=chain.identity_registry,
+            wallet_manager=self.wallet_manager,
+            agent_id=None
+        )
+        self.chaos_agent.set_cached_agent_id = lambda agent_id: setattr(self.chaos_agent, "agent_id", agent_id)
+        self.google_ap2_integration = SimpleNamespace(verify_jwt_token=lambda token: {"verified": True})
+
+    def get_agent_id(self) -> Optional[int]:
+        return self.chaos_agent.agent_id
+
+    def register_identity(self) -> Tuple[int, str]:
+        """Same sequence as the SDK: existing-registration check, register(string), receipt, Registered event"""
+        agent = self.chaos_agent
+        registry = agent.identity_registry
+        if registry.functions.balanceOf(agent.address).call() > 0:
+            agent.agent_id = registry.functions.tokenOfOwnerByIndex(agent.address, 0).call()
+            return agent.agent_id, "already_registered"
+
+        contract_call = registry.functions['register(string)'](f"data:application/json,{{\"name\": \"{self.agent_name}\"}}")
+        transaction = contract_call.build_transaction({
+            'from': agent.address,
+            'gas': int(contract_call.estimate_gas({'from': agent.address}) * 1.2),
+            'gasPrice': agent.w3.eth.gas_price,
+            'nonce': agent.w3.eth.get_transaction_count(agent.address)
+        })
+        signed = agent.w3.eth.account.sign_transaction(transaction, self.wallet_manager.wallets[self.agent_name].key)
+        tx_hash = agent.w3.eth.send_raw_transaction(signed.raw_transaction)
+        receipt = agent.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+        agent.agent_id = registry.events.Registered().process_receipt(receipt)[0]['args']['agentId']
+        return agent.agent_id, tx_hash.hex()
+
+    def execute_payment(self, to_agent: str, amount: float, service_type: str = "service") -> PaymentProof:
+        self._payment._delay("execute_payment")
+        tx_hash = "0x" + uuid.uuid4().hex
+        return PaymentProof(
+            payment_id=f"pay_{uuid.uuid4().hex[:12]}",
+            from_agent=self.agent_name,
+            to_agent=to_agent,
+            amount=amount,
+            currency="A0GI",
+            payment_method=PaymentMethod.A2A_X402,
+            transaction_hash=tx_hash,
+            timestamp=datetime.now(),
+            receipt_data={"protocol_fee": amount * 0.025, "net_amount": amount * 0.975, "service_type": service_type}
+        )
+
+    def create_intent_mandate(self, **kwargs) -> Any:
+        self._ap2._delay("create_intent_mandate")
+        return SimpleNamespace(success=True, intent_mandate=kwargs, error=None)
+
+    def create_cart_mandate(self, cart_id: str, **kwargs) -> Any:
+        self._ap2._delay("create_cart_mandate")
+        return SimpleNamespace(cart_id=cart_id, merchant_authorization="standin.jwt", **kwargs)
+
+    def request_validation(self, validator_agent_id: int, data_hash: str) -> str:
+        return "0x" + uuid.uuid4().hex
+
+    def submit_validation_response(self, data_hash: str, score: int) -> str:
+        return "0x" + uuid.uuid4().hex
+
+    def store_evidence(self, data: Dict[str, Any], evidence_type: str = "evidence") -> str:
+        return "bafy" + hashlib.sha256(json.dumps(data, default=str).encode()).hexdigest()[:40]
+
+    def create_evidence_package(self, work_proof: Dict[str, Any], payment_proofs: List[Any]) -> StandInEvidencePackage:
+        return StandInEvidencePackage(package_id=f"pkg_{uuid.uuid4().hex[:12]}", work_proof=work_proof,
+                                      payment_proofs=list(payment_proofs))
+
+
+class StandInAgent:
+    """Stand-in for the Alice/Bob/Charlie agent wrappers, backed by StandInInference"""
+
+    def __init__(self, agent_name: str, agent_role: str, sdk: StandInSDK, inference: StandInInference):
+        self.agent_name = agent_name
+        self.agent_domain = f"{agent_name.lower()}.standin.local"
+        self.agent_role = agent_role
+        self.network = SimpleNamespace(value="standin")
+        self.sdk = sdk
+        self.inference = inference
+
+    def _integrity_proof(self, function_name: str, text: str) -> IntegrityProof:
+        return IntegrityProof(
+            proof_id=f"proof_{uuid.uuid4().hex[:12]}",
+            function_name=function_name,
+            code_hash=hashlib.sha256(function_name.encode()).hexdigest(),
+            execution_hash=hashlib.sha256(text.encode()).hexdigest(),
+            timestamp=datetime.now(),
+            agent_name=self.agent_name,
+            verification_status="verified"
+        )
+
+    def generate_smart_shopping_analysis(self, item_type: str, color: str, budget: float,
+                                         premium_tolerance: float = 0.20) -> Dict[str, Any]:
+        text, _ = self.inference.chat_completion(
+            [{"role": "user", "content": f"Find the best {item_type} in {color} under ${budget}"}], temperature=0.4
+        )
+        analysis = dict(json.loads(text), item_type=item_type, color_requested=color, budget=budget)
+        return {"analysis": analysis, "process_integrity_proof": self._integrity_proof("smart_shopping_analysis", text)}
+
+    def validate_analysis_with_crewai(self, analysis_data: Dict[str, Any], on_partial=None) -> Dict[str, Any]:
+        text, _ = self.inference.chat_completion(
+            [{"role": "user", "content": f"Validate this analysis: {str(analysis_data)[:200]}"}], temperature=0.3
+        )
+        validation = json.loads(text)
+        return {"validation": validation, "process_integrity_proof": self._integrity_proof("validate_analysis", text)}
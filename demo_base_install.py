@@ -41,6 +41,18 @@ console = Console()
 if "BASE_SEPOLIA_RPC_URL" not in os.environ:
     os.environ["BASE_SEPOLIA_RPC_URL"] = "https://sepolia.base.org"
 
+# One wallet probe for the whole demo, so its TTL cache is shared between demos
+_wallet_probe = None
+
+
+def get_wallet_probe(w3):
+    """Return the demo's shared WalletProbe, creating it on first use."""
+    global _wallet_probe
+    if _wallet_probe is None:
+        from studio.wallet_probe import WalletProbe
+        _wallet_probe = WalletProbe(w3)
+    return _wallet_probe
+
 
 def print_header():
     """Print demo header."""
@@ -89,13 +101,13 @@ def demo_1_wallet_creation():
     table.add_row("Address", sdk.wallet_address)
     table.add_row("Network", "Base Sepolia (Chain ID: 84532)")
     
-    # Get balance from wallet manager
-    try:
-        balance = sdk.wallet_manager.w3.eth.get_balance(sdk.wallet_address)
-        balance_eth = sdk.wallet_manager.w3.from_wei(balance, 'ether')
-        table.add_row("Balance", f"{balance_eth:.4f} ETH")
-    except Exception as e:
-        table.add_row("Balance", f"Unable to fetch ({e})")
+    # Get balance and nonce in one batched RPC round trip
+    status = get_wallet_probe(sdk.wallet_manager.w3).probe({sdk.agent_name: sdk.wallet_address})[sdk.agent_name]
+    if status["error"] or status["balance"] is None:
+        table.add_row("Balance", f"Unable to fetch ({status['error']})")
+    else:
+        table.add_row("Balance", f"{status['balance']:.4f} ETH")
+        table.add_row("Nonce", str(status["nonce"]))
     
     console.print(table)
     
@@ -136,7 +148,9 @@ def demo_2_erc8004_identity(sdk):
         if "insufficient funds" in error_str or "balance 0" in error_str:
             console.print("⚠️  Wallet needs testnet ETH for gas fees")
             console.print(f"   Wallet: [cyan]{sdk.wallet_address}[/cyan]")
-            console.print(f"   Balance: [yellow]0.0000 ETH[/yellow]")
+            # Served from the probe's cache when Demo 1 checked this wallet moments ago
+            status = get_wallet_probe(sdk.wallet_manager.w3).probe({sdk.agent_name: sdk.wallet_address})[sdk.agent_name]
+            console.print(f"   Balance: [yellow]{status['balance'] or 0:.4f} ETH[/yellow]")
         elif "already registered" in error_str or "revert" in error_str:
             console.print("✅ Agent already registered!")
             console.print(f"   Wallet: [cyan]{sdk.wallet_address}[/cyan]")
@@ -146,8 +146,13 @@ import os
 import sys
 import json
 import time
+import argparse
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, Optional
+from functools import partial
+from typing import Dict, Any, Optional, Iterable, List, TextIO
 from rich.panel import Panel
 
 from dotenv import load_dotenv
@@ -159,43 +164,117 @@ from chaoschain_sdk import ChaosChainAgentSDK, NetworkConfig
 from chaoschain_sdk.types import AgentRole
 
 # Import agents
+from agents.max_tokens import MaxTokensController
+from agents.prompts import count_tokens
 from agents.server_agent_sdk import GenesisServerAgentSDK
 from agents.validator_agent_sdk import GenesisValidatorAgentSDK
+from agents.validation_quorum import ValidatorQuorum
 from agents.client_agent_genesis import GenesisClientAgent
 
+# Import orchestration helpers
+from studio.deals import Deal, load_deals, new_run_id
+from studio.deal_engine import DealEngine
+from studio.job_watcher import JobWatcher
+from studio.journal import DealJournal, JournaledResults
+from studio.registration import BulkRegistrar
+from studio.wallet_probe import WalletProbe
+from studio.step_graph import Step, StepGraph
+
 # Load environment variables
 load_dotenv()
 
+# Default wallet storage file used by the ChaosChain SDK wallet manager
+WALLET_FILE = "chaoschain_wallets.json"
+
+# Deal journal location and the journal key for results that belong to no single deal
+DEFAULT_JOURNAL_PATH = "genesis_journal.db"
+SETUP_JOURNAL_ID = "setup"
+
+# Journal step prefix for step-graph checkpoints (outputs of each completed step)
+CHECKPOINT_PREFIX = "checkpoint."
+
+# Journal step holding the spec a deal was started with (a resume must match it)
+SPEC_JOURNAL_STEP = "deal.spec"
+
+# max_tokens per 0G Compute task type until enough output lengths have been observed
+COMPUTE_MAX_TOKENS = {"smart_shopping_analysis": 600, "quality_validation": 500}
+
+# Smallest deal budget (USD) that counts as high-value and gets a validator quorum (when enabled)
+QUORUM_MIN_BUDGET = 500.0
+
 class GenesisStudioX402Orchestrator:
     """Enhanced Genesis Studio orchestrator with x402 payment integration"""
     
-    def __init__(self):
-        # Track results for final summary
-        self.results = {}
+    def __init__(self, journal_path: Optional[str] = None, quorum_validators: int = 0,
+                 quorum_min_budget: float = QUORUM_MIN_BUDGET):
+        """
+        Initialize the orchestrator
+        
+        Args:
+            journal_path: SQLite file for the durable deal journal (defaults to $GENESIS_JOURNAL_PATH or genesis_journal.db)
+            quorum_validators: Independent 0G validators that also score high-value deals (0 = no quorum)
+            quorum_min_budget: Deal budget (USD) from which a deal is scored by the quorum
+        """
+        # Durable journal of every result, keyed by deal id and step
+        self.journal = DealJournal(journal_path or os.getenv("GENESIS_JOURNAL_PATH", DEFAULT_JOURNAL_PATH))
+        
+        # Setup results (bootstrap, wallets, funding, registration) shared by all deals
+        self.results = JournaledResults(self.journal, SETUP_JOURNAL_ID)
+        
+        # Per-deal results when running several deals concurrently
+        self.deal_results = {}
+        
+        # Charlie pays for every deal from one wallet; serialize its transfers
+        # so concurrent deals don't race for the same nonce
+        self._payment_lock = threading.Lock()
         
         # Agent SDK instances
         self.alice_sdk = None  # Server Agent
         self.bob_sdk = None    # Validator Agent
         self.charlie_sdk = None # Client Agent
+        
+        # Shared watcher for outstanding 0G Compute jobs
+        self.job_watcher = None
+        
+        # max_tokens for 0G Compute tasks, learned from their output lengths across deals
+        self.max_tokens_controller = MaxTokensController(defaults=COMPUTE_MAX_TOKENS)
+        
+        # Batched wallet balance/nonce probe (created once the SDKs exist)
+        self.wallet_probe = None
+        
+        # Continue deals that already have journaled results (only when asked, e.g. --resume)
+        self.resume_deals = False
+        
+        # Optional validator quorum for high-value deals (built with the agents)
+        self.quorum_validators = quorum_validators
+        self.quorum_min_budget = quorum_min_budget
+        self.validator_quorum = None
     
-    def run_complete_demo(self):
-        """Execute the complete Genesis Studio x402 demonstration"""
+    def run_complete_demo(self, resume_deal_id: Optional[str] = None):
+        """
+        Execute the complete Genesis Studio x402 demonstration
+        
+        Args:
+            resume_deal_id: Id of an interrupted demo deal to resume from the journal
+        """
         
         try:
             self._print_banner()
             
+            # The classic demo is a single deal whose journaled results feed the final summary
+            deal = Deal(deal_id=resume_deal_id or datetime.now().strftime("demo-%Y%m%d-%H%M%S"))
+            self.resume_deals = resume_deal_id is not None
+            rprint(f"[blue]📒 Deal id: {deal.deal_id} (resume with --resume {deal.deal_id})[/blue]")
+            
             # Phase 1: Setup & On-Chain Identity
             self._phase_1_setup_and_identity()
             
-            # Phase 2: x402 Enhanced Work & Payment Flow
-            self._phase_2_x402_work_and_payment()
-            
-            # Phase 3: Enhanced Evidence Packages with Payment Proofs
-            self._phase_3_enhanced_evidence_packages()
-            
+            # Phase 2 & 3: x402 Work & Payment Flow and Enhanced Evidence Packages,
+            # scheduled as a dependency graph so independent steps overlap
+            asyncio.run(self._run_deal(deal))
             
             # Final Summary
-            self._display_final_summary()
+            self._display_final_summary(deal.deal_id)
             
         except KeyboardInterrupt:
             rprint("[yellow]⚠️  Demo interrupted by user[/yellow]")
@@ -207,6 +286,194 @@ class GenesisStudioX402Orchestrator:
             rprint(f"[red]❌ Demo failed with unexpected error: {e}[/red]")
             sys.exit(1)
     
+    def run_concurrent_deals(self, deals: Iterable[Deal], max_concurrency: int = 4,
+                             resume: bool = False) -> List[Dict[str, Any]]:
+        """
+        Execute many independent deals concurrently with the same Alice/Bob/Charlie agents
+        
+        Phase 1 (setup, funding, registration) runs once; phases 2 and 3 run per deal
+        on the DealEngine, bounded by max_concurrency.
+        
+        Args:
+            deals: Deals to execute
+            max_concurrency: Maximum number of deals in flight at the same time
+            resume: Continue deals that already have journaled results (same id and spec)
+            
+        Returns:
+            List of per-deal records in input order
+        """
+        self.resume_deals = resume
+        self._print_banner()
+        self._phase_1_setup_and_identity()
+        
+        rprint(f"\n[bold blue]📋 Concurrent Deals (max {max_concurrency} in flight)[/bold blue]")
+        rprint("=" * 80)
+        
+        engine = DealEngine(self._run_deal, max_concurrency=max_concurrency)
+        started = time.perf_counter()
+        records = engine.run_sync(deals)
+        elapsed = time.perf_counter() - started
+        
+        self._display_deal_engine_summary(records, elapsed)
+        return records
+    
+    def run_deal_stream(self, deals: Iterable[Deal], output: TextIO, max_concurrency: int = 4,
+                        resume: bool = False) -> Dict[str, Any]:
+        """
+        Stream a (possibly unbounded) workload of deals through the pipeline
+        
+        Deals are read lazily and at most max_concurrency are in memory at once. One
+        JSON record per deal is written to output as soon as that deal completes.
+        
+        Args:
+            deals: Deals to execute (consumed lazily, e.g. load_deals(sys.stdin))
+            output: Text stream receiving one JSON line per completed deal
+            max_concurrency: Maximum number of deals in flight at the same time
+            resume: Continue deals that already have journaled results (same id and spec)
+            
+        Returns:
+            Run summary (deals, succeeded, failed, elapsed_seconds, deals_per_second)
+        """
+        self.resume_deals = resume
+        self._print_banner()
+        self._phase_1_setup_and_identity()
+        
+        rprint(f"\n[bold blue]📋 Streaming Deals (max {max_concurrency} in flight)[/bold blue]")
+        rprint("=" * 80)
+        
+        summary = {"deals": 0, "succeeded": 0, "failed": 0}
+        
+        def _write_record(record: Dict[str, Any]):
+            output.write(json.dumps(self._deal_output_record(record), default=str) + "\n")
+            output.flush()
+            
+            # Drop the deal's in-memory state once its record is written
+            self.deal_results.pop(record["deal_id"], None)
+            summary["deals"] += 1
+            summary["succeeded" if record["success"] else "failed"] += 1
+        
+        engine = DealEngine(self._run_deal, max_concurrency=max_concurrency)
+        started = time.perf_counter()
+        engine.stream_sync(deals, _write_record)
+        elapsed = time.perf_counter() - started
+        
+        summary["elapsed_seconds"] = round(elapsed, 3)
+        summary["deals_per_second"] = round(summary["deals"] / elapsed, 3) if elapsed > 0 else None
+        
+        rprint(f"\n[blue]   Deals: {summary['succeeded']}/{summary['deals']} succeeded in {elapsed:.1f}s[/blue]")
+        if summary["deals_per_second"] is not None:
+            rprint(f"[blue]   Throughput: {summary['deals_per_second']:.3f} deals/sec[/blue]")
+        return summary
+    
+    def _deal_output_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Compact, JSON-serializable result record for one streamed deal"""
+        results = record["results"]
+        validation = results.get("validation", {})
+        payment = results.get("0g_payment", {})
+        return {
+            "deal_id": record["deal_id"],
+            "spec": record["spec"],
+            "success": record["success"],
+            "error": record["error"],
+            "elapsed_seconds": record["elapsed_seconds"],
+            "validation_score": validation.get("overall_score", validation.get("score")),
+            "quorum_score": (results.get("validation_quorum") or {}).get("overall_score"),
+            "analysis_root_hash": results.get("storage_analysis", {}).get("root_hash"),
+            "evidence_root_hash": results.get("enhanced_evidence", {}).get("root_hash"),
+            "payment": {
+                "amount": payment.get("amount"),
+                "tx_hash": getattr(payment.get("x402_payment_result"), "transaction_hash", None)
+            } if payment else None,
+            "step_timings": results.get("step_timings", {})
+        }
+    
+    async def _run_deal(self, deal: Deal) -> Dict[str, Any]:
+        """Run phases 2 and 3 for one deal, keeping its results separate"""
+        self._validator_agent(deal)  # Fail fast on an unknown validator
+        if not isinstance(deal.results, JournaledResults):
+            deal.results = JournaledResults(self.journal, deal.deal_id, deal.results)
+        self.deal_results[deal.deal_id] = deal.results
+        
+        # Resume from the journal: restore results and the outputs of completed steps
+        checkpoints = await asyncio.to_thread(self._restore_deal, deal)
+        self._print_phase_2_header()
+        
+        graph = self._build_deal_graph(deal)
+        await graph.run(checkpoints)
+        if graph.skipped:
+            rprint(f"[cyan]♻️  Deal {deal.deal_id} resumed - skipped completed steps: {', '.join(graph.skipped)}[/cyan]")
+        
+        deal.results["step_timings"] = graph.timings
+        return deal.results
+    
+    def _restore_deal(self, deal: Deal) -> Dict[str, Any]:
+        """
+        Reload a deal's journaled results and return the outputs of its completed steps
+        
+        Intermediate results (compute job ids, storage root hashes, payment proofs)
+        are restored into deal.results so partially finished steps reuse them. A new
+        deal has its spec journaled instead. A deal id that is already journaled is only
+        resumed when resume_deals is set and the journaled spec matches; otherwise the
+        deal fails rather than picking up another deal's results and payments.
+        """
+        journaled = self.journal.latest(deal.deal_id)
+        if not journaled:
+            self.journal.append(deal.deal_id, SPEC_JOURNAL_STEP, deal.spec)
+            return {}
+        
+        if not self.resume_deals:
+            raise ValueError(f"Deal {deal.deal_id} already has journaled results; "
+                             f"resume it explicitly (--resume) or use a new deal id")
+        journaled_spec = journaled.pop(SPEC_JOURNAL_STEP, None)
+        if journaled_spec != deal.spec:
+            raise ValueError(f"Deal {deal.deal_id} was journaled with spec {journaled_spec}, "
+                             f"refusing to resume it as {deal.spec}")
+        
+        checkpoints = {}
+        for step, value in journaled.items():
+            if step.startswith(CHECKPOINT_PREFIX):
+                checkpoints.update(value)
+        deal.results.restore({step: value for step, value in journaled.items() if not step.startswith(CHECKPOINT_PREFIX)})
+        
+        rprint(f"[cyan]♻️  Deal {deal.deal_id}: found {len(journaled)} journaled results, resuming[/cyan]")
+        return checkpoints
+    
+    def _checkpoint_step(self, deal: Deal, step_name: str, outputs: Dict[str, Any]):
+        """Journal a completed step's outputs so a restarted deal can skip it"""
+        self.journal.append(deal.deal_id, CHECKPOINT_PREFIX + step_name, outputs)
+    
+    def _display_deal_engine_summary(self, records: List[Dict[str, Any]], elapsed: float):
+        """Display per-deal outcomes and overall throughput of a concurrent run"""
+        table = Table(title="[bold cyan]Concurrent Deal Results[/bold cyan]", show_header=True, header_style="bold magenta")
+        table.add_column("Deal", style="bold white")
+        table.add_column("Status", style="bold")
+        table.add_column("Validation Score", style="cyan")
+        table.add_column("Time (s)", style="yellow")
+        
+        for record in records:
+            validation = record["results"].get("validation", {})
+            score = validation.get("overall_score", validation.get("score", "N/A"))
+            table.add_row(
+                record["deal_id"],
+                "[green]✅ SUCCESS[/green]" if record["success"] else f"[red]❌ {record['error'][:40]}[/red]",
+                str(score),
+                f"{record['elapsed_seconds']:.1f}"
+            )
+        
+        rprint(table)
+        
+        succeeded = sum(1 for record in records if record["success"])
+        rprint(f"[blue]   Deals: {succeeded}/{len(records)} succeeded in {elapsed:.1f}s[/blue]")
+        if elapsed > 0:
+            rprint(f"[blue]   Throughput: {len(records) / elapsed:.3f} deals/sec[/blue]")
+    
+    def _validator_agent(self, deal: Deal) -> Any:
+        """Resolve the validator agent requested by a deal"""
+        validators = {"Bob": self.bob_agent}
+        if deal.validator not in validators:
+            raise ValueError(f"Unknown validator '{deal.validator}' (available: {', '.join(validators)})")
+        return validators[deal.validator]
+    
     def _print_banner(self):
         """Print Genesis Studio banner"""
         banner = """
@@ -258,59 +525,110 @@ class GenesisStudioX402Orchestrator:
         self._register_agents_onchain()
         rprint("[green]✅ Agents registered on-chain[/green]")
     
-    def _phase_2_x402_work_and_payment(self):
+    def _build_deal_graph(self, deal: Deal) -> StepGraph:
+        """
+        Express phases 2 and 3 of one deal as a dependency graph of steps
+        
+        Storage (Step 7), the A0GI payment (Step 8) and Bob's validation only depend on
+        Alice's analysis, so they start together as soon as it is ready. The evidence
+        package waits for all three and is built from the same results as before.
+        """
+        return StepGraph([
+            Step("ap2_intent", partial(self._step_ap2_intent, deal),
+                 outputs=("intent_mandate",)),
+            Step("smart_shopping", partial(self._step_smart_shopping, deal),
+                 outputs=("analysis_data", "process_integrity_proof")),
+            Step("analysis_storage", partial(self._step_store_analysis, deal),
+                 inputs=("analysis_data", "process_integrity_proof"), outputs=("analysis_cid",)),
+            Step("analysis_payment", partial(self._step_analysis_payment, deal),
+                 inputs=("analysis_data", "intent_mandate"), outputs=("payment_results",)),
+            Step("validation", partial(self._step_validation, deal),
+                 inputs=("analysis_data",), outputs=("validation_result",)),
+            Step("validation_quorum", partial(self._step_validation_quorum, deal),
+                 inputs=("analysis_data",), outputs=("quorum_result",)),
+            Step("evidence_package", partial(self._step_evidence_package, deal),
+                 inputs=("analysis_cid", "payment_results", "validation_result", "quorum_result"),
+                 outputs=("evidence_package",)),
+            Step("evidence_storage", partial(self._step_store_evidence, deal),
+                 inputs=("evidence_package",), outputs=("enhanced_evidence_cid",)),
+        ], on_complete=partial(self._checkpoint_step, deal))
+    
+    def _print_phase_2_header(self):
         """Phase 2: Triple-Verified Stack Work & Payment"""
         
         rprint("\n[bold blue]📋 Phase 2: Triple-Verified Stack Work & Payment[/bold blue]")
         rprint("[cyan]Alice performs smart shopping with AP2 intent verification, ChaosChain process integrity (0G Compute), and x402 payments (A0GI)[/cyan]")
         rprint("=" * 80)
-        
-        # Step 5: AP2 Intent Verification
+    
+    def _step_ap2_intent(self, deal: Deal) -> Any:
+        """Step 5: AP2 Intent Verification"""
         rprint("\n[blue]🔧 Step 5: Creating AP2 intent mandate for smart shopping...[/blue]")
-        intent_mandate = self._create_ap2_intent_mandate()
+        intent_mandate = self._create_ap2_intent_mandate(deal)
         rprint("[green]✅ AP2 intent mandate created and verified[/green]")
-        
-        # Step 6: Work Execution with Process Integrity (Alice)
+        return intent_mandate
+    
+    def _step_smart_shopping(self, deal: Deal) -> tuple[Dict[str, Any], Any]:
+        """Step 6: Work Execution with Process Integrity (Alice)"""
         rprint("\n[blue]🔧 Step 6: Alice performing smart shopping with ChaosChain Process Integrity...[/blue]")
-        analysis_data, process_integrity_proof = self._execute_smart_shopping_with_integrity()
+        analysis_data, process_integrity_proof = self._execute_smart_shopping_with_integrity(deal)
         rprint("[green]✅ Smart shopping completed with process integrity proof[/green]")
-        
-        # Step 7: Evidence Storage (Alice) - Using 0G Storage
+        return analysis_data, process_integrity_proof
+    
+    def _step_store_analysis(self, deal: Deal, analysis_data: Dict[str, Any], process_integrity_proof: Any) -> str:
+        """Step 7: Evidence Storage (Alice) - Using 0G Storage"""
         rprint("\n[blue]🔧 Step 7: Storing analysis on 0G Storage...[/blue]")
-        analysis_cid = self._store_analysis_on_0g_storage(analysis_data, process_integrity_proof)
+        analysis_cid = self._store_analysis_on_0g_storage(deal, analysis_data, process_integrity_proof)
         rprint("[green]✅ Analysis stored on 0G Storage[/green]")
-        
-        # Step 8: 0G Token Payment (A0GI) with AP2 authorization
+        return analysis_cid
+    
+    def _step_analysis_payment(self, deal: Deal, analysis_data: Dict[str, Any], intent_mandate: Any) -> Dict[str, Any]:
+        """Step 8: 0G Token Payment (A0GI) with AP2 authorization"""
         rprint("\n[blue]🔧 Step 8: Processing 0G token payment with AP2 authorization (A0GI)...[/blue]")
-        payment_results = self._execute_0g_token_payment(analysis_cid, analysis_data, intent_mandate)
+        payment_results = self._execute_0g_token_payment(deal, analysis_data, intent_mandate)
         rprint(f"[green]✅ Payment completed: {payment_results['amount']:.4f} A0GI (Charlie → Alice)[/green]")
-        
-        # Step 6: Validation Request (Alice → Bob)
+        return payment_results
+    
+    def _step_validation(self, deal: Deal, analysis_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Validation Request (Alice → Bob) and Validation & Payment (Bob)"""
         rprint("\n[blue]🔧 Step 6: Alice requesting validation from Bob...[/blue]")
         rprint("[green]✅ Validation requested[/green]")
         
-        # Step 7: Validation & Payment (Bob)
         rprint("\n[blue]🔧 Step 7: Bob validating with 0G Compute and payment...[/blue]")
-        validation_score, validation_result = self._perform_validation_with_0g_compute(analysis_data)
+        validation_score, validation_result = self._perform_validation_with_0g_compute(deal, analysis_data)
         rprint(f"[green]✅ Validation completed (Score: {validation_score}/100)[/green]")
+        return validation_result
     
-    def _phase_3_enhanced_evidence_packages(self):
-        """Phase 3: Enhanced Evidence Packages with Payment Proofs"""
+    def _step_validation_quorum(self, deal: Deal, analysis_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Step 7b: High-value deals are also scored by the independent validator quorum"""
+        if not self.validator_quorum or deal.budget < self.quorum_min_budget:
+            return None
+        
+        rprint(f"\n[blue]🔧 Step 7b: High-value deal (${deal.budget:g}) - scoring with the validator quorum...[/blue]")
+        quorum_result = self.validator_quorum.validate(analysis_data).to_dict()
+        deal.results["validation_quorum"] = quorum_result
+        rprint(f"[green]✅ Quorum score: {quorum_result['overall_score']}/100 "
+               f"({'agreed' if quorum_result['agreed'] else 'no agreement'}, {len(quorum_result['votes'])} votes)[/green]")
+        return quorum_result
+    
+    def _step_evidence_package(self, deal: Deal, analysis_cid: str, payment_results: Dict[str, Any],
+                               validation_result: Dict[str, Any], quorum_result: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Phase 3 / Step 11: Create Enhanced Evidence Package (Alice)"""
         
         rprint("\n[bold blue]📋 Phase 3: Enhanced Evidence Packages[/bold blue]")
         rprint("[cyan]Creating comprehensive evidence packages with x402 payment proofs for PoA[/cyan]")
         rprint("=" * 80)
         
-        # Step 11: Create Enhanced Evidence Package (Alice)
         rprint("\n[blue]🔧 Step 11: Alice creating enhanced evidence package with payment proofs...[/blue]")
-        alice_evidence_package = self._create_enhanced_evidence_package()
+        alice_evidence_package = self._create_enhanced_evidence_package(deal)
         rprint("[green]✅ Enhanced evidence package created[/green]")
-        
-        # Step 12: Store Enhanced Evidence Package on 0G Storage
+        return alice_evidence_package
+    
+    def _step_store_evidence(self, deal: Deal, evidence_package: Dict[str, Any]) -> str:
+        """Step 12: Store Enhanced Evidence Package on 0G Storage"""
         rprint("\n[blue]🔧 Step 12: Storing enhanced evidence package on 0G Storage...[/blue]")
-        enhanced_evidence_cid = self._store_enhanced_evidence_package(alice_evidence_package)
+        enhanced_evidence_cid = self._store_enhanced_evidence_package(deal, evidence_package)
         rprint("[green]✅ Enhanced evidence package stored[/green]")
-    
+        return enhanced_evidence_cid
     
     def _validate_configuration(self):
         """Validate all required environment variables including x402"""
@@ -387,6 +705,9 @@ class GenesisStudioX402Orchestrator:
             rprint("[green]✅ 0G gRPC providers initialized[/green]")
             zg_storage = self.zg_storage
             zg_compute = self.zg_compute
+            
+            # One watcher resolves every deal's compute jobs as soon as they finish
+            self.job_watcher = JobWatcher(self.zg_compute)
         except Exception as e:
             rprint(f"[yellow]⚠️  0G gRPC providers not available: {e}[/yellow]")
             rprint("[yellow]   Storage will fallback to IPFS, compute will use local[/yellow]")
@@ -395,34 +716,59 @@ class GenesisStudioX402Orchestrator:
             zg_storage = None
             zg_compute = None
         
-        self.alice_agent = GenesisServerAgentSDK(
-            agent_name="Alice",
-            agent_domain="alice.chaoschain-studio.com",
-            agent_role=AgentRole.SERVER,
-            network=NetworkConfig.ZEROG_TESTNET,  # Using 0G Testnet
-            enable_ap2=True,
-            enable_process_integrity=True,
-            use_0g_inference=True  # ✅ 0G Compute AI inference
-        )
+        # Each agent builds a full ChaosChainAgentSDK, probes 0G inference and sets up
+        # CrewAI - mostly RPC/network waits, so the three are constructed concurrently
+        agent_builders = {
+            "Alice": partial(
+                GenesisServerAgentSDK,
+                agent_name="Alice",
+                agent_domain="alice.chaoschain-studio.com",
+                agent_role=AgentRole.SERVER,
+                network=NetworkConfig.ZEROG_TESTNET,  # Using 0G Testnet
+                enable_ap2=True,
+                enable_process_integrity=True,
+                use_0g_inference=True  # ✅ 0G Compute AI inference
+            ),
+            "Bob": partial(
+                GenesisValidatorAgentSDK,
+                agent_name="Bob",
+                agent_domain="bob.chaoschain-studio.com",
+                agent_role=AgentRole.VALIDATOR,
+                network=NetworkConfig.ZEROG_TESTNET,  # Using 0G Testnet
+                enable_ap2=True,
+                enable_process_integrity=True,
+                use_0g_inference=True  # ✅ 0G Compute AI validation
+            ),
+            "Charlie": partial(
+                GenesisClientAgent,
+                agent_name="Charlie",
+                agent_domain="charlie.chaoschain-studio.com",
+                agent_role=AgentRole.CLIENT,
+                network=NetworkConfig.ZEROG_TESTNET,  # Using 0G Testnet
+                enable_ap2=True,  
+                enable_process_integrity=False  # Client doesn't need process integrity
+            )
+        }
         
-        self.bob_agent = GenesisValidatorAgentSDK(
-            agent_name="Bob",
-            agent_domain="bob.chaoschain-studio.com",
-            agent_role=AgentRole.VALIDATOR,
-            network=NetworkConfig.ZEROG_TESTNET,  # Using 0G Testnet
-            enable_ap2=True,
-            enable_process_integrity=True,
-            use_0g_inference=True  # ✅ 0G Compute AI validation
-        )
+        # Quorum members validate every analysis on 0G (no rule tier), so their votes are independent
+        for name in self._quorum_member_names():
+            agent_builders[name] = partial(
+                GenesisValidatorAgentSDK,
+                agent_name=name,
+                agent_domain=f"{name.lower()}.chaoschain-studio.com",
+                agent_role=AgentRole.VALIDATOR,
+                network=NetworkConfig.ZEROG_TESTNET,
+                enable_ap2=False,
+                enable_process_integrity=True,
+                use_0g_inference=True,
+                tiered_validation=False
+            )
         
-        self.charlie_agent = GenesisClientAgent(
-            agent_name="Charlie",
-            agent_domain="charlie.chaoschain-studio.com",
-            agent_role=AgentRole.CLIENT,
-            network=NetworkConfig.ZEROG_TESTNET,  # Using 0G Testnet
-            enable_ap2=True,  
-            enable_process_integrity=False  # Client doesn't need process integrity
-        )
+        agents = self._bootstrap_agents(agent_builders)
+        self.alice_agent = agents["Alice"]
+        self.bob_agent = agents["Bob"]
+        self.charlie_agent = agents["Charlie"]
+        self._setup_validator_quorum(agents)
         
         # Keep SDK references for compatibility with existing code
         self.alice_sdk = self.alice_agent.sdk
@@ -448,6 +794,73 @@ class GenesisStudioX402Orchestrator:
             "Charlie": self.charlie_sdk.wallet_address
         }
     
+    def _quorum_member_names(self) -> List[str]:
+        """Names of the quorum validators to build (none when the quorum is disabled)"""
+        return [f"Bob-Q{index}" for index in range(1, self.quorum_validators + 1)]
+    
+    def _setup_validator_quorum(self, agents: Dict[str, Any]):
+        """Group the bootstrapped quorum validators into the ValidatorQuorum used for high-value deals"""
+        members = [agents[name] for name in self._quorum_member_names()]
+        if not members:
+            return
+        self.validator_quorum = ValidatorQuorum(members)
+        rprint(f"[green]🗳️  Validator quorum: {len(members)} validators for deals from ${self.quorum_min_budget:g}[/green]")
+    
+    def _bootstrap_agents(self, agent_builders: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Construct agents concurrently and report per-agent startup time
+        
+        Agents sharing the SDK wallet file would race when creating new wallets
+        (each load-modify-save of the file can drop the others' keys), so the
+        first run that still has to create wallets builds them one at a time.
+        """
+        parallel = self._wallets_provisioned(list(agent_builders))
+        if not parallel:
+            rprint("[yellow]⚠️  New agent wallets will be created - bootstrapping agents sequentially[/yellow]")
+        
+        def _timed_build(build):
+            started = time.perf_counter()
+            agent = build()
+            return agent, time.perf_counter() - started
+        
+        started = time.perf_counter()
+        if parallel:
+            with ThreadPoolExecutor(max_workers=len(agent_builders), thread_name_prefix="agent-bootstrap") as pool:
+                futures = {name: pool.submit(_timed_build, build) for name, build in agent_builders.items()}
+                built = {name: future.result() for name, future in futures.items()}
+        else:
+            built = {name: _timed_build(build) for name, build in agent_builders.items()}
+        wall_seconds = time.perf_counter() - started
+        
+        timings = {name: seconds for name, (_, seconds) in built.items()}
+        
+        # Startup timing report
+        table = Table(title="[bold cyan]Agent Bootstrap Timing[/bold cyan]", show_header=True, header_style="bold magenta")
+        table.add_column("Agent", style="bold white")
+        table.add_column("Startup (s)", style="yellow")
+        for name, seconds in timings.items():
+            table.add_row(name, f"{seconds:.2f}")
+        table.add_row("[bold]Wall clock[/bold]", f"[bold]{wall_seconds:.2f}[/bold]")
+        rprint(table)
+        rprint(f"[blue]   Mode: {'parallel' if parallel else 'sequential'} (sum of agent startups: {sum(timings.values()):.2f}s)[/blue]")
+        
+        self.results["bootstrap"] = {
+            "parallel": parallel,
+            "wall_seconds": round(wall_seconds, 3),
+            "agents": {name: round(seconds, 3) for name, seconds in timings.items()}
+        }
+        
+        return {name: agent for name, (agent, _) in built.items()}
+    
+    def _wallets_provisioned(self, agent_names: List[str]) -> bool:
+        """Check whether every agent already has a wallet in the SDK wallet file"""
+        try:
+            with open(WALLET_FILE) as f:
+                wallet_data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        return all(name in wallet_data for name in agent_names)
+    
     def _fund_agent_wallets(self):
         """Fund all agent wallets from 0G Testnet faucet"""
         
@@ -455,10 +868,22 @@ class GenesisStudioX402Orchestrator:
         funded_agents = []
         
         print("💰 Checking wallet balances...")
-        for agent_name, sdk in agents:
-            balance = sdk.wallet_manager.get_wallet_balance(agent_name)
-            address = sdk.wallet_manager.get_wallet_address(agent_name)
-            print(f"   {agent_name}: {balance:.4f} A0GI ({address})")
+        if self.wallet_probe is None:
+            self.wallet_probe = WalletProbe(self.alice_sdk.wallet_manager.w3)
+        
+        # One batched JSON-RPC round trip for every wallet's balance and nonce
+        wallets = {agent_name: sdk.wallet_manager.get_wallet_address(agent_name) for agent_name, sdk in agents}
+        statuses = self.wallet_probe.probe(wallets)
+        
+        for agent_name, _ in agents:
+            status = statuses[agent_name]
+            address = status["address"]
+            if status["error"] or status["balance"] is None:
+                print(f"   ⚠️  {agent_name}: unable to fetch balance ({status['error']})")
+                continue
+            
+            balance = status["balance"]
+            print(f"   {agent_name}: {balance:.4f} A0GI ({address}, nonce {status['nonce']})")
             
             if balance > 0.001:  # Has some A0GI for gas
                 funded_agents.append(agent_name)
@@ -471,44 +896,63 @@ class GenesisStudioX402Orchestrator:
         
         self.results["funding"] = {
             "success": len(funded_agents) > 0,
-            "funded_agents": funded_agents
+            "funded_agents": funded_agents,
+            "wallets": {name: {k: v for k, v in status.items() if k != "probed_at"} for name, status in statuses.items()}
         }
     
     def _register_agents_onchain(self):
         """Register all CrewAI agents on the ERC-8004 IdentityRegistry"""
         
+        agents = {"Alice": self.alice_agent, "Bob": self.bob_agent, "Charlie": self.charlie_agent}
+        for agent in agents.values():
+            rprint(f"[blue]🔧 Registering agent: {agent.agent_domain}[/blue]")
+        
+        # Register the agents through the SDK, concurrently across wallets and in order within a shared wallet
+        started = time.perf_counter()
+        records = BulkRegistrar().register_all({name: agent.sdk for name, agent in agents.items()})
+        elapsed = time.perf_counter() - started
+        
         registration_results = {}
+        for agent_name, record in records.items():
+            if record["status"] == "failed":
+                rprint(f"[red]❌ Failed to register {agent_name}: {record['error']}[/red]")
+                registration_results[agent_name] = {"error": record["error"], "latency_seconds": record["latency_seconds"]}
+                continue
+            
+            rprint(f"[green]✅ {agent_name} registered successfully[/green]")
+            rprint(f"   Agent ID: {record['agent_id']}")
+            rprint(f"   Wallet: {record['address']}")
+            rprint(f"   Transaction: {record['tx_hash']}")
+            registration_results[agent_name] = {
+                "agent_id": record["agent_id"],
+                "tx_hash": record["tx_hash"],
+                "address": record["address"],
+                "latency_seconds": record["latency_seconds"]
+            }
         
-        # Register each CrewAI agent
-        for agent_name, agent in [("Alice", self.alice_agent), ("Bob", self.bob_agent), ("Charlie", self.charlie_agent)]:
-            try:
-                rprint(f"[blue]🔧 Registering agent: {agent.agent_domain}[/blue]")
-                agent_id = agent.register_identity()
-                wallet_address = agent.sdk.wallet_address
-                rprint(f"[green]✅ {agent_name} registered successfully[/green]")
-                rprint(f"   Agent ID: {agent_id}")
-                rprint(f"   Wallet: {wallet_address}")
-                rprint(f"   Transaction: already_registered")
-                registration_results[agent_name] = {
-                    "agent_id": agent_id,
-                    "tx_hash": "already_registered",
-                    "address": wallet_address
-                }
-            except Exception as e:
-                rprint(f"[red]❌ Failed to register {agent_name}: {e}[/red]")
-                registration_results[agent_name] = {"error": str(e)}
+        # Per-agent registration latency report
+        table = Table(title="[bold cyan]ERC-8004 Registration[/bold cyan]", show_header=True, header_style="bold magenta")
+        table.add_column("Agent", style="bold white")
+        table.add_column("Status", style="green")
+        table.add_column("Latency (s)", style="yellow")
+        for agent_name, record in records.items():
+            status = "[red]❌ FAILED[/red]" if record["status"] == "failed" else f"✅ {record['status'].upper()}"
+            table.add_row(agent_name, status, f"{record['latency_seconds']:.2f}")
+        rprint(table)
+        failures = sum(1 for record in records.values() if record["status"] == "failed")
+        rprint(f"[blue]   {len(records) - failures}/{len(records)} agents registered in {elapsed:.2f}s[/blue]")
         
         self.results["registration"] = {
             "success": all("agent_id" in result for result in registration_results.values()),
             "agents": registration_results
         }
     
-    def _create_ap2_intent_mandate(self) -> Dict[str, Any]:
+    def _create_ap2_intent_mandate(self, deal: Deal) -> Dict[str, Any]:
         """Create AP2 intent mandate for market analysis service"""
         
         # Create intent mandate using Alice's AP2 manager - Smart Shopping Scenario
         intent_mandate = self.alice_sdk.create_intent_mandate(
-            user_description="Find me the best winter jacket in green, willing to pay up to 20% premium for the right color. Price limit: $150, quality threshold: good, auto-purchase enabled",
+            user_description=deal.user_description,
             merchants=None,  # Allow any merchant
             skus=None,  # Allow any SKU
             requires_refundability=True,  # Require refundable items
@@ -517,8 +961,8 @@ class GenesisStudioX402Orchestrator:
         
         # Create cart mandate
         cart_mandate = self.alice_sdk.create_cart_mandate(
-            cart_id="cart_winter_jacket_001",
-            items=[{"service": "smart_shopping_agent", "description": "Find best winter jacket deal with color preference", "price": 2.0}],
+            cart_id=deal.cart_id,
+            items=[{"service": "smart_shopping_agent", "description": f"Find best {deal.item_label} deal with color preference", "price": 2.0}],
             total_amount=2.0,
             currency="USDC",
             merchant_name="Alice Smart Shopping Agent",
@@ -531,18 +975,18 @@ class GenesisStudioX402Orchestrator:
             jwt_payload = self.alice_sdk.google_ap2_integration.verify_jwt_token(cart_mandate.merchant_authorization)
             mandate_verified = bool(jwt_payload)
         
-        self.results["ap2_intent"] = {
+        deal.results["ap2_intent"] = {
             "intent_mandate": intent_mandate,
             "cart_mandate": cart_mandate,
             "verified": mandate_verified,
-            "intent_description": "Smart shopping for winter jacket with green color preference",
-            "cart_id": "cart_winter_jacket_001",
+            "intent_description": f"Smart shopping for {deal.item_label} with {deal.color} color preference",
+            "cart_id": deal.cart_id,
             "jwt_verified": mandate_verified
         }
         
         return cart_mandate
 
-    def _execute_smart_shopping_with_integrity(self) -> tuple[Dict[str, Any], Any]:
+    def _execute_smart_shopping_with_integrity(self, deal: Deal) -> tuple[Dict[str, Any], Any]:
         """Execute smart shopping with 0G Compute and Process Integrity verification"""
         
         rprint("[yellow]🤖 Alice performing smart shopping using 0G Compute (TEE-verified)...[/yellow]")
@@ -550,13 +994,7 @@ class GenesisStudioX402Orchestrator:
         if not self.zg_compute or not self.zg_compute.is_available:
             rprint("[yellow]⚠️  0G Compute not available, using fallback...[/yellow]")
             # Fallback to CrewAI
-            analysis_result = self.alice_agent.generate_smart_shopping_analysis(
-                item_type="winter_jacket",
-                color="green", 
-                budget=150.0,
-                premium_tolerance=0.20
-            )
-            return analysis_result["analysis"], analysis_result["process_integrity_proof"]
+            return self._execute_smart_shopping_fallback(deal)
         
         # Create shopping analysis task for 0G Compute
         shopping_task = {
@@ -564,20 +1002,19 @@ class GenesisStudioX402Orchestrator:
             "role": "server",
             "task_type": "smart_shopping_analysis",
             "model": "gpt-oss-120b",
-            "prompt": """Analyze this shopping request and provide recommendations:
+            "prompt": f"""Analyze this shopping request and provide recommendations:
 
-User Request: "Find me the best winter jacket in green, budget $150"
+User Request: "Find me the best {deal.item_label} in {deal.color}, budget ${deal.budget:g}"
 
 Provide:
 1. Best product recommendation with price
-2. Alternative options if green not available
+2. Alternative options if {deal.color} not available
 3. Quality assessment (1-100)
 4. Value score (1-100)
 5. Confidence in recommendation (percentage)
 
 Respond in JSON format with fields: product_name, price, color, quality_score, value_score, confidence, alternatives.""",
-            "max_tokens": 600,
-            "temperature": 0.4
+            "temperature": 0.4  # max_tokens is set per attempt by _run_compute_task
         }
         
         try:
@@ -587,31 +1024,14 @@ Respond in JSON format with fields: product_name, price, color, quality_score, v
             VerificationMethod = None
         
         rprint("[cyan]📤 Submitting shopping analysis to 0G Compute...[/cyan]")
-        job_id = self.zg_compute.submit(
-            task=shopping_task,
-            verification=VerificationMethod.TEE_ML,
-            idempotency_key=f"alice_shopping_{int(time.time())}"
-        )
-        
-        rprint(f"[green]✅ Job submitted: {job_id}[/green]")
-        
-        # Wait for completion
-        rprint("[yellow]⏳ Waiting for TEE-verified AI inference...[/yellow]")
-        for i in range(30):
-            status = self.zg_compute.status(job_id)
-            state = status.get("state", "unknown")
-            
-            if state == "completed":
-                rprint("[green]✅ Analysis completed in TEE![/green]")
-                break
-            elif state == "failed":
-                rprint(f"[red]❌ Job failed, using fallback[/red]")
-                return self._execute_smart_shopping_fallback()
-            
-            time.sleep(3)
+        job_id, status, result = self._run_compute_task(deal, "alice_shopping", shopping_task, VerificationMethod.TEE_ML)
+        state = status.get("state", "unknown")
         
-        # Get result with attestation
-        result = self.zg_compute.result(job_id)
+        if state == "completed":
+            rprint("[green]✅ Analysis completed in TEE![/green]")
+        elif state == "failed":
+            rprint(f"[red]❌ Job failed, using fallback[/red]")
+            return self._execute_smart_shopping_fallback(deal)
         
         if result.success:
             rprint(f"[green]✅ Result retrieved with TEE proof[/green]")
@@ -621,11 +1041,7 @@ Respond in JSON format with fields: product_name, price, color, quality_score, v
             rprint("[bold]🛒 Alice's Shopping Analysis:[/bold]")
             import json
             try:
-                output_str = result.output.get("output", "{}") if isinstance(result.output, dict) else str(result.output)
-                if "```json" in output_str:
-                    json_start = output_str.find("```json") + 7
-                    json_end = output_str.find("```", json_start)
-                    output_str = output_str[json_start:json_end].strip()
+                output_str = self._compute_output_text(result)
                 
                 analysis = json.loads(output_str)
                 rprint(f"   Product: {analysis.get('product_name', 'N/A')}")
@@ -647,31 +1063,38 @@ Respond in JSON format with fields: product_name, price, color, quality_score, v
                 "verified": True
             }
             
-            self.results["analysis"] = analysis_data
-            self.results["process_integrity_proof"] = process_integrity_proof
+            deal.results["analysis"] = analysis_data
+            deal.results["process_integrity_proof"] = process_integrity_proof
             
             return analysis_data, process_integrity_proof
         
-        return self._execute_smart_shopping_fallback()
+        return self._execute_smart_shopping_fallback(deal)
     
-    def _execute_smart_shopping_fallback(self) -> tuple[Dict[str, Any], Any]:
+    def _execute_smart_shopping_fallback(self, deal: Deal) -> tuple[Dict[str, Any], Any]:
         """Fallback to CrewAI when 0G Compute unavailable"""
         analysis_result = self.alice_agent.generate_smart_shopping_analysis(
-            item_type="winter_jacket",
-            color="green", 
-            budget=150.0,
-            premium_tolerance=0.20
+            item_type=deal.item_type,
+            color=deal.color, 
+            budget=deal.budget,
+            premium_tolerance=deal.premium_tolerance
         )
+        deal.results["process_integrity_proof"] = analysis_result["process_integrity_proof"]
         return analysis_result["analysis"], analysis_result["process_integrity_proof"]
     
-    def _store_analysis_on_0g_storage(self, analysis_data: Dict[str, Any], process_integrity_proof: Any) -> str:
+    def _store_analysis_on_0g_storage(self, deal: Deal, analysis_data: Dict[str, Any], process_integrity_proof: Any) -> str:
         """Store analysis data on 0G Storage via gRPC"""
         
+        # Already uploaded before a restart - reuse the root hash
+        stored = deal.results.get("storage_analysis", {})
+        if stored.get("success"):
+            rprint(f"[cyan]♻️  Reusing stored analysis: {stored['root_hash']}[/cyan]")
+            return stored["root_hash"]
+        
         if not self.zg_storage or not self.zg_storage.is_available:
             rprint(f"[yellow]⚠️  0G Storage not available - continuing without storage[/yellow]")
             rprint(f"[yellow]   Analysis data preserved in memory for demo[/yellow]")
             
-            self.results["storage_analysis"] = {
+            deal.results["storage_analysis"] = {
                 "success": False,
                 "root_hash": None,
                 "uri": "No storage available",
@@ -696,7 +1119,7 @@ Respond in JSON format with fields: product_name, price, color, quality_score, v
             result = self.zg_storage.put(
                 blob=str(evidence).encode(),
                 mime="application/json",
-                idempotency_key=f"alice_analysis_{int(time.time())}"
+                idempotency_key=deal.idempotency_key("alice_analysis")
             )
             
             if result.success:
@@ -708,7 +1131,7 @@ Respond in JSON format with fields: product_name, price, color, quality_score, v
                 rprint(f"   TX Hash: {tx_hash}")
                 rprint(f"   URI: {result.uri}")
                 
-                self.results["storage_analysis"] = {
+                deal.results["storage_analysis"] = {
                     "success": True,
                     "root_hash": root_hash,
                     "tx_hash": tx_hash,
@@ -717,7 +1140,7 @@ Respond in JSON format with fields: product_name, price, color, quality_score, v
                 return root_hash
             else:
                 rprint(f"[yellow]⚠️  0G Storage failed: {result.error}[/yellow]")
-                self.results["storage_analysis"] = {
+                deal.results["storage_analysis"] = {
                     "success": False,
                     "error": result.error
                 }
@@ -727,14 +1150,14 @@ Respond in JSON format with fields: product_name, price, color, quality_score, v
             rprint(f"[yellow]⚠️  0G Storage error: {e}[/yellow]")
             rprint(f"[yellow]   Analysis data preserved in memory for demo[/yellow]")
             
-            self.results["storage_analysis"] = {
+            deal.results["storage_analysis"] = {
                 "success": False,
                 "error": str(e),
                 "note": "Demo continued without storage"
             }
             return None
     
-    def _execute_0g_token_payment(self, analysis_cid: str, analysis_data: Dict[str, Any], cart_mandate: Any) -> Dict[str, Any]:
+    def _execute_0g_token_payment(self, deal: Deal, analysis_data: Dict[str, Any], cart_mandate: Any) -> Dict[str, Any]:
         """Execute x402 payment with A0GI tokens - Charlie pays Alice (with AP2 intent authorization)"""
         
         # Calculate payment based on analysis quality (using small amounts for demo)
@@ -753,7 +1176,7 @@ Respond in JSON format with fields: product_name, price, color, quality_score, v
             rprint(f"   Cart ID: {cart_mandate.cart_id if hasattr(cart_mandate, 'cart_id') else 'N/A'}")
         else:
             rprint(f"   Intent Verified: ✅")
-            rprint(f"   User Intent: Smart shopping with green preference")
+            rprint(f"   User Intent: Smart shopping with {deal.color} preference")
         rprint(f"   Authorization Method: Google AP2")
         rprint()
         
@@ -764,7 +1187,8 @@ Respond in JSON format with fields: product_name, price, color, quality_score, v
         # Execute direct A0GI payment on 0G network
         rprint(f"[yellow]📤 Executing direct A0GI transfer...[/yellow]")
         
-        x402_payment_result = self.charlie_sdk.execute_payment(
+        x402_payment_result = self._execute_charlie_payment(
+            deal, "analysis",
             to_agent="Alice",
             amount=final_amount,
             service_type="smart_shopping"
@@ -801,29 +1225,136 @@ Respond in JSON format with fields: product_name, price, color, quality_score, v
             "triple_verified": True
         }
         
-        self.results["0g_payment"] = payment_results
+        deal.results["0g_payment"] = payment_results
         return payment_results
     
-    def _validate_analysis_with_crewai(self, analysis_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _execute_charlie_payment(self, deal: Deal, operation: str, to_agent: str, amount: float, service_type: str) -> Any:
+        """
+        Execute a payment from Charlie's wallet, one transfer at a time
+        
+        The payment proof is journaled (and flushed) as soon as the transfer returns,
+        so a deal resumed after a crash reuses the transaction instead of paying twice.
+        """
+        journal_key = f"{operation}_payment_proof"
+        paid = deal.results.get(journal_key)
+        if paid is not None:
+            rprint(f"[cyan]♻️  Reusing {operation} payment: {paid.transaction_hash}[/cyan]")
+            return paid
+        
+        with self._payment_lock:
+            payment_proof = self.charlie_sdk.execute_payment(
+                to_agent=to_agent,
+                amount=amount,
+                service_type=service_type
+            )
+        
+        deal.results[journal_key] = payment_proof
+        self.journal.flush()
+        return payment_proof
+    
+    def _submit_compute_job(self, deal: Deal, operation: str, task: Dict[str, Any], verification: Any) -> str:
+        """Submit a 0G Compute job once per deal, reusing the journaled job_id on resume"""
+        journal_key = f"{operation}_job_id"
+        job_id = deal.results.get(journal_key)
+        if job_id:
+            rprint(f"[cyan]♻️  Reusing 0G Compute job: {job_id}[/cyan]")
+            return job_id
+        
+        job_id = self.zg_compute.submit(
+            task=task,
+            verification=verification,
+            idempotency_key=deal.idempotency_key(operation)
+        )
+        deal.results[journal_key] = job_id
+        return job_id
+    
+    def _run_compute_task(self, deal: Deal, operation: str, task: Dict[str, Any], verification: Any,
+                          timeout: int = 90, max_retries: int = 1) -> tuple[str, Dict[str, Any], Any]:
+        """
+        Run a 0G Compute task under an adaptive max_tokens and wait for its result
+        
+        A completed job whose output was cut off at max_tokens is resubmitted with a
+        larger budget, as its own journaled operation so a resumed deal reuses it.
+        
+        Returns:
+            (job_id, watcher status, ComputeResult - None if the job failed)
+        """
+        task_type = task["task_type"]
+        task["max_tokens"] = self.max_tokens_controller.max_tokens(task_type)
+        
+        for attempt in range(max_retries + 1):
+            job_id = self._submit_compute_job(
+                deal, operation if attempt == 0 else f"{operation}_retry{attempt}", task, verification
+            )
+            rprint(f"[green]✅ Job submitted: {job_id} (max_tokens={task['max_tokens']})[/green]")
+            
+            # Wait for completion
+            rprint("[yellow]⏳ Waiting for TEE-verified AI inference...[/yellow]")
+            status = self.job_watcher.wait_sync(job_id, timeout=timeout)
+            if status.get("state") == "failed":
+                return job_id, status, None
+            
+            # Get result with attestation (long-poll watchers already hold it)
+            result = status.get("result") or self.zg_compute.result(job_id)
+            if not result.success:
+                return job_id, status, result
+            
+            # Learn the output length; unparseable output at the cap means it was cut off
+            output_str = self._compute_output_text(result)
+            try:
+                json.loads(output_str)
+                parsed = True
+            except ValueError:
+                parsed = False
+            output_tokens = count_tokens(output_str)
+            truncated = MaxTokensController.is_truncated(output_tokens, task["max_tokens"], parsed)
+            self.max_tokens_controller.record(task_type, output_tokens, truncated)
+            
+            if not truncated or attempt == max_retries or task["max_tokens"] >= self.max_tokens_controller.ceiling:
+                return job_id, status, result
+            
+            task["max_tokens"] = self.max_tokens_controller.retry_budget(task_type, task["max_tokens"])
+            rprint(f"[yellow]✂️  Output cut off at max_tokens, retrying with {task['max_tokens']}...[/yellow]")
+        
+        return job_id, status, result
+    
+    @staticmethod
+    def _compute_output_text(result: Any) -> str:
+        """Model output text of a ComputeResult, unwrapped from a ```json fence"""
+        output_str = result.output.get("output", "{}") if isinstance(result.output, dict) else str(result.output)
+        if "```json" in output_str:
+            json_start = output_str.find("```json") + 7
+            json_end = output_str.find("```", json_start)
+            output_str = output_str[json_start:json_end].strip()
+        return output_str
+    
+    @staticmethod
+    def _proof_field(proof: Any, name: str, default: Any = None) -> Any:
+        """Field of a proof that may be a dict (0G Compute, journal) or an SDK object (IntegrityProof)"""
+        if isinstance(proof, dict):
+            return proof.get(name, default)
+        return getattr(proof, name, default)
+    
+    def _validate_analysis_with_crewai(self, deal: Deal, analysis_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Use Bob's CrewAI-powered validator agent for comprehensive analysis validation
         """
         rprint("[yellow]🤖 Using Bob's CrewAI-powered validation agent...[/yellow]")
         
         # Execute CrewAI-powered validation with process integrity
-        validation_result = self.bob_agent.validate_analysis_with_crewai(analysis_data)
+        validation_result = self._validator_agent(deal).validate_analysis_with_crewai(analysis_data)
         
         # Extract the validation and process integrity proof
         validation_data = validation_result["validation"]
         process_integrity_proof = validation_result["process_integrity_proof"]
         
         # Store results for later use
-        self.results["validation"] = validation_data
-        self.results["validation_process_integrity_proof"] = process_integrity_proof
+        deal.results["validation"] = validation_data
+        deal.results["validation_process_integrity_proof"] = process_integrity_proof
         
         return validation_data
     
-    def _request_validation_erc8004(self, analysis_cid: str, analysis_data: Dict[str, Any]) -> str:
+    def _request_validation_erc8004(self, deal: Deal, analysis_cid: str, analysis_data: Dict[str, Any]) -> str:
         """Request validation from Bob using ERC-8004 ValidationRegistry"""
         
         # Calculate proper hash from CID for blockchain storage (handle None CID)
@@ -854,7 +1385,7 @@ Respond in JSON format with fields: product_name, price, color, quality_score, v
             rprint(f"   Data Hash: {data_hash}")
             rprint(f"   Transaction: {tx_hash}")
             
-            self.results["erc8004_validation_request"] = {
+            deal.results["erc8004_validation_request"] = {
                 "success": True,
                 "data_hash": data_hash,
                 "validator_agent_id": self.bob_sdk.get_agent_id(),
@@ -867,7 +1398,7 @@ Respond in JSON format with fields: product_name, price, color, quality_score, v
             print(f"📋 Simulating validation request for demo")
             tx_hash = "demo_validation_tx_hash"
             
-            self.results["erc8004_validation_request"] = {
+            deal.results["erc8004_validation_request"] = {
                 "success": False,
                 "simulated": True,
                 "data_hash": data_hash,
@@ -877,12 +1408,12 @@ Respond in JSON format with fields: product_name, price, color, quality_score, v
         
         return tx_hash
     
-    def _perform_validation_with_0g_compute(self, analysis_data: Dict[str, Any]) -> tuple[int, Dict[str, Any]]:
+    def _perform_validation_with_0g_compute(self, deal: Deal, analysis_data: Dict[str, Any]) -> tuple[int, Dict[str, Any]]:
         """Bob performs validation using 0G Compute and Charlie pays in A0GI"""
         
         if not self.zg_compute or not self.zg_compute.is_available:
             rprint(f"[yellow]⚠️  0G Compute not available - using fallback validation[/yellow]")
-            return self._perform_validation_with_payment_fallback(analysis_data)
+            return self._perform_validation_with_payment_fallback(deal, analysis_data)
         
         # Bob performs validation using 0G Compute
         validation_task = {
@@ -901,8 +1432,7 @@ Evaluate:
 4. Overall Score: (1-100)
 
 Provide validation in JSON format with fields: completeness_score, accuracy_score, value_score, overall_score.""",
-            "max_tokens": 500,
-            "temperature": 0.3
+            "temperature": 0.3  # max_tokens is set per attempt by _run_compute_task
         }
         
         try:
@@ -912,25 +1442,9 @@ Provide validation in JSON format with fields: completeness_score, accuracy_scor
             VerificationMethod = None
         
         rprint("[cyan]📤 Submitting validation to 0G Compute...[/cyan]")
-        job_id = self.zg_compute.submit(
-            task=validation_task,
-            verification=VerificationMethod.TEE_ML,
-            idempotency_key=f"bob_validation_{int(time.time())}"
-        )
-        
-        rprint(f"[green]✅ Validation job: {job_id}[/green]")
-        
-        # Wait for completion
-        for i in range(30):
-            status = self.zg_compute.status(job_id)
-            if status.get("state") == "completed":
-                break
-            time.sleep(3)
+        job_id, status, result = self._run_compute_task(deal, "bob_validation", validation_task, VerificationMethod.TEE_ML)
         
-        # Get validation result
-        result = self.zg_compute.result(job_id)
-        
-        if result.success:
+        if result and result.success:
             rprint(f"[green]✅ Validation completed with TEE proof[/green]")
             rprint(f"[cyan]   Execution Hash: {result.execution_hash}[/cyan]")
             
@@ -940,11 +1454,7 @@ Provide validation in JSON format with fields: completeness_score, accuracy_scor
             # Parse validation score
             try:
                 import json
-                output_str = result.output.get("output", "{}") if isinstance(result.output, dict) else str(result.output)
-                if "```json" in output_str:
-                    json_start = output_str.find("```json") + 7
-                    json_end = output_str.find("```", json_start)
-                    output_str = output_str[json_start:json_end].strip()
+                output_str = self._compute_output_text(result)
                 
                 validation = json.loads(output_str)
                 score = validation.get("overall_score", 75)
@@ -962,7 +1472,8 @@ Provide validation in JSON format with fields: completeness_score, accuracy_scor
             rprint(f"\n[cyan]💰 Direct A0GI Payment for validation:[/cyan]")
             rprint(f"[yellow]📤 Executing direct A0GI transfer...[/yellow]")
             
-            validation_payment_result = self.charlie_sdk.execute_payment(
+            validation_payment_result = self._execute_charlie_payment(
+                deal, "validation",
                 to_agent="Bob",
                 amount=0.00005,  # 0.00005 A0GI for validation (small amount for demo)
                 service_type="validation"
@@ -985,13 +1496,13 @@ Provide validation in JSON format with fields: completeness_score, accuracy_scor
                 "x402_payment": validation_payment_result
             }
             
-            self.results["validation"] = validation_result
+            deal.results["validation"] = validation_result
             
             return score, validation_result
         
         return 75, {"overall_score": 75, "verified": False}
     
-    def _perform_validation_with_payment_fallback(self, analysis_data: Dict[str, Any]) -> tuple[int, Dict[str, Any]]:
+    def _perform_validation_with_payment_fallback(self, deal: Deal, analysis_data: Dict[str, Any]) -> tuple[int, Dict[str, Any]]:
         """Fallback validation when 0G Compute not available - uses CrewAI fallback"""
         
         # Use existing CrewAI validation logic
@@ -999,7 +1510,7 @@ Provide validation in JSON format with fields: completeness_score, accuracy_scor
             analysis_data = self.bob_sdk.retrieve_evidence(analysis_cid)
         else:
             # No storage available - use in-memory analysis data
-            analysis_data = self.results.get("smart_shopping_analysis", {})
+            analysis_data = deal.results.get("smart_shopping_analysis", {})
             rprint(f"[yellow]⚠️  No IPFS storage - using in-memory analysis data for validation[/yellow]")
         
         if not analysis_data:
@@ -1007,7 +1518,7 @@ Provide validation in JSON format with fields: completeness_score, accuracy_scor
             rprint(f"[yellow]⚠️  No analysis data available - using fallback validation[/yellow]")
             analysis_data = {
                 "shopping_result": {
-                    "item_type": "winter_jacket",
+                    "item_type": deal.item_type,
                     "final_price": 121.98,
                     "deal_quality": "excellent",
                     "merchant": "Premium Outdoor Gear Co.",
@@ -1026,19 +1537,20 @@ Provide validation in JSON format with fields: completeness_score, accuracy_scor
                 **shopping_result,  # Include all shopping result fields
                 **analysis_data     # Include metadata
             }
-            validation_result = self._validate_analysis_with_crewai(validation_data)
+            validation_result = self._validate_analysis_with_crewai(deal, validation_data)
         elif "analysis" in analysis_data:
-            validation_result = self._validate_analysis_with_crewai(analysis_data["analysis"])
+            validation_result = self._validate_analysis_with_crewai(deal, analysis_data["analysis"])
         else:
             # Data is already at the top level
-            validation_result = self._validate_analysis_with_crewai(analysis_data)
+            validation_result = self._validate_analysis_with_crewai(deal, analysis_data)
         score = validation_result.get("overall_score", 0)
         
         # Execute direct A0GI payment for validation
         rprint(f"\n[cyan]💰 Direct A0GI Payment for validation:[/cyan]")
         rprint(f"[yellow]📤 Executing direct A0GI transfer...[/yellow]")
         
-        validation_payment_result = self.charlie_sdk.execute_payment(
+        validation_payment_result = self._execute_charlie_payment(
+            deal, "validation",
             to_agent="Bob",
             amount=0.00005,  # 0.00005 A0GI for validation (small amount for demo)
             service_type="validation"
@@ -1094,7 +1606,7 @@ Provide validation in JSON format with fields: completeness_score, accuracy_scor
         
         # Payment already displayed above
         
-        self.results["validation"] = {
+        deal.results["validation"] = {
             "success": True,
             "score": score,
             "validation_cid": validation_cid,
@@ -1104,15 +1616,15 @@ Provide validation in JSON format with fields: completeness_score, accuracy_scor
         
         return score, validation_result
     
-    def _create_enhanced_evidence_package(self) -> Dict[str, Any]:
+    def _create_enhanced_evidence_package(self, deal: Deal) -> Dict[str, Any]:
         """Create enhanced evidence package with Triple-Verified Stack proofs"""
         
         # Gather all payment receipts (both AP2 and x402)
         payment_receipts = []
         
         # AP2 payment proof
-        if "dual_payment" in self.results and "ap2_payment_proof" in self.results["dual_payment"]:
-            ap2_proof = self.results["dual_payment"]["ap2_payment_proof"]
+        if "dual_payment" in deal.results and "ap2_payment_proof" in deal.results["dual_payment"]:
+            ap2_proof = deal.results["dual_payment"]["ap2_payment_proof"]
             
             # Get confirmation code safely
             confirmation_code = "N/A"
@@ -1133,14 +1645,14 @@ Provide validation in JSON format with fields: completeness_score, accuracy_scor
             payment_receipts.append({
                 "type": "ap2_universal",
                 "payment_id": payment_id,
-                "amount": self.results["dual_payment"]["ap2_amount"],
+                "amount": deal.results["dual_payment"]["ap2_amount"],
                 "confirmation": confirmation_code,
                 "payment_method": "ap2_universal"
             })
         
         # x402 crypto payment receipt
-        if "dual_payment" in self.results and "x402_payment_result" in self.results["dual_payment"]:
-            x402_result = self.results["dual_payment"]["x402_payment_result"]
+        if "dual_payment" in deal.results and "x402_payment_result" in deal.results["dual_payment"]:
+            x402_result = deal.results["dual_payment"]["x402_payment_result"]
             payment_receipts.append({
                 "payment_id": x402_result.payment_id,
                 "transaction_hash": x402_result.transaction_hash,
@@ -1150,8 +1662,8 @@ Provide validation in JSON format with fields: completeness_score, accuracy_scor
             })
         
         # Validation payment receipt
-        if "validation" in self.results and "x402_payment" in self.results["validation"]:
-            validation_payment = self.results["validation"]["x402_payment"]
+        if "validation" in deal.results and "x402_payment" in deal.results["validation"]:
+            validation_payment = deal.results["validation"]["x402_payment"]
             payment_receipts.append({
                 "payment_id": validation_payment.payment_id,
                 "transaction_hash": validation_payment.transaction_hash,
@@ -1161,8 +1673,8 @@ Provide validation in JSON format with fields: completeness_score, accuracy_scor
             })
         
         # Create comprehensive Triple-Verified Stack evidence package
-        storage_result = self.results.get("storage_analysis", {})
-        validation_result = self.results.get("validation", {})
+        storage_result = deal.results.get("storage_analysis", {})
+        validation_result = deal.results.get("validation", {})
         
         work_data = {
             "analysis_storage_uri": storage_result.get("uri", "N/A"),
@@ -1172,13 +1684,17 @@ Provide validation in JSON format with fields: completeness_score, accuracy_scor
             "validation_score": validation_result.get("overall_score", 0),
             "analysis_confidence": 85,  # From the analysis
             "triple_verified_stack": {
-                "layer_1_ap2_intent": self.results.get("ap2_intent", {}).get("verified", True),
-                "layer_2_process_integrity": self.results.get("process_integrity_proof", {}).get("proof_id") if self.results.get("process_integrity_proof") else "verified",
-                "layer_3_x402_settlement": self.results.get("0g_payment", {}).get("triple_verified", True),
+                "layer_1_ap2_intent": deal.results.get("ap2_intent", {}).get("verified", True),
+                "layer_2_process_integrity": self._proof_field(deal.results.get("process_integrity_proof"), "proof_id") if deal.results.get("process_integrity_proof") else "verified",
+                "layer_3_x402_settlement": deal.results.get("0g_payment", {}).get("triple_verified", True),
                 "verification_layers_completed": 3
             }
         }
         
+        # High-value deals: the quorum's aggregate score, every vote and their proof references
+        if deal.results.get("validation_quorum"):
+            work_data["validation_quorum"] = deal.results["validation_quorum"]
+        
         # Convert payment receipts to SDK format
         import time
         from chaoschain_sdk.types import PaymentProof, PaymentMethod
@@ -1221,14 +1737,20 @@ Provide validation in JSON format with fields: completeness_score, accuracy_scor
         
         return evidence_package
     
-    def _store_enhanced_evidence_package(self, evidence_package: Dict[str, Any]) -> str:
+    def _store_enhanced_evidence_package(self, deal: Deal, evidence_package: Dict[str, Any]) -> str:
         """Store enhanced evidence package on 0G Storage"""
         
+        # Already uploaded before a restart - reuse the root hash
+        stored = deal.results.get("enhanced_evidence", {})
+        if stored.get("success"):
+            rprint(f"[cyan]♻️  Reusing stored evidence package: {stored['root_hash']}[/cyan]")
+            return stored["root_hash"]
+        
         if not self.zg_storage or not self.zg_storage.is_available:
             rprint(f"[yellow]⚠️  0G Storage not available - continuing without storage[/yellow]")
             rprint(f"[yellow]   Enhanced evidence package data preserved in memory for demo[/yellow]")
             
-            self.results["enhanced_evidence"] = {
+            deal.results["enhanced_evidence"] = {
                 "success": False,
                 "root_hash": None,
                 "uri": "No storage available",
@@ -1241,7 +1763,7 @@ Provide validation in JSON format with fields: completeness_score, accuracy_scor
             result = self.zg_storage.put(
                 blob=str(evidence_package).encode(),
                 mime="application/json",
-                idempotency_key=f"enhanced_evidence_{int(time.time())}"
+                idempotency_key=deal.idempotency_key("enhanced_evidence")
             )
             
             if result.success:
@@ -1253,7 +1775,7 @@ Provide validation in JSON format with fields: completeness_score, accuracy_scor
                 rprint(f"   TX Hash: {tx_hash}")
                 rprint(f"   URI: {result.uri}")
                 
-                self.results["enhanced_evidence"] = {
+                deal.results["enhanced_evidence"] = {
                     "success": True,
                     "root_hash": root_hash,
                     "tx_hash": tx_hash,
@@ -1263,7 +1785,7 @@ Provide validation in JSON format with fields: completeness_score, accuracy_scor
                 return root_hash
             else:
                 rprint(f"[yellow]⚠️  0G Storage failed: {result.error}[/yellow]")
-                self.results["enhanced_evidence"] = {
+                deal.results["enhanced_evidence"] = {
                     "success": False,
                     "error": result.error
                 }
@@ -1273,20 +1795,26 @@ Provide validation in JSON format with fields: completeness_score, accuracy_scor
             rprint(f"[yellow]⚠️  0G Storage error: {e}[/yellow]")
             rprint(f"[yellow]   Enhanced evidence package data preserved in memory for demo[/yellow]")
             
-            self.results["enhanced_evidence"] = {
+            deal.results["enhanced_evidence"] = {
                 "success": False,
                 "error": str(e),
                 "note": "Demo continued without storage"
             }
             return None
     
-    def _display_final_summary(self):
+    def _journal_results(self, deal_id: str) -> Dict[str, Any]:
+        """Setup and deal results as recorded in the durable journal"""
+        return {**self.journal.latest(SETUP_JOURNAL_ID), **self.journal.latest(deal_id)}
+    
+    def _display_final_summary(self, deal_id: str):
         """Display the final success summary with x402 enhancements"""
         
+        results = self._journal_results(deal_id)
+        
         print("DEBUG: _display_final_summary method called")
         
         # Extract payment info for use throughout method
-        validation_payment_obj = self.results.get("validation", {}).get("x402_payment")
+        validation_payment_obj = results.get("validation", {}).get("x402_payment")
         if validation_payment_obj and hasattr(validation_payment_obj, 'amount'):
             validation_amount = validation_payment_obj.amount
             validation_tx = validation_payment_obj.transaction_hash or ""
@@ -1295,7 +1823,7 @@ Provide validation in JSON format with fields: completeness_score, accuracy_scor
             validation_tx = ""
             
         # Extract ALL payment info at the beginning for consistent access throughout method
-        dual_payment = self.results.get("dual_payment", {})
+        dual_payment = results.get("dual_payment", {})
         analysis_payment_obj = dual_payment.get('x402_payment_result')
         analysis_tx = ""
         if analysis_payment_obj and hasattr(analysis_payment_obj, 'transaction_hash'):
@@ -1312,33 +1840,33 @@ Provide validation in JSON format with fields: completeness_score, accuracy_scor
         # Prepare summary data
         summary_data = {
             "Agent Registration": {
-                "success": self.results.get("registration", {}).get("success", False),
+                "success": results.get("registration", {}).get("success", False),
                 "details": f"Alice, Bob, Charlie registered with on-chain IDs and x402 payment support",
-                "tx_hashes": {name: data.get("tx_hash") for name, data in self.results.get("registration", {}).get("agents", {}).items() if "tx_hash" in data}
+                "tx_hashes": {name: data.get("tx_hash") for name, data in results.get("registration", {}).get("agents", {}).items() if "tx_hash" in data}
             },
             "0G Storage": {
-                "success": self.results.get("storage_analysis", {}).get("success", False),
+                "success": results.get("storage_analysis", {}).get("success", False),
                 "details": "Analysis and evidence packages stored on 0G Storage",
                 "storage": {
-                    "analysis": self.results.get("storage_analysis", {}).get("uri", "N/A"),
-                    "root_hash": self.results.get("storage_analysis", {}).get("root_hash", "N/A")
+                    "analysis": results.get("storage_analysis", {}).get("uri", "N/A"),
+                    "root_hash": results.get("storage_analysis", {}).get("root_hash", "N/A")
                 }
             },
             "x402 Payments (A0GI)": {
-                "success": self.results.get("0g_payment", {}).get("x402_success", False),
+                "success": results.get("0g_payment", {}).get("x402_success", False),
                 "details": f"Agent-to-agent x402 payments in A0GI tokens (0G native currency)",
                 "payments": {
-                    "Analysis Payment": f"{self.results.get('0g_payment', {}).get('amount', 0):.4f} A0GI (Charlie → Alice)",
-                    "Validation Payment": f"{self.results.get('validation', {}).get('x402_payment', type('obj', (), {'amount': 0.001})).amount:.4f} A0GI (Charlie → Bob)" if self.results.get('validation', {}).get('x402_payment') else "0.001 A0GI (Charlie → Bob)",
+                    "Analysis Payment": f"{results.get('0g_payment', {}).get('amount', 0):.4f} A0GI (Charlie → Alice)",
+                    "Validation Payment": f"{results.get('validation', {}).get('x402_payment', type('obj', (), {'amount': 0.001})).amount:.4f} A0GI (Charlie → Bob)" if results.get('validation', {}).get('x402_payment') else "0.001 A0GI (Charlie → Bob)",
                     "Currency": "A0GI (0G native tokens)",
                     "Protocol": "x402 v0.2.1+",
                     "Triple-Verified Stack": "✅ Complete"
                 }
             },
             "Enhanced Evidence": {
-                "success": self.results.get("enhanced_evidence", {}).get("success", False),
+                "success": results.get("enhanced_evidence", {}).get("success", False),
                 "details": "Evidence packages enhanced with x402 payment proofs for PoA verification",
-                "payment_proofs": self.results.get("enhanced_evidence", {}).get("payment_proofs_included", 0)
+                "payment_proofs": results.get("enhanced_evidence", {}).get("payment_proofs_included", 0)
             }
         }
         
@@ -1366,9 +1894,9 @@ Provide validation in JSON format with fields: completeness_score, accuracy_scor
                     rprint(f"   {payment_name}: {payment_info}")
         
         # Add x402 Payment Monitoring & Observability
-        self._display_x402_monitoring_summary()
+        self._display_x402_monitoring_summary(results)
     
-    def _display_x402_monitoring_summary(self):
+    def _display_x402_monitoring_summary(self, results: Dict[str, Any]):
         """Display x402 payment monitoring and observability metrics"""
         
         rprint("\n[bold cyan]📊 x402 PAYMENT MONITORING & OBSERVABILITY[/bold cyan]")
@@ -1376,7 +1904,7 @@ Provide validation in JSON format with fields: completeness_score, accuracy_scor
         
         try:
             # Extract actual payment data from demo results
-            payment_data = self._extract_x402_payment_data_from_results()
+            payment_data = self._extract_x402_payment_data_from_results(results)
             
             rprint(f"\n[bold green]🔍 x402 Protocol Verification[/bold green]")
             rprint(f"   Protocol: x402 v0.2.1+ (Coinbase Official)")
@@ -1407,7 +1935,7 @@ Provide validation in JSON format with fields: completeness_score, accuracy_scor
             rprint(f"\n[bold green]👥 Agent Payment Statistics[/bold green]")
             
             # Analysis payment (Charlie → Alice)
-            analysis_payment = self.results.get("analysis", {}).get("dual_payment", {})
+            analysis_payment = results.get("analysis", {}).get("dual_payment", {})
             if analysis_payment.get("x402_payment_result"):
                 payment = analysis_payment["x402_payment_result"]
                 protocol_fee = payment.receipt_data.get("protocol_fee", 0)
@@ -1421,7 +1949,7 @@ Provide validation in JSON format with fields: completeness_score, accuracy_scor
                 rprint(f"     Main TX: {payment.transaction_hash[:20]}...")
             
             # Validation payment (Charlie → Bob)
-            validation_payment = self.results.get("validation", {}).get("x402_payment")
+            validation_payment = results.get("validation", {}).get("x402_payment")
             if validation_payment:
                 protocol_fee = validation_payment.receipt_data.get("protocol_fee", 0)
                 net_amount = validation_payment.receipt_data.get("net_amount", validation_payment.amount)
@@ -1471,8 +1999,8 @@ Provide validation in JSON format with fields: completeness_score, accuracy_scor
             rprint(f"[yellow]⚠️  x402 monitoring unavailable: {e}[/yellow]")
             rprint(f"   This is expected if no payments were made in this session")
     
-    def _extract_x402_payment_data_from_results(self):
-        """Extract x402 payment data from demo results for monitoring"""
+    def _extract_x402_payment_data_from_results(self, results: Dict[str, Any]):
+        """Extract x402 payment data from journaled demo results for monitoring"""
         
         total_payments = 0
         successful_payments = 0
@@ -1481,7 +2009,7 @@ Provide validation in JSON format with fields: completeness_score, accuracy_scor
         net_to_providers = 0.0
         
         # Analysis payment (Charlie → Alice)
-        analysis_payment = self.results.get("analysis", {}).get("dual_payment", {})
+        analysis_payment = results.get("analysis", {}).get("dual_payment", {})
         if analysis_payment.get("x402_payment_result"):
             payment = analysis_payment["x402_payment_result"]
             total_payments += 1
@@ -1493,7 +2021,7 @@ Provide validation in JSON format with fields: completeness_score, accuracy_scor
             net_to_providers += net_amount
         
         # Validation payment (Charlie → Bob)
-        validation_payment = self.results.get("validation", {}).get("x402_payment")
+        validation_payment = results.get("validation", {}).get("x402_payment")
         if validation_payment:
             total_payments += 1
             successful_payments += 1
@@ -1511,9 +2039,11 @@ Provide validation in JSON format with fields: completeness_score, accuracy_scor
             "net_to_providers": net_to_providers
         }
     
-    def _print_final_success_summary(self):
+    def _print_final_success_summary(self, deal_id: str):
         """Print the beautiful final success summary table with x402 enhancements"""
         
+        results = self._journal_results(deal_id)
+        
         from rich.table import Table
         from rich.align import Align
         from rich import print as rprint
@@ -1563,7 +2093,7 @@ The complete lifecycle of trustless agentic commerce with Triple-Verified Stack:
         )
         
         # x402 Analysis Payment (A0GI)
-        payment_data = self.results.get("0g_payment", {})
+        payment_data = results.get("0g_payment", {})
         analysis_amount = payment_data.get('amount', 0)
         analysis_payment_obj = payment_data.get('x402_payment_result')
         analysis_tx = ""
@@ -1578,7 +2108,7 @@ The complete lifecycle of trustless agentic commerce with Triple-Verified Stack:
         )
         
         # x402 Validation Payment (A0GI)
-        validation_payment_obj = self.results.get("validation", {}).get("x402_payment")
+        validation_payment_obj = results.get("validation", {}).get("x402_payment")
         if validation_payment_obj and hasattr(validation_payment_obj, 'amount'):
             validation_amount = validation_payment_obj.amount
             validation_tx = validation_payment_obj.transaction_hash or ""
@@ -1598,7 +2128,7 @@ The complete lifecycle of trustless agentic commerce with Triple-Verified Stack:
         )
         
         # Enhanced Evidence Package
-        enhanced_evidence = self.results.get("enhanced_evidence", {})
+        enhanced_evidence = results.get("enhanced_evidence", {})
         table.add_row(
             "📦 Enhanced Evidence",
             "[green]✅ SUCCESS[/green]",
@@ -1607,7 +2137,7 @@ The complete lifecycle of trustless agentic commerce with Triple-Verified Stack:
         )
         
         # Validation Results
-        validation_score = self.results.get("validation", {}).get("score", 0)
+        validation_score = results.get("validation", {}).get("score", 0)
         table.add_row(
             "🔍 PoA Validation",
             "[green]✅ SUCCESS[/green]",
@@ -1672,6 +2202,23 @@ The complete lifecycle of trustless agentic commerce with Triple-Verified Stack:
 def main():
     """Main entry point for 0G-integrated Genesis Studio"""
     
+    parser = argparse.ArgumentParser(description="ChaosChain Genesis Studio - Triple-Verified Stack demo")
+    parser.add_argument("--deals", metavar="PATH",
+                        help="Stream deal specs from a JSONL file ('-' for stdin) instead of running the single demo deal")
+    parser.add_argument("--output", metavar="PATH", default="deal_results.jsonl",
+                        help="JSONL file receiving one result record per deal (default: deal_results.jsonl)")
+    parser.add_argument("--max-concurrency", type=int, default=4,
+                        help="Maximum number of deals in flight at once (default: 4)")
+    parser.add_argument("--resume", metavar="ID",
+                        help="Resume from the journal: the demo deal id, or with --deals the run id of the interrupted run")
+    parser.add_argument("--journal", metavar="PATH",
+                        help=f"SQLite deal journal (default: $GENESIS_JOURNAL_PATH or {DEFAULT_JOURNAL_PATH})")
+    parser.add_argument("--quorum", type=int, default=0, metavar="N",
+                        help="Also score high-value deals with a quorum of N independent 0G validators (default: off)")
+    parser.add_argument("--quorum-min-budget", type=float, default=QUORUM_MIN_BUDGET, metavar="USD",
+                        help=f"Smallest deal budget scored by the quorum (default: {QUORUM_MIN_BUDGET:g})")
+    args = parser.parse_args()
+    
     # Check if we're on the correct network
     network = os.getenv("NETWORK", "local")
     if network != "0g-testnet":
@@ -1680,8 +2227,25 @@ def main():
         print()
     
     # Initialize and run the 0G-integrated orchestrator
-    orchestrator = GenesisStudioX402Orchestrator()
-    orchestrator.run_complete_demo()
+    orchestrator = GenesisStudioX402Orchestrator(journal_path=args.journal, quorum_validators=args.quorum,
+                                                 quorum_min_budget=args.quorum_min_budget)
+    
+    if not args.deals:
+        orchestrator.run_complete_demo(resume_deal_id=args.resume)
+        return
+    
+    # Deals without an explicit deal_id are keyed by run id and line number
+    run_id = args.resume or new_run_id()
+    rprint(f"[blue]📒 Run id: {run_id} (resume with --deals {args.deals} --resume {run_id})[/blue]")
+    
+    deal_input = sys.stdin if args.deals == "-" else open(args.deals)
+    try:
+        with open(args.output, "w") as output:
+            orchestrator.run_deal_stream(load_deals(deal_input, run_id), output, max_concurrency=args.max_concurrency,
+                                         resume=args.resume is not None)
+    finally:
+        if deal_input is not sys.stdin:
+            deal_input.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,13 @@
+"""
+Genesis Studio Orchestration Package
+
+This package contains the building blocks the Genesis Studio orchestrator uses to
+run many independent deals through the Triple-Verified Stack at once.
+"""
+
+from .deals import Deal, load_deals, new_run_id
+from .deal_engine import DealEngine
+from .registration import BulkRegistrar
+from .wallet_probe import WalletProbe
+
+__all__ = ['Deal', 'load_deals', 'new_run_id', 'DealEngine', 'BulkRegistrar', 'WalletProbe']
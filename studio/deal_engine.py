@@ -0,0 +1,148 @@
+"""
+Genesis Studio - Concurrent Deal Engine
+
+Runs many independent deals through the orchestrator pipeline at once. The
+pipeline itself is blocking (SDK calls, RPC round trips, 0G jobs), so each deal
+runs on a worker thread while an asyncio semaphore caps how many are in flight.
+Large workloads can be streamed: deals are pulled from the input only when a
+slot frees up and each record is handed back as soon as its deal completes.
+"""
+
+import asyncio
+import time
+import traceback
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List
+
+from rich import print as rprint
+
+from .deals import Deal
+
+
+class DealEngine:
+    """Asyncio-based engine that runs N deals with a configurable concurrency limit"""
+
+    def __init__(self, run_deal: Callable[[Deal], Any], max_concurrency: int = 4):
+        """
+        Initialize the deal engine
+
+        Args:
+            run_deal: Callable executing one deal end-to-end (sync or async)
+            max_concurrency: Maximum number of deals in flight at the same time
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self.run_deal = run_deal
+        self.max_concurrency = max_concurrency
+
+    async def run(self, deals: Iterable[Deal]) -> List[Dict[str, Any]]:
+        """
+        Run all deals concurrently and return one record per deal, in input order
+
+        Args:
+            deals: Deals to execute
+
+        Returns:
+            List of per-deal records (deal_id, spec, success, elapsed_seconds, results, error)
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _guarded(deal: Deal) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._execute(deal)
+
+        return await asyncio.gather(*(_guarded(deal) for deal in deals))
+
+    def run_sync(self, deals: Iterable[Deal]) -> List[Dict[str, Any]]:
+        """Blocking wrapper around run() for callers without an event loop"""
+        return asyncio.run(self.run(deals))
+
+    async def stream(self, deals: Iterable[Deal]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Run deals with bounded memory, yielding each record as its deal completes
+
+        At most max_concurrency deals are read from the input and in flight at any
+        time, so the input can be an unbounded generator (e.g. lines from stdin).
+
+        Args:
+            deals: Deals to execute (consumed lazily)
+
+        Yields:
+            Per-deal records in completion order
+        """
+        iterator = iter(deals)
+        in_flight = set()
+        exhausted = False
+        input_error = None
+
+        async def _fill():
+            nonlocal exhausted, input_error
+            while not exhausted and len(in_flight) < self.max_concurrency:
+                # Reading the next spec may block (file/stdin), keep it off the event loop
+                try:
+                    deal = await asyncio.to_thread(next, iterator, None)
+                except Exception as e:
+                    # Stop reading but let the deals already in flight finish
+                    rprint(f"[red]❌ Could not read next deal: {e}[/red]")
+                    input_error = e
+                    deal = None
+                if deal is None:
+                    exhausted = True
+                    break
+                in_flight.add(asyncio.create_task(self._execute(deal)))
+
+        await _fill()
+        while in_flight:
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                in_flight.discard(task)
+                yield task.result()
+            await _fill()
+
+        if input_error is not None:
+            raise input_error
+
+    def stream_sync(self, deals: Iterable[Deal], on_record: Callable[[Dict[str, Any]], None]) -> int:
+        """
+        Blocking wrapper around stream() that hands each record to a callback
+
+        Returns:
+            Number of deals executed
+        """
+        async def _consume() -> int:
+            count = 0
+            async for record in self.stream(deals):
+                on_record(record)
+                count += 1
+            return count
+
+        return asyncio.run(_consume())
+
+    async def _execute(self, deal: Deal) -> Dict[str, Any]:
+        """Execute a single deal and capture its outcome without raising"""
+        rprint(f"[cyan]🚀 Deal {deal.deal_id} started: {deal.item_label} in {deal.color} (budget: ${deal.budget:g})[/cyan]")
+        started = time.perf_counter()
+
+        try:
+            if asyncio.iscoroutinefunction(self.run_deal):
+                await self.run_deal(deal)
+            else:
+                await asyncio.to_thread(self.run_deal, deal)
+            error = None
+        except Exception as e:
+            rprint(f"[red]❌ Deal {deal.deal_id} failed: {e}[/red]")
+            traceback.print_exc()
+            error = str(e)
+
+        elapsed = time.perf_counter() - started
+        if error is None:
+            rprint(f"[green]✅ Deal {deal.deal_id} completed in {elapsed:.1f}s[/green]")
+
+        return {
+            "deal_id": deal.deal_id,
+            "spec": deal.spec,
+            "success": error is None,
+            "elapsed_seconds": round(elapsed, 3),
+            "results": deal.results,
+            "error": error
+        }
@@ -0,0 +1,101 @@
+"""
+Genesis Studio - Deal specifications
+
+A deal is one smart shopping request (intent → analysis → storage → payment →
+validation → evidence) flowing through the orchestrator. Every deal carries its
+own results dict so concurrent deals never overwrite each other's state.
+"""
+
+import json
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+# Deal fields that can be set from a workload spec (everything except results)
+SPEC_FIELDS = ("deal_id", "item_type", "color", "budget", "premium_tolerance", "validator")
+
+
+@dataclass
+class Deal:
+    """A single smart shopping deal and the results collected for it"""
+    deal_id: str
+    item_type: str = "winter_jacket"
+    color: str = "green"
+    budget: float = 150.0
+    premium_tolerance: float = 0.20
+    validator: str = "Bob"
+    results: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], default_id: str = "001") -> "Deal":
+        """
+        Build a deal from a workload spec (unknown keys are ignored)
+
+        Args:
+            data: Spec with any of item_type, color, budget, premium_tolerance, validator, deal_id
+            default_id: Deal identifier to use when the spec has none
+        """
+        spec = {key: data[key] for key in SPEC_FIELDS if key in data}
+        spec["deal_id"] = str(spec.get("deal_id", default_id))
+        for key in ("budget", "premium_tolerance"):
+            if key in spec:
+                spec[key] = float(spec[key])
+        return cls(**spec)
+
+    @property
+    def spec(self) -> Dict[str, Any]:
+        """The deal's input spec (without results)"""
+        return {key: getattr(self, key) for key in SPEC_FIELDS}
+
+    @property
+    def item_label(self) -> str:
+        """Human readable item name (e.g. 'winter jacket')"""
+        return self.item_type.replace("_", " ")
+
+    @property
+    def cart_id(self) -> str:
+        """AP2 cart identifier for this deal"""
+        return f"cart_{self.item_type}_{self.deal_id}"
+
+    def idempotency_key(self, operation: str) -> str:
+        """Deterministic key for one side-effecting operation of this deal (safe to resubmit)"""
+        return f"{self.deal_id}:{operation}"
+
+    @property
+    def user_description(self) -> str:
+        """Natural language shopping intent used for the AP2 intent mandate"""
+        return (
+            f"Find me the best {self.item_label} in {self.color}, willing to pay up to "
+            f"{self.premium_tolerance*100:g}% premium for the right color. "
+            f"Price limit: ${self.budget:g}, quality threshold: good, auto-purchase enabled"
+        )
+
+
+def new_run_id() -> str:
+    """Unique identifier for one run over a deals file (e.g. 'run-20250101-120000-1a2b3c')"""
+    return f"run-{datetime.now():%Y%m%d-%H%M%S}-{uuid.uuid4().hex[:6]}"
+
+
+def load_deals(lines: Iterable[str], run_id: Optional[str] = None) -> Iterator[Deal]:
+    """
+    Lazily parse deals from JSONL lines (one spec object per line)
+
+    Args:
+        lines: Any iterable of lines, e.g. an open file or sys.stdin
+        run_id: Prefix for default deal ids (a new run id when None); pass the id of an
+            earlier run to address the same deals again, e.g. to resume them
+
+    Yields:
+        One Deal per non-empty line; deal_id defaults to "<run_id>-<line number>"
+    """
+    run_id = run_id or new_run_id()
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid deal spec on line {line_number}: {e}") from e
+        yield Deal.from_dict(data, default_id=f"{run_id}-{line_number:06d}")
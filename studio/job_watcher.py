@@ -0,0 +1,227 @@
+"""
+Genesis Studio - 0G Compute Job Watcher
+
+Shared component that tracks outstanding 0G Compute jobs and resolves a future
+for each one as soon as it reaches a terminal state, so a deal continues the
+moment its job finishes instead of sleeping through a fixed polling interval.
+
+Two strategies are supported:
+- Long-poll: if the provider exposes wait_for_completion(job_id), each job is
+  awaited on a worker thread and resolved when the provider returns.
+- Adaptive polling: otherwise a single background thread sweeps status() for
+  every outstanding job, backing off exponentially while nothing changes and
+  snapping back to the minimum interval when a job is added or finishes.
+  The compute protocol (and the gRPC sidecar) only has a per-job status(), so
+  a sweep checks the jobs one after another: its duration grows with the
+  number of outstanding jobs, while the backoff bounds how often it runs.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Dict, Optional
+
+from rich import print as rprint
+
+TERMINAL_STATES = ("completed", "failed", "cancelled")
+
+
+class JobWatcher:
+    """Resolves awaitable futures for many outstanding 0G Compute jobs"""
+
+    def __init__(self, compute: Any, min_interval: float = 0.25, max_interval: float = 3.0,
+                 backoff_factor: float = 2.0, use_long_poll: Optional[bool] = None,
+                 max_long_poll_workers: int = 16):
+        """
+        Initialize the job watcher
+
+        Args:
+            compute: 0G Compute provider exposing status(job_id) (and optionally wait_for_completion)
+            min_interval: Shortest delay between two status sweeps (seconds)
+            max_interval: Longest delay between two status sweeps (seconds)
+            backoff_factor: Multiplier applied to the delay after a sweep with no state change
+            use_long_poll: Force long-poll on/off (auto-detected when None)
+            max_long_poll_workers: Maximum concurrent long-poll calls
+        """
+        self.compute = compute
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+
+        if use_long_poll is None:
+            use_long_poll = callable(getattr(compute, "wait_for_completion", None))
+        self.use_long_poll = use_long_poll
+
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._sweeper: Optional[threading.Thread] = None
+        self._long_poll_pool = ThreadPoolExecutor(max_workers=max_long_poll_workers, thread_name_prefix="zg-job-wait") if use_long_poll else None
+
+        # Observability counters
+        self.sweeps = 0
+        self.status_calls = 0
+
+    def watch(self, job_id: str, timeout: float = 90.0) -> Future:
+        """
+        Start watching a job
+
+        Args:
+            job_id: 0G Compute job identifier
+            timeout: Seconds after which the future resolves with state "timeout"
+
+        Returns:
+            Future resolving to the job's final status dict (always has a "state" key)
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("JobWatcher is closed")
+            if job_id in self._pending:
+                return self._pending[job_id]["future"]
+
+            future: Future = Future()
+            self._pending[job_id] = {"future": future, "deadline": time.monotonic() + timeout}
+
+        if self.use_long_poll:
+            self._long_poll_pool.submit(self._long_poll, job_id)
+        else:
+            self._ensure_sweeper()
+            self._wakeup.set()
+
+        return future
+
+    def wait_sync(self, job_id: str, timeout: float = 90.0) -> Dict[str, Any]:
+        """Block the calling thread until the job finishes (or times out)"""
+        future = self.watch(job_id, timeout)
+        try:
+            return future.result(timeout=timeout + self.max_interval)
+        except FutureTimeoutError:
+            return self._expire(job_id)
+
+    async def wait(self, job_id: str, timeout: float = 90.0) -> Dict[str, Any]:
+        """Await the job's final status from an event loop"""
+        future = asyncio.wrap_future(self.watch(job_id, timeout))
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout + self.max_interval)
+        except asyncio.TimeoutError:
+            return self._expire(job_id)
+
+    @property
+    def outstanding(self) -> int:
+        """Number of jobs still being watched"""
+        with self._lock:
+            return len(self._pending)
+
+    def close(self):
+        """Stop watching and resolve any outstanding jobs as cancelled"""
+        with self._lock:
+            self._closed = True
+            pending = list(self._pending.items())
+            self._pending.clear()
+
+        for job_id, entry in pending:
+            if not entry["future"].done():
+                entry["future"].set_result({"job_id": job_id, "state": "cancelled"})
+
+        self._wakeup.set()
+        if self._long_poll_pool:
+            self._long_poll_pool.shutdown(wait=False)
+
+    # === Internal helpers ===
+
+    def _resolve(self, job_id: str, status: Dict[str, Any]):
+        """Resolve and forget a watched job"""
+        with self._lock:
+            entry = self._pending.pop(job_id, None)
+        if entry and not entry["future"].done():
+            entry["future"].set_result(status)
+
+    def _expire(self, job_id: str) -> Dict[str, Any]:
+        """Give up on a job whose provider never reported a terminal state"""
+        status = {"job_id": job_id, "state": "timeout"}
+        self._resolve(job_id, status)
+        return status
+
+    @staticmethod
+    def _state_of(status: Dict[str, Any]) -> str:
+        """Read the job state (gRPC sidecar uses 'state', the compute protocol uses 'status')"""
+        return status.get("state") or status.get("status") or "unknown"
+
+    def _long_poll(self, job_id: str):
+        """Wait for one job using the provider's blocking completion call"""
+        try:
+            result = self.compute.wait_for_completion(job_id)
+            state = "completed" if getattr(result, "success", False) else "failed"
+            self._resolve(job_id, {"job_id": job_id, "state": state, "result": result})
+        except Exception as e:
+            rprint(f"[yellow]⚠️  Long-poll for job {job_id} failed: {e}[/yellow]")
+            self._resolve(job_id, {"job_id": job_id, "state": "failed", "error": str(e)})
+
+    def _ensure_sweeper(self):
+        """Start the background sweep thread on first use"""
+        with self._lock:
+            if self._sweeper is None or not self._sweeper.is_alive():
+                self._sweeper = threading.Thread(target=self._sweep_loop, name="zg-job-watcher", daemon=True)
+                self._sweeper.start()
+
+    def _sweep_loop(self):
+        """Poll all outstanding jobs in one sweep, with adaptive exponential backoff"""
+        interval = self.min_interval
+
+        while True:
+            self._wakeup.wait(interval)
+            woken = self._wakeup.is_set()
+            self._wakeup.clear()
+
+            with self._lock:
+                if self._closed:
+                    return
+                job_ids = list(self._pending.keys())
+
+            if not job_ids:
+                interval = self.max_interval
+                continue
+
+            finished = self._sweep(job_ids)
+
+            # Reset on progress (or a newly added job), otherwise back off
+            if finished or woken:
+                interval = self.min_interval
+            else:
+                interval = min(interval * self.backoff_factor, self.max_interval)
+
+    def _sweep(self, job_ids) -> int:
+        """
+        Check every job once, one status() call after another (the provider has no batch status call)
+
+        Returns:
+            How many jobs reached a terminal state
+        """
+        self.sweeps += 1
+        finished = 0
+        now = time.monotonic()
+
+        for job_id in job_ids:
+            try:
+                self.status_calls += 1
+                status = self.compute.status(job_id) or {}
+            except Exception as e:
+                status = {"state": "unknown", "error": str(e)}
+
+            state = self._state_of(status)
+            if state in TERMINAL_STATES:
+                self._resolve(job_id, {**status, "job_id": job_id, "state": state})
+                finished += 1
+                continue
+
+            with self._lock:
+                entry = self._pending.get(job_id)
+            if entry and now >= entry["deadline"]:
+                rprint(f"[yellow]⚠️  Job {job_id} still '{state}' after timeout[/yellow]")
+                self._resolve(job_id, {**status, "job_id": job_id, "state": "timeout"})
+                finished += 1
+
+        return finished
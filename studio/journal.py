@@ -0,0 +1,254 @@
+"""
+Genesis Studio - Durable Deal Journal
+
+Append-only SQLite journal of everything the orchestrator learns, keyed by
+deal id and step (registration, AP2 mandates, analysis, storage URIs, payment
+receipts, validation, ...). Appends only enqueue a serialized record; a writer
+thread group-commits everything queued while the previous commit was running,
+so a burst of writes from many concurrent deals costs one fsync per batch
+instead of one per write. The latest record for each (deal, step) is the
+current value.
+"""
+
+import atexit
+import dataclasses
+import json
+import queue
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+from rich import print as rprint
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS journal (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    deal_id TEXT NOT NULL,
+    step TEXT NOT NULL,
+    recorded_at REAL NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS journal_deal_step ON journal (deal_id, step, seq);
+"""
+
+
+def json_default(obj: Any) -> Any:
+    """
+    JSON fallback for SDK objects (payment proofs, integrity proofs, enums, ...)
+
+    Shared by the deal journal and the agents' history spill files; objects are
+    tagged with "__type__" so json_object_hook restores them with attribute access.
+    """
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {"__type__": type(obj).__name__, **{f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}}
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (bytes, bytearray)):
+        return obj.hex()
+    if isinstance(obj, (set, tuple)):
+        return list(obj)
+    if hasattr(obj, "__dict__"):
+        return {"__type__": type(obj).__name__, **{k: v for k, v in vars(obj).items() if not k.startswith("_")}}
+    return str(obj)
+
+
+class JournalRecord(dict):
+    """
+    Restored SDK object: a plain dict that also allows attribute access
+
+    Code written against the live objects (proof.amount, hasattr(proof, "proof_id"))
+    and code written against dict payloads (proof.get("proof_id")) both work on
+    values read back from the journal.
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
+def json_object_hook(data: Dict[str, Any]) -> Any:
+    """Restore encoded objects with both dict and attribute access"""
+    if "__type__" in data:
+        return JournalRecord((k, v) for k, v in data.items() if k != "__type__")
+    return data
+
+
+class DealJournal:
+    """Append-only, batch-committed SQLite journal keyed by deal id and step"""
+
+    def __init__(self, path: str = "genesis_journal.db", batch_size: int = 256, poll_interval: float = 0.5):
+        """
+        Initialize the journal
+
+        Args:
+            path: SQLite database file (":memory:" is not supported - the writer uses its own connection)
+            batch_size: Maximum records committed in one transaction
+            poll_interval: Seconds the idle writer waits before re-checking for work
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self._read_lock = threading.Lock()
+        self._reader = self._connect()
+        self._closed = False
+
+        # Observability counters
+        self.records_written = 0
+        self.commits = 0
+
+        self._writer = threading.Thread(target=self._write_loop, name="deal-journal", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def append(self, deal_id: str, step: str, value: Any):
+        """
+        Record a step result (serialized immediately, committed asynchronously)
+
+        Args:
+            deal_id: Deal the value belongs to
+            step: Step name (e.g. "0g_payment", "storage_analysis")
+            value: Any JSON-compatible value or SDK object
+        """
+        if self._closed:
+            raise RuntimeError("DealJournal is closed")
+        payload = json.dumps(value, default=json_default)
+        self._queue.put((str(deal_id), step, time.time(), payload))
+
+    def flush(self):
+        """Block until every record appended so far is committed"""
+        if self._closed:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+
+    def latest(self, deal_id: str) -> Dict[str, Any]:
+        """
+        Current value of every step recorded for a deal
+
+        Returns:
+            Step name -> most recently recorded value
+        """
+        self.flush()
+        with self._read_lock:
+            rows = self._reader.execute(
+                "SELECT step, payload FROM journal WHERE deal_id = ? ORDER BY seq", (str(deal_id),)
+            ).fetchall()
+        return {step: json.loads(payload, object_hook=json_object_hook) for step, payload in rows}
+
+    def get(self, deal_id: str, step: str, default: Any = None) -> Any:
+        """Most recently recorded value of one step (or default)"""
+        self.flush()
+        with self._read_lock:
+            row = self._reader.execute(
+                "SELECT payload FROM journal WHERE deal_id = ? AND step = ? ORDER BY seq DESC LIMIT 1",
+                (str(deal_id), step)
+            ).fetchone()
+        return json.loads(row[0], object_hook=json_object_hook) if row else default
+
+    def deal_ids(self) -> List[str]:
+        """Every deal with at least one journaled step, oldest first"""
+        self.flush()
+        with self._read_lock:
+            rows = self._reader.execute(
+                "SELECT deal_id FROM journal GROUP BY deal_id ORDER BY MIN(seq)"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def close(self):
+        """Commit outstanding records and stop the writer thread"""
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        self._queue.put(None)
+        self._writer.join(timeout=5)
+        with self._read_lock:
+            self._reader.close()
+
+    # === Internal helpers ===
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        # FULL in WAL mode fsyncs once per commit, i.e. once per batch
+        conn.execute("PRAGMA synchronous=FULL")
+        return conn
+
+    def _write_loop(self):
+        """Drain the queue, committing records in batches"""
+        conn = self._connect()
+        stop = False
+
+        while not stop:
+            batch = []
+            waiters = []
+            try:
+                item = self._queue.get(timeout=self.poll_interval)
+            except queue.Empty:
+                continue
+
+            # Collect whatever else is already queued, up to one batch
+            while True:
+                if item is None:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    batch.append(item)
+                if stop or len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if batch:
+                try:
+                    with conn:
+                        conn.executemany(
+                            "INSERT INTO journal (deal_id, step, recorded_at, payload) VALUES (?, ?, ?, ?)", batch
+                        )
+                    self.records_written += len(batch)
+                    self.commits += 1
+                except sqlite3.Error as e:
+                    rprint(f"[red]❌ Deal journal commit failed ({len(batch)} records lost): {e}[/red]")
+
+            for waiter in waiters:
+                waiter.set()
+
+        conn.close()
+
+
+class JournaledResults(dict):
+    """A deal's results dict that journals every top-level assignment"""
+
+    def __init__(self, journal: DealJournal, deal_id: str, initial: Optional[Dict[str, Any]] = None):
+        super().__init__()
+        self.journal = journal
+        self.deal_id = deal_id
+        self.update(initial or {})
+
+    def __setitem__(self, step: str, value: Any):
+        super().__setitem__(step, value)
+        self.journal.append(self.deal_id, step, value)
+
+    def update(self, *args, **kwargs):
+        for step, value in dict(*args, **kwargs).items():
+            self[step] = value
+
+    def restore(self, values: Dict[str, Any]):
+        """Load previously journaled values without recording them again"""
+        super().update(values)
@@ -0,0 +1,101 @@
+"""
+Genesis Studio - Bulk ERC-8004 Agent Registration
+
+Registers many agents on the ERC-8004 IdentityRegistry at once through the
+SDK's public register_identity (the SDK handles the existing-registration
+check, nonce, signing, receipt and Registered event). Registrations from
+different wallets run concurrently; registrations that share a sender wallet
+run one after another, because the SDK reads the wallet's nonce when it builds
+each transaction and two in-flight transactions from one wallet would collide.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional
+
+from rich import print as rprint
+
+# tx_hash the SDK returns for a wallet that already owns an agent NFT
+ALREADY_REGISTERED = "already_registered"
+
+
+class BulkRegistrar:
+    """Runs ERC-8004 IdentityRegistry registrations for many agents concurrently"""
+
+    def __init__(self, max_workers: int = 16):
+        """
+        Initialize the bulk registrar
+
+        Args:
+            max_workers: Maximum concurrent registrations
+        """
+        self.max_workers = max_workers
+
+    def register_all(self, sdks: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Register every agent that is not registered yet
+
+        Args:
+            sdks: Agent name -> ChaosChainAgentSDK
+
+        Returns:
+            Agent name -> record with status ("registered", "already_registered" or
+            "failed"), agent_id, tx_hash, address, latency_seconds and error
+        """
+        if not sdks:
+            return {}
+
+        started = {name: time.perf_counter() for name in sdks}
+        records: Dict[str, Dict[str, Any]] = {}
+
+        # One queue per sender wallet: register_identity waits for its receipt, so the
+        # next registration from the same wallet reads the already-advanced nonce
+        by_wallet: Dict[str, List[str]] = {}
+        for name, sdk in sdks.items():
+            by_wallet.setdefault(str(sdk.wallet_address).lower(), []).append(name)
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(by_wallet)), thread_name_prefix="erc8004-register") as pool:
+            futures = [pool.submit(self._register_wallet, names, sdks, started) for names in by_wallet.values()]
+            for future in as_completed(futures):
+                records.update(future.result())
+
+        # Cache new IDs one at a time - the SDK's agent ID cache file is not lock-protected
+        for name, record in records.items():
+            if record["status"] == "registered" and record["agent_id"] is not None:
+                try:
+                    sdks[name].chaos_agent.set_cached_agent_id(record["agent_id"])
+                except Exception as e:
+                    rprint(f"[yellow]⚠️  Could not cache agent ID for {name}: {e}[/yellow]")
+
+        return {name: records[name] for name in sdks}
+
+    # === Internal helpers ===
+
+    def _register_wallet(self, names: List[str], sdks: Dict[str, Any],
+                         started: Dict[str, float]) -> Dict[str, Dict[str, Any]]:
+        """Register the agents that share one sender wallet, one after another"""
+        records = {}
+        for name in names:
+            address = sdks[name].wallet_address
+            try:
+                agent_id, tx_hash = sdks[name].register_identity()
+            except Exception as e:
+                records[name] = self._record(name, address, "failed", started, error=str(e))
+                continue
+            status = "already_registered" if tx_hash == ALREADY_REGISTERED else "registered"
+            records[name] = self._record(name, address, status, started, agent_id=agent_id, tx_hash=tx_hash)
+        return records
+
+    @staticmethod
+    def _record(name: str, address: str, status: str, started: Dict[str, float],
+                agent_id: Optional[int] = None, tx_hash: Optional[str] = None,
+                error: Optional[str] = None) -> Dict[str, Any]:
+        """Build the per-agent result record"""
+        return {
+            "status": status,
+            "agent_id": agent_id,
+            "tx_hash": tx_hash,
+            "address": address,
+            "latency_seconds": round(time.perf_counter() - started[name], 3),
+            "error": error
+        }
@@ -0,0 +1,122 @@
+"""
+Genesis Studio - Dependency-Graph Step Scheduler
+
+Expresses a deal's pipeline as a DAG of steps with declared inputs and outputs.
+The scheduler starts every step as soon as all of its inputs are available, so
+independent steps (e.g. 0G Storage upload, A0GI payment and 0G Compute
+validation) overlap instead of running back-to-back. Steps whose outputs are
+already known (e.g. restored from a checkpoint) are skipped.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+@dataclass
+class Step:
+    """A unit of work in a StepGraph
+
+    The callable receives one keyword argument per declared input. With a single
+    output its return value is stored under that name; with several outputs it
+    must return a tuple in the same order.
+    """
+    name: str
+    fn: Callable[..., Any]
+    inputs: Tuple[str, ...] = ()
+    outputs: Tuple[str, ...] = ()
+
+
+class StepGraph:
+    """Runs a DAG of steps, starting each one as soon as its inputs are ready"""
+
+    def __init__(self, steps: List[Step], on_complete: Optional[Callable[[str, Dict[str, Any]], None]] = None):
+        """
+        Initialize the step graph
+
+        Args:
+            steps: Steps making up the graph (order does not matter)
+            on_complete: Called with (step name, {output: value}) as each step finishes, before its dependents start
+        """
+        names = [step.name for step in steps]
+        if len(names) != len(set(names)):
+            raise ValueError("Step names must be unique")
+
+        producers: Dict[str, str] = {}
+        for step in steps:
+            for output in step.outputs:
+                if output in producers:
+                    raise ValueError(f"Output '{output}' produced by both '{producers[output]}' and '{step.name}'")
+                producers[output] = step.name
+
+        self.steps = steps
+        self.producers = producers
+        self.on_complete = on_complete
+
+        # Wall-clock seconds per step from the last run, and steps skipped because their outputs were given
+        self.timings: Dict[str, float] = {}
+        self.skipped: List[str] = []
+
+    async def run(self, initial: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Execute the graph
+
+        Args:
+            initial: Values available before any step runs (steps producing only these are skipped)
+
+        Returns:
+            Dict of every value produced (including the initial ones)
+        """
+        values: Dict[str, Any] = dict(initial or {})
+        self.skipped = [step.name for step in self.steps if step.outputs and all(name in values for name in step.outputs)]
+        pending = {step.name: step for step in self.steps if step.name not in self.skipped}
+        running: Dict[asyncio.Task, Step] = {}
+        self.timings = {}
+
+        try:
+            while pending or running:
+                ready = [step for step in pending.values() if all(name in values for name in step.inputs)]
+                for step in ready:
+                    del pending[step.name]
+                    task = asyncio.create_task(self._run_step(step, values))
+                    running[task] = step
+
+                if not running:
+                    blocked = {step.name: [name for name in step.inputs if name not in values] for step in pending.values()}
+                    raise ValueError(f"Steps can never run, missing inputs: {blocked}")
+
+                done, _ = await asyncio.wait(running.keys(), return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    step = running.pop(task)
+                    self._store_outputs(step, task.result(), values)
+                    if self.on_complete:
+                        self.on_complete(step.name, {name: values[name] for name in step.outputs})
+        finally:
+            for task in running:
+                task.cancel()
+
+        return values
+
+    async def _run_step(self, step: Step, values: Dict[str, Any]) -> Any:
+        """Run one step (sync callables run on a worker thread)"""
+        kwargs = {name: values[name] for name in step.inputs}
+        started = time.perf_counter()
+        try:
+            if asyncio.iscoroutinefunction(step.fn):
+                return await step.fn(**kwargs)
+            return await asyncio.to_thread(step.fn, **kwargs)
+        finally:
+            self.timings[step.name] = round(time.perf_counter() - started, 3)
+
+    @staticmethod
+    def _store_outputs(step: Step, result: Any, values: Dict[str, Any]):
+        """Map a step's return value onto its declared outputs"""
+        if not step.outputs:
+            return
+        if len(step.outputs) == 1:
+            values[step.outputs[0]] = result
+            return
+        if not isinstance(result, tuple) or len(result) != len(step.outputs):
+            raise ValueError(f"Step '{step.name}' must return a tuple of {len(step.outputs)} values")
+        values.update(zip(step.outputs, result))
@@ -0,0 +1,125 @@
+"""
+Genesis Studio - Batched Wallet Readiness Probe
+
+Fetches balances and nonces for many agent wallets in a single JSON-RPC batch
+request instead of one round trip per wallet, and caches the results for a
+short TTL so repeated pre-flight checks (orchestrator startup, demos) reuse them.
+"""
+
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import requests
+from rich import print as rprint
+
+WEI_PER_ETHER = 10 ** 18
+
+
+class WalletProbe:
+    """Batched eth_getBalance / eth_getTransactionCount probe with a TTL cache"""
+
+    def __init__(self, w3: Any, ttl: float = 15.0, timeout: float = 10.0, rpc_url: Optional[str] = None):
+        """
+        Initialize the wallet probe
+
+        Args:
+            w3: Web3 instance (used for its RPC endpoint and as per-call fallback)
+            ttl: Seconds a probed wallet status stays valid
+            timeout: HTTP timeout for the batch request (seconds)
+            rpc_url: Explicit JSON-RPC endpoint (defaults to the Web3 provider's)
+        """
+        self.w3 = w3
+        self.ttl = ttl
+        self.timeout = timeout
+        self.rpc_url = rpc_url or getattr(getattr(w3, "provider", None), "endpoint_uri", None)
+
+        self._cache: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+        # Observability counters
+        self.batch_requests = 0
+        self.cache_hits = 0
+
+    def probe(self, wallets: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get balance and nonce for every wallet, batching all uncached lookups
+
+        Args:
+            wallets: Wallet label (e.g. agent name) -> address
+
+        Returns:
+            Label -> {address, balance (native token), nonce, probed_at, error}
+        """
+        now = time.monotonic()
+        with self._lock:
+            stale = sorted({address for address in wallets.values()
+                            if address not in self._cache or now - self._cache[address]["probed_at"] >= self.ttl})
+            self.cache_hits += len(set(wallets.values())) - len(stale)
+
+        if stale:
+            fresh = self._fetch(stale)
+            with self._lock:
+                self._cache.update(fresh)
+
+        with self._lock:
+            return {label: dict(self._cache[address]) for label, address in wallets.items()}
+
+    def invalidate(self, address: Optional[str] = None):
+        """Drop one cached wallet (e.g. after funding it) or the whole cache"""
+        with self._lock:
+            if address is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(address, None)
+
+    # === Internal helpers ===
+
+    def _fetch(self, addresses: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch statuses in one JSON-RPC batch, falling back to individual calls"""
+        if self.rpc_url and self.rpc_url.startswith("http"):
+            try:
+                return self._fetch_batch(addresses)
+            except Exception as e:
+                rprint(f"[yellow]⚠️  Batched wallet probe failed ({e}), falling back to individual RPC calls[/yellow]")
+        return {address: self._fetch_single(address) for address in addresses}
+
+    def _fetch_batch(self, addresses: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Send eth_getBalance and eth_getTransactionCount for all addresses in one request"""
+        payload = []
+        for index, address in enumerate(addresses):
+            payload.append({"jsonrpc": "2.0", "id": 2 * index, "method": "eth_getBalance", "params": [address, "latest"]})
+            payload.append({"jsonrpc": "2.0", "id": 2 * index + 1, "method": "eth_getTransactionCount", "params": [address, "pending"]})
+
+        self.batch_requests += 1
+        response = requests.post(self.rpc_url, json=payload, timeout=self.timeout)
+        response.raise_for_status()
+        replies = response.json()
+        if not isinstance(replies, list):
+            raise ValueError(f"RPC endpoint does not support batch requests: {replies}")
+        by_id = {reply.get("id"): reply for reply in replies}
+
+        probed_at = time.monotonic()
+        statuses = {}
+        for index, address in enumerate(addresses):
+            balance_reply = by_id.get(2 * index, {})
+            nonce_reply = by_id.get(2 * index + 1, {})
+            error = balance_reply.get("error") or nonce_reply.get("error")
+            statuses[address] = {
+                "address": address,
+                "balance": int(balance_reply["result"], 16) / WEI_PER_ETHER if "result" in balance_reply else None,
+                "nonce": int(nonce_reply["result"], 16) if "result" in nonce_reply else None,
+                "probed_at": probed_at,
+                "error": str(error) if error else None
+            }
+        return statuses
+
+    def _fetch_single(self, address: str) -> Dict[str, Any]:
+        """Look up one wallet with regular Web3 calls"""
+        try:
+            balance = self.w3.eth.get_balance(address) / WEI_PER_ETHER
+            nonce = self.w3.eth.get_transaction_count(address, "pending")
+            error = None
+        except Exception as e:
+            balance, nonce, error = None, None, str(e)
+        return {"address": address, "balance": balance, "nonce": nonce, "probed_at": time.monotonic(), "error": error}